@@ -223,6 +223,24 @@ PARSER.add_argument(
     multithreading: mpi, multithreading, or serial. serial will override \
     number_of_processors and force it to be on a single processor.",
 )
+PARSER.add_argument(
+    "--mpi_dynamic_scheduling",
+    choices=[True, False, "True", "False", "true", "false"],
+    default=False,
+    help="Only used if multithread_mode is mpi. If True the first rank hands \
+    out small chunks of jobs to the other ranks as they finish their work \
+    instead of splitting the jobs into equal chunks up front. This keeps \
+    nodes from sitting idle when docking and conversion times vary widely.",
+)
+PARSER.add_argument(
+    "--streaming_pipeline",
+    choices=[True, False, "True", "False", "true", "false"],
+    default=False,
+    help="If True each ligand is converted to 3D, converted to the docking \
+    format and docked within a single job, instead of running each of those \
+    steps for the whole generation before starting the next. This keeps \
+    processors busy while the slowest ligands of a step finish.",
+)
 
 # Genetic Algorithm Options
 PARSER.add_argument(
@@ -273,6 +291,17 @@ PARSER.add_argument(
     default=2,
     help="Each gen diversity_mols_to_seed_first_generation will decrease this amount",
 )
+PARSER.add_argument(
+    "--diversity_sample_size",
+    type=int,
+    default=0,
+    help="If greater than 0 and smaller than the population being ranked, \
+    the diversity score of each ligand is approximated by comparing it to this \
+    many randomly chosen ligands of the population (scaled up to the size of \
+    the population) rather than to every other ligand. Comparing every pair \
+    takes time quadratic in the population size, so this is useful for \
+    populations of many thousands of ligands. Default is 0 (compare every pair).",
+)
 
 # Populations settings
 PARSER.add_argument(
@@ -417,6 +446,41 @@ PARSER.add_argument(
     Must be a list of lists \
     [[name_filter1, Path/to/name_filter1.py],[name_filter2, Path/to/name_filter2.py]]",
 )
+PARSER.add_argument(
+    "--filter_batch_size",
+    type=int,
+    default=0,
+    help="If greater than 0, large lists of ligands (ie. the source compounds) \
+    are filtered in chunks of this many ligands, one job per chunk, rather \
+    than one job per ligand. Within a chunk the descriptor threshold filters \
+    (ie. Lipinski and Ghose) are tested on the whole chunk at once with numpy \
+    and the substructure filters (ie. PAINS, BRENK and NIH) are only run on the \
+    ligands which passed them. The ligands which pass are the same either way. \
+    Default is 0 (one job per ligand).",
+)
+PARSER.add_argument(
+    "--filter_cache_size",
+    type=int,
+    default=100000,
+    help="The number of filter verdicts each process keeps in memory. The \
+    products of mutation and crossover are keyed by their canonical SMILES \
+    and the chosen filters, so a product which was already filtered is not \
+    sanitized and filtered again. The least recently used verdicts are \
+    dropped once this many are kept. Set to 0 to not keep verdicts in memory. \
+    Default is 100000.",
+)
+PARSER.add_argument(
+    "--use_filter_cache_file",
+    choices=[True, False, "True", "False", "true", "false"],
+    default=False,
+    help="If True, the filter verdicts of the products of mutation and \
+    crossover are also saved in a SQLite file (filter_verdict_cache.sqlite) \
+    in the Run folder, so they are shared by every process and kept between \
+    generations and restarts of the run. The file uses SQLite's WAL mode, so \
+    the Run folder must be on a local filesystem; do not use this with a Run \
+    folder on a network filesystem (ie. when running with MPI across nodes). \
+    Default is False.",
+)
 
 # dependency variables
 # DOCUMENT THE file conversion for docking inputs
@@ -503,6 +567,25 @@ PARSER.add_argument(
     See docking software for settings. Unless specified Autogrow uses the \
     docking softwares default setting. For AutoDock Vina 1.1.2 that is 9",
 )
+PARSER.add_argument(
+    "--use_docking_cache",
+    choices=[True, False, "True", "False", "true", "false"],
+    default=False,
+    help="If True the best pose and score of every docked ligand is saved in \
+    a cache keyed by its canonical SMILES, the receptor, the docking box and \
+    the docking settings. Ligands which were already docked in an earlier \
+    generation or run are restored from the cache instead of being converted \
+    and docked again. Only supported for VinaDocking and QuickVina2Docking.",
+)
+PARSER.add_argument(
+    "--docking_cache_directory",
+    metavar="docking_cache_directory",
+    default="",
+    help="Only used if use_docking_cache is True. The folder to save the \
+    docking cache in. Defaults to a docking_cache folder within the \
+    root_output_folder. Point several runs at the same folder to share \
+    their docking results.",
+)
 PARSER.add_argument(
     "--docking_timeout_limit",
     type=float,
@@ -514,7 +597,9 @@ PARSER.add_argument(
     The default docking_timeout_limit is 120 seconds, which is excess for most \
     docking events using QuickVina2Docking under default settings. If run with \
     more exhaustive settings or with highly flexible ligands, consider increasing \
-    docking_timeout_limit to accommodate. Default docking_timeout_limit is 120 seconds",
+    docking_timeout_limit to accommodate. Default docking_timeout_limit is 120 seconds. \
+    This also limits each NN1/NN2 rescoring run when the NNScore script is run \
+    as a separate program.",
 )
 PARSER.add_argument(
     "--custom_docking_script",
@@ -537,6 +622,17 @@ PARSER.add_argument(
     scoring function. If Custom scoring function, confirm it selects properly, \
     Autogrow is largely set to select for a more negative score.",
 )
+PARSER.add_argument(
+    "--nn2_vina_terms",
+    metavar="nn2_vina_terms",
+    choices=["VinaScoreOnly", "PythonVinaTerms"],
+    default="VinaScoreOnly",
+    help="Only used if scoring_choice is NN2. How NNScore 2.0 gets the Vina \
+    affinity and terms of each pose it rescores. VinaScoreOnly runs \
+    vina --score_only on every pose. PythonVinaTerms calculates the same \
+    Vina 1.1.2 terms in python against a receptor which is loaded once, \
+    avoiding starting a vina process for every pose.",
+)
 PARSER.add_argument(
     "--rescore_lig_efficiency",
     action="store_true",
@@ -630,6 +726,35 @@ PARSER.add_argument(
     help="Make a line plot of the simulation at the end of the run.",
 )
 
+# Record the run in a SQLite database in the Run folder.
+PARSER.add_argument(
+    "--use_run_database",
+    choices=[True, False, "True", "False", "true", "false"],
+    default=False,
+    help="If True, every generation is also recorded in a SQLite database \
+    (run_database.sqlite) in the Run folder as it runs. It holds each \
+    ligand's SMILES, ID, parents, origin (mutation reaction or crossover), \
+    the stage it reached or failed at, its scores and the time each stage of \
+    the generation took. The ranking of pass through ligands and the \
+    plotting query it rather than reading the ranked .smi files, and a \
+    restarted run uses it to find the last completed generation. The \
+    per-ligand files are still written. Default is False.",
+)
+
+# Resume a generation which was interrupted instead of remaking it.
+PARSER.add_argument(
+    "--resume_partial_generation",
+    choices=[True, False, "True", "False", "true", "false"],
+    default=False,
+    help="If True and the last generation of the Run folder failed to \
+    complete (ie. the job was killed while docking), that generation is \
+    resumed instead of being renamed to generation_N_FAILED_0 and remade. \
+    The mutants, crossovers and elite ligands already chosen in its \
+    SeedFolder are reused and ligands which were already converted to 3D, \
+    converted to PDBQT or docked (with a .pdbqt.vina file) are skipped. \
+    Default is False.",
+)
+
 # mpi mode pre-Run so there are python cache files without EOF Errors
 PARSER.add_argument(
     "--cache_prerun",
@@ -9,10 +9,12 @@ import os
 import glob
 import sys
 import shutil
+import time
 
 import autogrow.docking.execute_docking as DockingClass
 import autogrow.operators.operations as operations
 import autogrow.docking.concatenate_files as concatenate_files
+import autogrow.run_database as RunDatabase
 
 def main_execute(vars):
     """
@@ -29,7 +31,7 @@ def main_execute(vars):
     num_gens_to_make = vars["num_generations"]
 
     # Determine what was the last completed generation in the Run directory
-    last_generation = determine_current_gen(output_directory)
+    last_generation = determine_current_gen(output_directory, vars["resume_partial_generation"], vars["use_run_database"])
     if last_generation is None:
         # Check to see if there's a Run 0 based on the seed.
         if vars["use_docked_source_compounds"] is True:
@@ -58,6 +60,10 @@ def main_execute(vars):
     # 3)  Ranking the generation based on the Docking scores
     for current_generation_number in range(starting_generation_num, num_gens_to_make+1):
         sys.stdout.flush()
+        generation_start_time = time.time()
+        # The number of seconds each stage of the generation took, for the
+        # run database
+        stage_timings = {}
 
         # Get directory for smi to go
         current_generation_dir = vars["output_directory"] + "generation_{}{}".format(current_generation_number, os.sep)
@@ -68,19 +74,31 @@ def main_execute(vars):
             if os.path.exists(current_generation_dir + os.sep + "generation_0_ranked.smi") is True:
                 continue
 
+            if vars["use_run_database"] is True:
+                RunDatabase.start_generation(vars, current_generation_number)
             already_docked, smile_file_new_gen, new_gen_ligands_list = operations.populate_generation_zero(vars, generation_num=0)
+            stage_timings["populate"] = time.time() - generation_start_time
+            if vars["use_run_database"] is True:
+                RunDatabase.record_populated_ligands(vars, current_generation_number, new_gen_ligands_list, stage_timings["populate"])
             sys.stdout.flush()
 
             if already_docked is False:
                 # Run file conversions of PDB to docking specific file type
                 # and Begin Docking unweighted_ranked_smile_file is the file
                 # name where the unweighted ranked but score .smi file resides
+                docking_start_time = time.time()
                 unweighted_ranked_smile_file = DockingClass.run_docking_common(
                     vars, current_generation_number,
                     current_generation_dir, smile_file_new_gen)
+                stage_timings["docking"] = time.time() - docking_start_time
 
         else:
+            if vars["use_run_database"] is True:
+                RunDatabase.start_generation(vars, current_generation_number)
             smile_file_new_gen, new_gen_ligands_list = operations.populate_generation(vars, current_generation_number)
+            stage_timings["populate"] = time.time() - generation_start_time
+            if vars["use_run_database"] is True and new_gen_ligands_list is not None:
+                RunDatabase.record_populated_ligands(vars, current_generation_number, new_gen_ligands_list, stage_timings["populate"])
             sys.stdout.flush()
 
             if new_gen_ligands_list is None:
@@ -92,7 +110,9 @@ def main_execute(vars):
             # Run file conversions of PDB to docking specific file type and
             # Begin Docking unweighted_ranked_smile_file is the file name
             # where the unweighted ranked but score .smi file resides
+            docking_start_time = time.time()
             unweighted_ranked_smile_file = DockingClass.run_docking_common(vars, current_generation_number, current_generation_dir, smile_file_new_gen)
+            stage_timings["docking"] = time.time() - docking_start_time
 
         # Delete all temporary files; Skip if in Debugging Mode
         if vars["debug_mode"] is False:
@@ -120,6 +140,11 @@ def main_execute(vars):
                 concatenate_files.run_concatenation(vars["parallelizer"], pdbs_folder)
             else:
                 print("\nNo PDB folder to concatenate and compress. This is likely generation 0 seeded with a Ranked .smi file.\n")
+        if vars["use_run_database"] is True:
+            stage_timings["generation"] = time.time() - generation_start_time
+            ranked_file = current_generation_dir + "generation_{}_ranked.smi".format(current_generation_number)
+            RunDatabase.record_generation(vars, current_generation_number, new_gen_ligands_list, ranked_file, stage_timings)
+
         print("")
         print("Finished generation ", current_generation_number)
 
@@ -142,7 +167,8 @@ def main_execute(vars):
     sys.stdout.flush()
 #
 
-def determine_current_gen(output_directory):
+def determine_current_gen(output_directory, resume_partial_generation=False,
+                          use_run_database=False):
     """
     Check if there has been any previous runs in the output directory. Returns
     an integer of the last completed generation folder. The last completed
@@ -164,9 +190,23 @@ def determine_current_gen(output_directory):
     -if Path/generation_3_Failed_0 already exists it will be name
     Path/generation_3_Failed_1 or so on until unique
 
+    If resume_partial_generation is True the failed generation directory is
+    kept instead, so the next attempt can reuse the ligands it already made,
+    converted and docked.
+
+    If use_run_database is True and the run database has a record of the
+    last generation, the generation only counts as completed if the database
+    recorded it as completed (and its ranked.smi file exists). A ranked.smi
+    file left by an attempt which crashed while it was being written is then
+    not mistaken for a completed generation.
+
     Inputs:
     :param str output_directory: is the path of the Run folder within root
         output folder.
+    :param bool resume_partial_generation: if True keep the directory of a
+        generation which failed to complete so it can be resumed
+    :param bool use_run_database: if True use the run database's record of
+        each generation's stage
 
     Returns:
     :returns: int last_gen_number: the int of the last generation number or
@@ -191,6 +231,11 @@ def determine_current_gen(output_directory):
         folder_path = "{}{}".format(folder_path_gen, last_gen_number)
 
         is_completed = determine_if_gen_completed(folder_path, last_gen_number)
+        stage = None
+        if use_run_database is True:
+            stage = RunDatabase.get_generation_stage(output_directory, last_gen_number)
+            if stage is not None and stage != "completed":
+                is_completed = False
 
         if is_completed is True:
             # The last generation (last_gen_number) completed and we will
@@ -198,6 +243,17 @@ def determine_current_gen(output_directory):
             return last_gen_number
 
         # The last generation in the folder crashed before completing.
+        if resume_partial_generation is True:
+            # Keep the directory and continue from the generation before it
+            printout = "Generation {} in {} failed in the previous simulation.".format(last_gen_number, folder_path)
+            if stage is not None:
+                printout = printout + " The last stage it finished was: {}.".format(stage)
+            printout = printout + " Resuming it."
+            print(printout)
+            if last_gen_number == 0:
+                return None
+            return last_gen_number - 1
+
         # So we will rename the directory by appending _FAILED to the
         # folder name
 
@@ -0,0 +1,412 @@
+"""
+This script handles a content-addressed cache of docking results.
+
+Each entry is keyed by the canonical SMILES of a ligand and every setting
+which changes its docking result: the receptor PDBQT file, the docking box,
+the exhaustiveness, the number of modes and the docking program. An entry
+holds the best scoring docked pose (the .pdbqt.vina file) and the PDB file
+of the conformer which produced it, so a cached ligand can be restored into
+a generation's PDBs folder and scored exactly as if it had been docked.
+"""
+import __future__
+
+import os
+import glob
+import json
+import hashlib
+
+import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
+import autogrow.docking.scoring.execute_scoring_mol as Scoring
+import autogrow.operators.convert_files.conversion_to_3d as conversion_to_3d
+
+# Only the Vina-style docking programs write the .pdbqt.vina files which the
+# cache stores
+CACHEABLE_DOCK_CHOICES = ["VinaDocking", "QuickVina2Docking"]
+
+
+def is_docking_cache_used(vars):
+    """
+    Check if the docking cache is used for this run.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: bool use_docking_cache: True if --use_docking_cache is set and
+        the docking program writes .pdbqt.vina files
+    """
+
+    return (
+        vars["use_docking_cache"] is True
+        and vars["dock_choice"] in CACHEABLE_DOCK_CHOICES
+    )
+
+
+def get_docking_cache_directory(vars):
+    """
+    Get the path to the docking cache directory, creating it if needed. If
+    vars["docking_cache_directory"] is blank the cache is placed in the
+    root_output_folder so it is shared between every run in that folder.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: str cache_dir: the path to the docking cache directory
+    """
+
+    cache_dir = vars["docking_cache_directory"]
+    if cache_dir in ["", None]:
+        cache_dir = vars["root_output_folder"] + os.sep + "docking_cache"
+    cache_dir = os.path.abspath(cache_dir) + os.sep
+
+    if os.path.exists(cache_dir) is False:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    return cache_dir
+
+
+def hash_file(file_path):
+    """
+    Get the sha256 hash of the contents of a file.
+
+    Inputs:
+    :param str file_path: the path to the file to hash
+
+    Returns:
+    :returns: str hexdigest: the sha256 hash of the file
+    """
+
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1048576), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def get_docking_settings(vars, receptor_pdbqt_file):
+    """
+    Get all of the settings which change the result of docking a ligand.
+    These are combined with a ligand's canonical SMILES to make its cache key.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param str receptor_pdbqt_file: the path to the receptor pdbqt file
+
+    Returns:
+    :returns: dict docking_settings: the settings which change the result of
+        docking
+    """
+
+    docking_settings = {
+        "receptor_sha256": hash_file(receptor_pdbqt_file),
+        "dock_choice": vars["dock_choice"],
+        "docking_exhaustiveness": str(vars["docking_exhaustiveness"]),
+        "docking_num_modes": str(vars["docking_num_modes"]),
+    }
+    for key in ["center_x", "center_y", "center_z", "size_x", "size_y", "size_z"]:
+        docking_settings[key] = float(vars[key])
+
+    return docking_settings
+
+
+def make_cache_key(canonical_smiles, docking_settings):
+    """
+    Make the content-addressed key of a ligand's cache entry.
+
+    Inputs:
+    :param str canonical_smiles: the canonical SMILES of the ligand
+    :param dict docking_settings: the settings from get_docking_settings()
+
+    Returns:
+    :returns: str cache_key: the sha256 hash of the SMILES and settings
+    """
+
+    key_string = json.dumps([canonical_smiles, docking_settings], sort_keys=True)
+    return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+
+def get_cache_entry_path(cache_dir, cache_key):
+    """
+    Get the path of a cache entry. Entries are spread across subfolders
+    named by the first 2 characters of their key.
+
+    Inputs:
+    :param str cache_dir: the path to the docking cache directory
+    :param str cache_key: the key of the entry
+
+    Returns:
+    :returns: str entry_path: the path to the .json file of the entry
+    """
+
+    return "{}{}{}{}.json".format(cache_dir, cache_key[:2], os.sep, cache_key)
+
+
+def get_best_score_from_vina_file(vina_file):
+    """
+    Get the best (most negative) score from a .pdbqt.vina file.
+
+    Inputs:
+    :param str vina_file: the path to a .pdbqt.vina file
+
+    Returns:
+    :returns: float affinity: the best score or None if the file has no
+        poses
+    """
+
+    affinity = None
+    with open(vina_file, "r") as f:
+        for line in f.readlines():
+            if "REMARK VINA RESULT:" in line:
+                score = float(line.replace("REMARK VINA RESULT:", "").split()[0])
+                if affinity is None or score < affinity:
+                    affinity = score
+    return affinity
+
+
+def group_pdbs_by_ligand(pdb_dir):
+    """
+    Group the conformer PDB files in a folder by the short name of their
+    ligand.
+
+    Inputs:
+    :param str pdb_dir: the path to a generation's PDBs folder
+
+    Returns:
+    :returns: dict pdbs_by_ligand: a dictionary with the ligand short names
+        as keys and a list of their PDB file paths as items
+    """
+
+    pdbs_by_ligand = {}
+    for pdb_file in glob.glob(pdb_dir + "*.pdb"):
+        lig_short_name = os.path.basename(pdb_file).split("__")[0]
+        if lig_short_name not in pdbs_by_ligand.keys():
+            pdbs_by_ligand[lig_short_name] = []
+        pdbs_by_ligand[lig_short_name].append(pdb_file)
+
+    return pdbs_by_ligand
+
+
+def get_ligand_cache_keys(smile_file, lig_short_names, docking_settings):
+    """
+    Make the cache key of every ligand in a list.
+
+    Inputs:
+    :param str smile_file: the .smi file of the generation
+    :param list lig_short_names: the short names of the ligands
+    :param dict docking_settings: the settings from get_docking_settings()
+
+    Returns:
+    :returns: dict cache_keys: a dictionary with the ligand short names as
+        keys and a list of [canonical_smiles, cache_key] as items. Ligands
+        whose SMILES can not be read are left out.
+    """
+
+    smiles_dict = Scoring.make_dict_of_smiles(smile_file)
+
+    cache_keys = {}
+    for lig_short_name in lig_short_names:
+        if lig_short_name not in smiles_dict.keys():
+            continue
+        canonical_smiles = MOH.canonicalize_smiles(smiles_dict[lig_short_name][0])
+        if canonical_smiles is None:
+            continue
+        cache_keys[lig_short_name] = [
+            canonical_smiles,
+            make_cache_key(canonical_smiles, docking_settings),
+        ]
+
+    return cache_keys
+
+
+def restore_cached_ligands(vars, receptor_pdbqt_file, pdb_dir, smile_file,
+                           lig_short_names=None):
+    """
+    Restore the docking results of every ligand in a generation's PDBs
+    folder which is already in the docking cache.
+
+    For each cached ligand this writes LIGNAME__cached.pdb and
+    LIGNAME__cached.pdbqt.vina into the PDBs folder. Those ligands do not
+    need to be converted to PDBQT or docked.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param str receptor_pdbqt_file: the path to the receptor pdbqt file
+    :param str pdb_dir: the path to a generation's PDBs folder
+    :param str smile_file: the .smi file of the generation
+    :param list lig_short_names: the short names of the ligands to look up.
+        If None every ligand with a PDB file in pdb_dir is looked up. This
+        is used by the streaming pipeline, which looks ligands up before
+        their PDB files are made.
+
+    Returns:
+    :returns: list cached_pdbs: the paths of all the PDB files (conformers)
+        which belong to ligands restored from the cache. These should be
+        skipped when converting and docking.
+    """
+
+    cache_dir = get_docking_cache_directory(vars)
+    docking_settings = get_docking_settings(vars, receptor_pdbqt_file)
+
+    pdbs_by_ligand = group_pdbs_by_ligand(pdb_dir)
+    if lig_short_names is None:
+        lig_short_names = list(pdbs_by_ligand.keys())
+    cache_keys = get_ligand_cache_keys(smile_file, lig_short_names, docking_settings)
+
+    cached_pdbs = []
+    num_restored = 0
+    for lig_short_name in cache_keys.keys():
+        entry_path = get_cache_entry_path(cache_dir, cache_keys[lig_short_name][1])
+        if os.path.exists(entry_path) is False:
+            continue
+
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+        except:
+            # A damaged entry is treated as a cache miss
+            continue
+
+        cached_name = "{}{}__cached".format(pdb_dir, lig_short_name)
+        if (
+            os.path.exists(cached_name + ".pdb") is False
+            or os.path.exists(cached_name + ".pdbqt.vina") is False
+        ):
+            # Ligands restored before they were converted to 3D (see
+            # remove_cached_ligands_before_conversion) are already written
+            with open(cached_name + ".pdb", "w") as f:
+                f.write(entry["pdb"])
+            with open(cached_name + ".pdbqt.vina", "w") as f:
+                f.write(entry["pose"])
+
+        ligand_pdbs = pdbs_by_ligand.get(lig_short_name, [])
+        cached_pdbs.extend(ligand_pdbs)
+        if cached_name + ".pdb" not in ligand_pdbs:
+            cached_pdbs.append(cached_name + ".pdb")
+        num_restored = num_restored + 1
+
+    print("Restored {} ligands from the docking cache".format(num_restored))
+
+    return cached_pdbs
+
+
+def remove_cached_ligands_before_conversion(vars, gen_folder_path, smile_file,
+                                            ligands_to_convert):
+    """
+    Restore the ligands of a generation which are already in the docking
+    cache into its PDBs folder, and remove them from the ligands to convert
+    to 3D. This way a cached ligand isn't converted to 3D or to PDB at all.
+
+    The ligands are only looked up here for the staged pipeline. The jobs of
+    the streaming pipeline look each ligand up themselves before converting
+    it. The receptor is only converted to PDBQT when the first generation is
+    docked, so until then the ligands are looked up after they are converted
+    (see execute_docking.run_staged_conversion_and_docking).
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param str gen_folder_path: the path to the generation's folder
+    :param str smile_file: the .smi file of the whole generation
+    :param list ligands_to_convert: list of the [SMILES, name] lists of the
+        ligands to convert to 3D
+
+    Returns:
+    :returns: list ligands_to_convert: the ligands which are not in the
+        docking cache and still need to be converted to 3D
+    """
+
+    if is_docking_cache_used(vars) is False or vars["streaming_pipeline"] is True:
+        return ligands_to_convert
+
+    receptor_pdbqt_file = vars["filename_of_receptor"] + "qt"
+    if os.path.exists(receptor_pdbqt_file) is False or len(ligands_to_convert) == 0:
+        return ligands_to_convert
+
+    pdb_dir = gen_folder_path + "PDBs" + os.sep
+    if os.path.exists(pdb_dir) is False:
+        os.makedirs(pdb_dir, exist_ok=True)
+
+    lig_short_names = [
+        conversion_to_3d.get_short_ligand_name(ligand[1])
+        for ligand in ligands_to_convert
+    ]
+    cached_pdbs = restore_cached_ligands(
+        vars, receptor_pdbqt_file, pdb_dir, smile_file,
+        lig_short_names=lig_short_names
+    )
+    cached_ligands = set([os.path.basename(pdb).split("__")[0] for pdb in cached_pdbs])
+
+    return [
+        ligand for ligand, lig_short_name in zip(ligands_to_convert, lig_short_names)
+        if lig_short_name not in cached_ligands
+    ]
+
+
+def store_docked_ligands(vars, receptor_pdbqt_file, pdb_dir, smile_file,
+                         cached_pdbs):
+    """
+    Add the best pose of every newly docked ligand in a generation's PDBs
+    folder to the docking cache.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param str receptor_pdbqt_file: the path to the receptor pdbqt file
+    :param str pdb_dir: the path to a generation's PDBs folder
+    :param str smile_file: the .smi file of the generation
+    :param list cached_pdbs: the PDB files restored from the cache by
+        restore_cached_ligands(). These ligands are not stored again.
+    """
+
+    cache_dir = get_docking_cache_directory(vars)
+    docking_settings = get_docking_settings(vars, receptor_pdbqt_file)
+
+    # Find the best pose of every ligand which was docked
+    best_poses = {}
+    cached_pdbs = set(cached_pdbs)
+    for vina_file in glob.glob(pdb_dir + "*.pdbqt.vina"):
+        pdb_file = vina_file.replace(".pdbqt.vina", ".pdb")
+        if pdb_file in cached_pdbs or os.path.exists(pdb_file) is False:
+            continue
+
+        affinity = get_best_score_from_vina_file(vina_file)
+        if affinity is None:
+            continue
+
+        lig_short_name = os.path.basename(vina_file).split("__")[0]
+        if lig_short_name in best_poses.keys():
+            if best_poses[lig_short_name][0] <= affinity:
+                continue
+        best_poses[lig_short_name] = [affinity, vina_file, pdb_file]
+
+    cache_keys = get_ligand_cache_keys(
+        smile_file, list(best_poses.keys()), docking_settings
+    )
+
+    for lig_short_name in cache_keys.keys():
+        canonical_smiles, cache_key = cache_keys[lig_short_name]
+        affinity, vina_file, pdb_file = best_poses[lig_short_name]
+
+        with open(vina_file, "r") as f:
+            pose = f.read()
+        with open(pdb_file, "r") as f:
+            pdb = f.read()
+
+        entry = {
+            "smiles": canonical_smiles,
+            "score": affinity,
+            "docking_settings": docking_settings,
+            "pose": pose,
+            "pdb": pdb,
+        }
+
+        entry_path = get_cache_entry_path(cache_dir, cache_key)
+        entry_folder = os.path.dirname(entry_path)
+        if os.path.exists(entry_folder) is False:
+            os.makedirs(entry_folder, exist_ok=True)
+
+        # Write to a temporary file and move it into place so that a run
+        # reading the cache never sees a partially written entry
+        temp_entry_path = "{}.{}.tmp".format(entry_path, os.getpid())
+        with open(temp_entry_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(temp_entry_path, entry_path)
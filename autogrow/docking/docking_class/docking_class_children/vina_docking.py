@@ -8,7 +8,11 @@ import sys
 import glob
 
 import autogrow.docking.delete_failed_mol as Delete
+import autogrow.docking.execute_command as Execute
 import autogrow.docking.ranking.ranking_mol as Ranking
+import autogrow.docking.ranking.fingerprint_store as FingerprintStore
+import autogrow.docking.ranking.population_store as PopulationStore
+import autogrow.run_database as RunDatabase
 from autogrow.docking.docking_class.parent_dock_class import ParentDocking
 import autogrow.docking.scoring.execute_scoring_mol as Scoring
 
@@ -238,35 +242,23 @@ class VinaDocking(ParentDocking):
         :param str lig_pdbqt_filename: the ligand pdbqt filename
         """
         vars = self.vars
-        timeout_option = vars["timeout_vs_gtimeout"]
         docking_timeout_limit = vars["docking_timeout_limit"]
-        # do the docking of the ligand Run with a timeout_option limit.
-        # Default setting is 5 minutes. This is excessive as most things run
-        # within 30seconds This will prevent stalling out. timeout or gtimeout
-        torun = (
-            "{} {} {}".format(
-                timeout_option, docking_timeout_limit, vars["docking_executable"]
-            )
-            + " --center_x "
-            + str(vars["center_x"])
-            + " --center_y "
-            + str(vars["center_y"])
-            + " --center_z "
-            + str(vars["center_z"])
-            + " --size_x "
-            + str(vars["size_x"])
-            + " --size_y "
-            + str(vars["size_y"])
-            + " --size_z "
-            + str(vars["size_z"])
-            + " --receptor "
-            + self.receptor_pdbqt_file
-            + " --ligand "
-            + lig_pdbqt_filename
-            + " --out "
-            + lig_pdbqt_filename
-            + ".vina --cpu 1"
-        )
+        # do the docking of the ligand Run with a timeout limit. Default
+        # setting is 2 minutes. This is excessive as most things run within
+        # 30seconds This will prevent stalling out.
+        command_args = [
+            vars["docking_executable"],
+            "--center_x", str(vars["center_x"]),
+            "--center_y", str(vars["center_y"]),
+            "--center_z", str(vars["center_z"]),
+            "--size_x", str(vars["size_x"]),
+            "--size_y", str(vars["size_y"]),
+            "--size_z", str(vars["size_z"]),
+            "--receptor", self.receptor_pdbqt_file,
+            "--ligand", lig_pdbqt_filename,
+            "--out", lig_pdbqt_filename + ".vina",
+            "--cpu", "1",
+        ]
 
         # Add optional user variables additional variable
         if (
@@ -277,39 +269,37 @@ class VinaDocking(ParentDocking):
                     type(vars["docking_exhaustiveness"]) == int
                     or type(vars["docking_exhaustiveness"]) == float
             ):
-                torun = (
-                    torun
-                    + " --exhaustiveness "
-                    + str(int(vars["docking_exhaustiveness"]))
+                command_args.extend(
+                    ["--exhaustiveness", str(int(vars["docking_exhaustiveness"]))]
                 )
         if vars["docking_num_modes"] is not None and vars["docking_num_modes"] != "None":
             if (
                     type(vars["docking_num_modes"]) == int
                     or type(vars["docking_num_modes"]) == float
             ):
-                torun = torun + " --num_modes " + str(int(vars["docking_num_modes"]))
-
-        # Add output line MUST ALWAYS INCLUDE THIS LINE
-        torun = (
-            torun
-            + " >>"
-            + lig_pdbqt_filename
-            + "_docking_output.txt "
-            + " 2>>"
-            + lig_pdbqt_filename
-            + "_docking_output.txt"
-        )
+                command_args.extend(
+                    ["--num_modes", str(int(vars["docking_num_modes"]))]
+                )
+
+        # The docking output is only kept on disk in debug mode
+        output_file = None
+        if self.debug_mode is True:
+            output_file = lig_pdbqt_filename + "_docking_output.txt"
 
         print("\tDocking: {}".format(lig_pdbqt_filename))
-        results = self.execute_docking_vina(torun)
+        results = self.execute_docking_vina(
+            command_args, docking_timeout_limit, output_file
+        )
 
-        if results is None or results is None or results == 256:
+        if results is None or results != 0:
             made_changes = self.replace_atoms_not_handled_by_forcefield(
                 lig_pdbqt_filename
             )
             if made_changes is True:
-                results = self.execute_docking_vina(torun)
-                if results == 256 or results is None:
+                results = self.execute_docking_vina(
+                    command_args, docking_timeout_limit, output_file
+                )
+                if results is None or results != 0:
                     print(
                         "\nLigand failed to dock after corrections: {}\n".format(
                             lig_pdbqt_filename
@@ -386,23 +376,33 @@ class VinaDocking(ParentDocking):
             print(printout_info)
         return retry
 
-    def execute_docking_vina(self, command):
+    def execute_docking_vina(self, command_args, timeout=None,
+                             output_file=None):
         """
         Run a single docking execution command
 
         Inputs:
-        :param str command: string of command to run.
+        :param list command_args: the docking executable followed by its
+            arguments.
+        :param float timeout: the maximum number of seconds to let the
+            docking run. If None it runs until it finishes.
+        :param str output_file: if not None the output of the docking program
+            is written to this file.
 
         Returns:
-        :returns: int result: the exit output for the command. If its None of
-            256 it failed.
+        :returns: int result: the exit code of the command. If its None or
+            not 0 it failed.
         """
 
-        try:
-            result = os.system(command)
-        except:
-            result = None
-            print("Failed to execute: " + command)
+        result, output = Execute.run_command(
+            command_args, timeout=timeout, output_file=output_file
+        )
+        if result is not None and result != 0:
+            print(
+                "Docking exited with code {}: {}".format(
+                    result, output.strip().split("\n")[-1]
+                )
+            )
         return result
 
     def check_docked(self, pdb_file):
@@ -531,10 +531,6 @@ class VinaDocking(ParentDocking):
                         + "Check if output folder has been moved"
                     )
 
-                # Get the data for all ligands from previous generation ranked
-                # file
-                prev_gen_data_list = Ranking.get_usable_format(ranked_smi_file_prev_gen)
-
                 # Get the list of pass through ligands
                 current_gen_pass_through_smi = (
                     current_generation_dir
@@ -546,6 +542,28 @@ class VinaDocking(ParentDocking):
                     current_gen_pass_through_smi
                 )
 
+                if (
+                        self.vars["use_run_database"] is True
+                        and RunDatabase.is_generation_recorded(
+                            run_folder, int(prev_gen_num)
+                        ) is True
+                ):
+                    # Only look up the pass through ligands in the run
+                    # database rather than reading the whole ranked file
+                    prev_gen_data_list = RunDatabase.get_ranked_ligands(
+                        run_folder,
+                        int(prev_gen_num),
+                        [[lig[0], lig[1]] for lig in pass_through_list],
+                    )
+                else:
+                    # Get the data for the pass through ligands from the
+                    # previous generation's population store (or its ranked
+                    # file if the store is missing)
+                    prev_gen_data_list = Ranking.get_ranked_ligands(
+                        ranked_smi_file_prev_gen,
+                        [[lig[0], lig[1]] for lig in pass_through_list],
+                    )
+
                 # Convert lists to searchable Dictionaries.
                 prev_gen_data_dict = Ranking.convert_usable_list_to_lig_dict(
                     prev_gen_data_list
@@ -576,7 +594,11 @@ class VinaDocking(ParentDocking):
         # ligands in the group this adds on a float in the last column for the
         # sum of pairwise comparisons the lower the diversity score the more
         # unique a molecule is from the other mols in the same generation
-        smiles_list = Ranking.score_and_append_diversity_scores(smiles_list)
+        smiles_list = Ranking.score_and_append_diversity_scores(
+            smiles_list,
+            vars["diversity_sample_size"],
+            FingerprintStore.get_fingerprint_store(vars),
+        )
 
         # name for the output file
         output_ranked_smile_file = smile_file.replace(".smi", "") + "_ranked.smi"
@@ -589,4 +611,10 @@ class VinaDocking(ParentDocking):
                 output_line = "\t".join(str_ligand_info_list) + "\n"
                 output.write(output_line)
 
+        # Save a columnar copy of the ranked ligands which later steps can
+        # load without parsing the .smi file
+        PopulationStore.save_ranked_population(
+            output_ranked_smile_file, smiles_list, current_gen_int
+        )
+
         return output_ranked_smile_file
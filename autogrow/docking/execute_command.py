@@ -0,0 +1,122 @@
+"""
+This script runs external programs (ie. docking and rescoring executables)
+with subprocess. The timeout is enforced here rather than by wrapping the
+command in a bash timeout/gtimeout call, and the output of the program is
+captured in memory rather than being redirected to a file by the shell.
+"""
+import __future__
+
+import os
+import signal
+import subprocess
+
+
+def format_command_args(command_args):
+    """
+    Format a list of command line arguments for subprocess. Paths which were
+    wrapped in double quotes to make them shell safe (ie. Windows paths with
+    spaces) are unwrapped, as subprocess does not use a shell.
+
+    Inputs:
+    :param list command_args: the executable followed by its arguments
+
+    Returns:
+    :returns: list formatted_args: the arguments as unquoted strings
+    """
+
+    formatted_args = []
+    for arg in command_args:
+        arg = str(arg)
+        if len(arg) > 1 and arg[0] == '"' and arg[-1] == '"':
+            arg = arg[1:-1]
+        formatted_args.append(arg)
+
+    return formatted_args
+
+
+def kill_process(process):
+    """
+    Kill a process and every process it started. The process must have been
+    started in its own session so its process group only holds its children.
+
+    Inputs:
+    :param object process: the subprocess.Popen object to kill
+    """
+
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        # The process already finished
+        pass
+
+
+def run_command(command_args, timeout=None, output_file=None, merge_stderr=True):
+    """
+    Run an external program and wait for it to finish.
+
+    The program runs in its own process group so if it times out the program
+    and any processes it started are killed. stdout (and by default stderr)
+    is captured in memory.
+
+    Inputs:
+    :param list command_args: the executable followed by its arguments. ie.
+        ["vina", "--receptor", "rec.pdbqt", "--ligand", "lig.pdbqt"]
+    :param float timeout: the maximum number of seconds to let the program
+        run. If None it runs until it finishes.
+    :param str output_file: if not None the captured output is written to
+        this file after the program finishes.
+    :param bool merge_stderr: if True stderr is captured together with
+        stdout. If False only stdout is captured, and stderr goes to the
+        stderr of this process. Use False when output_file is parsed (ie.
+        rescoring output) so warnings can't end up in it.
+
+    Returns:
+    :returns: int returncode: the exit code of the program. This is None if
+        the program could not be started or if it timed out.
+    :returns: str output: the stdout of the program, combined with its stderr
+        if merge_stderr is True
+    """
+
+    command_args = format_command_args(command_args)
+    if timeout is not None:
+        timeout = float(timeout)
+
+    if merge_stderr is True:
+        stderr = subprocess.STDOUT
+    else:
+        stderr = None
+
+    try:
+        process = subprocess.Popen(
+            command_args,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            stdin=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except (OSError, ValueError) as e:
+        printout = "Failed to execute: {}\n{}".format(" ".join(command_args), e)
+        print(printout)
+        return None, printout
+
+    try:
+        output, _ = process.communicate(timeout=timeout)
+        returncode = process.returncode
+    except subprocess.TimeoutExpired:
+        kill_process(process)
+        output, _ = process.communicate()
+        returncode = None
+        print(
+            "Timed out after {} seconds: {}".format(timeout, " ".join(command_args))
+        )
+
+    output = output.decode("utf-8", errors="replace")
+
+    if output_file is not None:
+        with open(output_file, "w") as f:
+            f.write(output)
+
+    return returncode, output
@@ -4,6 +4,8 @@ This script handles the docking and file conversion for docking.
 import __future__
 
 import os
+import sys
+import time
 
 from autogrow.docking.docking_class.get_child_class import get_all_subclasses
 
@@ -14,6 +16,9 @@ from autogrow.docking.docking_class.parent_dock_class import ParentDocking
 
 from autogrow.docking.docking_class.docking_file_conversion import *
 from autogrow.docking.docking_class.parent_pdbqt_converter import ParentPDBQTConverter
+import autogrow.docking.docking_cache as docking_cache
+import autogrow.run_database as RunDatabase
+import autogrow.operators.convert_files.conversion_to_3d as conversion_to_3d
 # from autogrow.docking.docking_class.docking_file_conversion \
 #                           import convert_with_obabel, convert_with_mgltools
 
@@ -118,8 +123,129 @@ def run_docking_common(vars, current_gen_int, current_generation_dir,
         docking_executable = docking_object.get_docking_executable_file(temp_vars)
         vars["docking_executable"] = docking_executable
 
+    # Ligands which were docked in a previous generation or run with the same
+    # receptor and docking settings can be restored from the docking cache
+    # instead of being converted and docked again. Only the Vina-style
+    # docking programs write the .pdbqt.vina files which the cache stores.
+    use_docking_cache = docking_cache.is_docking_cache_used(vars)
+    # When resuming a generation which was interrupted, the ligands which
+    # already have a docked .pdbqt.vina file aren't converted or docked again
+    resume_docking = vars["resume_partial_generation"] is True and dock_choice in [
+        "VinaDocking",
+        "QuickVina2Docking",
+    ]
+    convert_and_dock_start_time = time.time()
+    if vars["streaming_pipeline"] is True:
+        (
+            deleted_smiles_names_list_convert,
+            deleted_smiles_names_list_dock,
+            cached_pdbs,
+        ) = run_streaming_conversion_and_docking(
+            vars, docking_object, current_gen_int, current_generation_dir,
+            smile_file_new_gen, use_docking_cache, resume_docking
+        )
+    else:
+        (
+            deleted_smiles_names_list_convert,
+            deleted_smiles_names_list_dock,
+            cached_pdbs,
+        ) = run_staged_conversion_and_docking(
+            vars, docking_object, current_generation_dir, smile_file_new_gen,
+            use_docking_cache, resume_docking
+        )
+
+    if use_docking_cache is True:
+        docking_cache.store_docked_ligands(
+            vars, receptor + "qt", current_generation_pdb_dir,
+            smile_file_new_gen, cached_pdbs
+        )
+
+    if vars["use_run_database"] is True:
+        RunDatabase.record_docked_ligands(
+            vars, current_gen_int, current_generation_pdb_dir,
+            deleted_smiles_names_list_convert, deleted_smiles_names_list_dock,
+            time.time() - convert_and_dock_start_time
+        )
+
+    print("####################")
+    deleted_smiles_names_list = (
+        deleted_smiles_names_list_convert + deleted_smiles_names_list_dock
+    )
+
+    if len(deleted_smiles_names_list) != 0:
+        print("")
+        print("THE FOLLOWING LIGANDS WHERE DELETED FOR FAILURE TO CONVERT OR DOCK:")
+        print(deleted_smiles_names_list)
+
+    print("#################### ")
+    print("")
+    print("Begin Ranking and Saving results")
+    unweighted_ranked_smile_file = docking_object.rank_and_save_output_smi(
+        vars,
+        current_generation_dir,
+        current_gen_int,
+        smile_file_new_gen,
+        deleted_smiles_names_list,
+    )
+    print("")
+    print("Completed Ranking and Saving results")
+    print("")
+
+    return unweighted_ranked_smile_file
+
+
+def run_staged_conversion_and_docking(vars, docking_object,
+                                      current_generation_dir,
+                                      smile_file_new_gen, use_docking_cache,
+                                      resume_docking=False):
+    """
+    Convert every PDB of a generation to the docking format and only then
+    dock every converted ligand. The 3D conversion has already been run for
+    the whole generation by conversion_to_3d.convert_to_3d().
+
+    Ligands in the docking cache were usually restored before the 3D
+    conversion (see docking_cache.remove_cached_ligands_before_conversion).
+    They are looked up again here to find their PDBs, and to catch ligands
+    which could only be looked up once the receptor was converted to PDBQT.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param object docking_object: the class for running the chosen docking
+        method
+    :param str current_generation_dir: the current generation directory to
+        find the subfolder with pdb files
+    :param str smile_file_new_gen: the name of the file containing the
+        molecules in the new population
+    :param bool use_docking_cache: if True restore already docked ligands from
+        the docking cache
+    :param bool resume_docking: if True skip the ligands which an earlier
+        attempt at this generation already converted or docked
+
+    Returns:
+    :returns: list deleted_smiles_names_list_convert: the names of ligands
+        which failed to convert to the docking format
+    :returns: list deleted_smiles_names_list_dock: the names of ligands which
+        failed to dock
+    :returns: list cached_pdbs: the PDB files restored from the docking cache
+    """
+
+    current_generation_pdb_dir = current_generation_dir + "PDBs" + os.sep
+
+    cached_pdbs = []
+    if use_docking_cache is True:
+        cached_pdbs = docking_cache.restore_cached_ligands(
+            vars, vars["filename_of_receptor"] + "qt",
+            current_generation_pdb_dir, smile_file_new_gen
+        )
+    cached_pdbs_set = set(cached_pdbs)
+
     # Find PDB's
     pdbs_in_folder = docking_object.find_pdb_ligands(current_generation_pdb_dir)
+    pdbs_in_folder = [pdb for pdb in pdbs_in_folder if pdb not in cached_pdbs_set]
+    if resume_docking is True:
+        pdbs_in_folder = [
+            pdb for pdb in pdbs_in_folder if is_ligand_converted(pdb) is False
+        ]
     job_input_convert_lig = tuple(
         [tuple([docking_object, pdb]) for pdb in pdbs_in_folder]
     )
@@ -143,6 +269,22 @@ def run_docking_common(vars, current_gen_int, current_generation_dir,
 
     # Docking the ligands which converted to PDBQT Find PDBQT's
     pdbqts_in_folder = docking_object.find_converted_ligands(current_generation_pdb_dir)
+    pdbqts_in_folder = [
+        pdbqt for pdbqt in pdbqts_in_folder
+        if pdbqt.replace(".pdbqt", ".pdb") not in cached_pdbs_set
+    ]
+    if resume_docking is True:
+        num_pdbqts = len(pdbqts_in_folder)
+        pdbqts_in_folder = [
+            pdbqt for pdbqt in pdbqts_in_folder
+            if is_ligand_docked(pdbqt) is False
+        ]
+        if num_pdbqts != len(pdbqts_in_folder):
+            print(
+                "{} ligands were already docked by an earlier attempt".format(
+                    num_pdbqts - len(pdbqts_in_folder)
+                )
+            )
 
     job_input_dock_lig = tuple(
         [tuple([docking_object, pdbqt]) for pdbqt in pdbqts_in_folder]
@@ -168,31 +310,231 @@ def run_docking_common(vars, current_gen_int, current_generation_dir,
         print("THE FOLLOWING LIGANDS WHICH FAILED TO DOCK:")
         print(deleted_smiles_names_list_dock)
 
-    print("####################")
-    deleted_smiles_names_list = (
-        deleted_smiles_names_list_convert + deleted_smiles_names_list_dock
+    return (
+        deleted_smiles_names_list_convert,
+        deleted_smiles_names_list_dock,
+        cached_pdbs,
     )
 
-    if len(deleted_smiles_names_list) != 0:
-        print("")
-        print("THE FOLLOWING LIGANDS WHERE DELETED FOR FAILURE TO CONVERT OR DOCK:")
-        print(deleted_smiles_names_list)
 
-    print("#################### ")
-    print("")
-    print("Begin Ranking and Saving results")
-    unweighted_ranked_smile_file = docking_object.rank_and_save_output_smi(
-        vars,
-        current_generation_dir,
-        current_gen_int,
-        smile_file_new_gen,
-        deleted_smiles_names_list,
+def run_streaming_conversion_and_docking(vars, docking_object, current_gen_int,
+                                         current_generation_dir,
+                                         smile_file_new_gen, use_docking_cache,
+                                         resume_docking=False):
+    """
+    Convert every ligand of a generation to 3D, convert it to the docking
+    format and dock it within a single job per ligand.
+
+    There are no barriers between the stages, so a ligand is docked as soon
+    as its own 3D structures exist and the workers convert some ligands while
+    docking others. This removes the time workers spend idle at the end of
+    each stage waiting for the slowest ligand.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param object docking_object: the class for running the chosen docking
+        method
+    :param int current_gen_int: the interger of the current generation indexed
+        to zero
+    :param str current_generation_dir: the current generation directory
+    :param str smile_file_new_gen: the name of the file containing the
+        molecules in the new population
+    :param bool use_docking_cache: if True restore already docked ligands from
+        the docking cache instead of converting and docking them
+    :param bool resume_docking: if True skip the ligands which an earlier
+        attempt at this generation already converted and docked
+
+    Returns:
+    :returns: list deleted_smiles_names_list_convert: the names of ligands
+        which failed to convert to the docking format
+    :returns: list deleted_smiles_names_list_dock: the names of ligands which
+        failed to dock
+    :returns: list cached_pdbs: the PDB files restored from the docking cache
+    """
+
+    current_generation_pdb_dir = current_generation_dir + "PDBs" + os.sep
+    if os.path.isdir(current_generation_pdb_dir) is False:
+        os.makedirs(current_generation_pdb_dir)
+
+    smiles_to_convert_file = current_generation_dir + "generation_{}_to_convert.smi".format(
+        current_gen_int
+    )
+    (
+        gypsum_output_folder_path,
+        gypsum_log_path,
+        list_of_gypsum_params,
+    ) = conversion_to_3d.prepare_gypsum_submission(
+        vars, smiles_to_convert_file, current_generation_dir
     )
-    print("")
-    print("Completed Ranking and Saving results")
-    print("")
 
-    return unweighted_ranked_smile_file
+    cached_pdbs = []
+    if use_docking_cache is True:
+        lig_short_names = [
+            gypsum_params["source"].split(os.sep)[-1].replace(".smi", "")
+            for gypsum_params in list_of_gypsum_params
+        ]
+        cached_pdbs = docking_cache.restore_cached_ligands(
+            vars, vars["filename_of_receptor"] + "qt",
+            current_generation_pdb_dir, smile_file_new_gen,
+            lig_short_names=lig_short_names
+        )
+        cached_ligands = set(
+            [os.path.basename(pdb).split("__")[0] for pdb in cached_pdbs]
+        )
+        list_of_gypsum_params = [
+            gypsum_params for gypsum_params in list_of_gypsum_params
+            if gypsum_params["source"].split(os.sep)[-1].replace(".smi", "")
+            not in cached_ligands
+        ]
+
+    docked_pdbs = []
+    if resume_docking is True:
+        # Every conformer of these ligands was docked by an earlier attempt
+        docked_pdbs_by_ligand = get_docked_pdbs_by_ligand(current_generation_pdb_dir)
+        list_of_gypsum_params = [
+            gypsum_params for gypsum_params in list_of_gypsum_params
+            if gypsum_params["source"].split(os.sep)[-1].replace(".smi", "")
+            not in docked_pdbs_by_ligand.keys()
+        ]
+        for lig_short_name in docked_pdbs_by_ligand.keys():
+            docked_pdbs.extend(docked_pdbs_by_ligand[lig_short_name])
+        if len(docked_pdbs_by_ligand.keys()) != 0:
+            print(
+                "{} ligands were already docked by an earlier attempt".format(
+                    len(docked_pdbs_by_ligand.keys())
+                )
+            )
+
+    job_input = tuple(
+        [
+            tuple(
+                [
+                    docking_object,
+                    gypsum_log_path,
+                    gypsum_params,
+                    vars["gypsum_timeout_limit"],
+                    current_generation_pdb_dir,
+                ]
+            )
+            for gypsum_params in list_of_gypsum_params
+        ]
+    )
+
+    print("####################")
+    print("Streaming 3D Conversion and Docking Begun")
+    sys.stdout.flush()
+    results = vars["parallelizer"].run(job_input, run_streaming_ligand_multithread)
+    sys.stdout.flush()
+    print("Streaming 3D Conversion and Docking Completed")
+    print("####################")
+
+    lig_failed_to_convert_3d = []
+    deleted_smiles_names_list_convert = []
+    deleted_smiles_names_list_dock = []
+    for result in results:
+        if result[0] is not None:
+            lig_failed_to_convert_3d.append(result[0])
+        deleted_smiles_names_list_convert.extend(result[1])
+        deleted_smiles_names_list_dock.extend(result[2])
+
+    if len(lig_failed_to_convert_3d) > 0:
+        print("The Following ligands Failed to convert in Gypsum")
+        print("Likely due to a Timeout")
+        print(list(set(lig_failed_to_convert_3d)))
+
+    if len(job_input) != 0 and len(lig_failed_to_convert_3d) == len(job_input) \
+            and len(cached_pdbs) == 0 and len(docked_pdbs) == 0:
+        printout = "\n\nNo ligands were converted to 3D. "
+        printout = printout + "This may be a problem with the Gypsum-DL "
+        printout = printout + "settings.\nPlease check that the `--gypsum_timeout_limit` "
+        printout = printout + "is appropriate relative to the `--gypsum_thoroughness` "
+        printout = printout + "and `--max_variants_per_compound` parameters.\n"
+        raise Exception(printout)
+
+    deleted_smiles_names_list_convert = list(set(deleted_smiles_names_list_convert))
+    if len(deleted_smiles_names_list_convert) != 0:
+        print("THE FOLLOWING LIGANDS WHICH FAILED TO CONVERT:")
+        print(deleted_smiles_names_list_convert)
+
+    deleted_smiles_names_list_dock = list(set(deleted_smiles_names_list_dock))
+    if len(deleted_smiles_names_list_dock) != 0:
+        print("THE FOLLOWING LIGANDS WHICH FAILED TO DOCK:")
+        print(deleted_smiles_names_list_dock)
+
+    return (
+        deleted_smiles_names_list_convert,
+        deleted_smiles_names_list_dock,
+        cached_pdbs,
+    )
+
+
+def is_ligand_converted(pdb_file):
+    """
+    Check if a ligand's PDB file was already converted to a PDBQT file.
+
+    Inputs:
+    :param str pdb_file: the path to the pdb of a molecule
+
+    Returns:
+    :returns: bool is_converted: True if the .pdbqt file exists and isn't
+        empty
+    """
+
+    pdbqt_file = pdb_file + "qt"
+    if os.path.exists(pdbqt_file) is False:
+        return False
+
+    return os.path.getsize(pdbqt_file) != 0
+
+
+def is_ligand_docked(pdbqt_file):
+    """
+    Check if a ligand's PDBQT file was already docked. A docking which was
+    interrupted may leave a .pdbqt.vina file without any poses, so the file
+    must have at least one scored pose.
+
+    Inputs:
+    :param str pdbqt_file: the path to the pdbqt of a molecule
+
+    Returns:
+    :returns: bool is_docked: True if the .pdbqt.vina file has a pose
+    """
+
+    vina_file = pdbqt_file + ".vina"
+    if os.path.exists(vina_file) is False:
+        return False
+
+    try:
+        affinity = docking_cache.get_best_score_from_vina_file(vina_file)
+    except ValueError:
+        return False
+
+    return affinity is not None
+
+
+def get_docked_pdbs_by_ligand(pdb_dir):
+    """
+    Get the ligands in a generation's PDBs folder which have every one of
+    their conformers docked.
+
+    Inputs:
+    :param str pdb_dir: the path to a generation's PDBs folder
+
+    Returns:
+    :returns: dict docked_pdbs_by_ligand: a dictionary with the short names
+        of the docked ligands as keys and a list of their PDB file paths as
+        items
+    """
+
+    pdbs_by_ligand = docking_cache.group_pdbs_by_ligand(pdb_dir)
+
+    docked_pdbs_by_ligand = {}
+    for lig_short_name in pdbs_by_ligand.keys():
+        pdb_files = pdbs_by_ligand[lig_short_name]
+        if all([is_ligand_docked(pdb + "qt") for pdb in pdb_files]) is True:
+            docked_pdbs_by_ligand[lig_short_name] = pdb_files
+
+    return docked_pdbs_by_ligand
 
 
 def lig_convert_multithread(docking_object, pdb):
@@ -232,3 +574,51 @@ def run_dock_multithread(docking_object, pdb):
     print("Attempt to Dock complete: ", pdb)
     failed_smiles_names = docking_object.run_dock(pdb)
     return failed_smiles_names
+
+
+def run_streaming_ligand_multithread(docking_object, gypsum_log_path,
+                                     gypsum_params, gypsum_timeout_limit,
+                                     pdb_subfolder_path):
+    """
+    Run the whole pipeline for a single ligand: convert it to 3D with Gypsum,
+    convert the 3D structures to PDBs, convert each PDB to the docking format
+    and dock it.
+
+    Inputs:
+    :param object docking_object: the class for running the chosen docking
+        method
+    :param str gypsum_log_path: a path to the folder to place the log files
+        produced when running gypsum.
+    :param dict gypsum_params: dictionary of params to be feed to Gypsum-DL to
+        convert to 3D sdf for a single ligand
+    :param int gypsum_timeout_limit: the maximum amount of time to run Gypsum
+        for the ligand
+    :param str pdb_subfolder_path: Path of the generation's PDBs folder
+
+    Returns:
+    :returns: list results: a list containing the name of the ligand if it
+        failed to convert to 3D (or None), a list of names which failed to
+        convert to the docking format and a list of names which failed to dock
+    """
+
+    lig_failed_to_convert_3d, pdb_files = conversion_to_3d.convert_single_ligand_to_pdbs(
+        gypsum_log_path, gypsum_params, gypsum_timeout_limit, pdb_subfolder_path
+    )
+
+    failed_to_convert = []
+    failed_to_dock = []
+    for pdb in pdb_files:
+        failed_smiles_name = lig_convert_multithread(docking_object, pdb)
+        if failed_smiles_name is not None:
+            failed_to_convert.append(failed_smiles_name)
+            continue
+
+        pdbqt = pdb + "qt"
+        if os.path.exists(pdbqt) is False:
+            continue
+
+        failed_smiles_name = run_dock_multithread(docking_object, pdbqt)
+        if failed_smiles_name is not None:
+            failed_to_dock.append(failed_smiles_name)
+
+    return [lig_failed_to_convert_3d, failed_to_convert, failed_to_dock]
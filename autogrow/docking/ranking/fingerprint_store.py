@@ -0,0 +1,288 @@
+"""
+This script handles a run-wide store of the Morgan fingerprints used to
+score the diversity of ligands.
+
+Ligands which pass through to the next generation (ie. elite ligands) are
+ranked again every generation. Rather than rebuilding their fingerprints
+each time, the fingerprint of every ligand is kept in memory and appended
+to a packed binary file with an index of where each fingerprint starts. The
+files are kept in the root_output_folder so a later run in the same folder
+(ie. one continuing an earlier run) reuses them too.
+
+Fingerprints are keyed by the canonical SMILES of the ligand, so the same
+molecule written two ways shares one fingerprint. Several runs in the same
+root_output_folder may use the store at once, so the files are locked while
+they are read and appended to.
+
+The fingerprints and canonical SMILES are specific to the RDKit version, so
+each RDKit version gets its own subfolder.
+"""
+import __future__
+
+import os
+
+import rdkit
+from rdkit import DataStructs
+
+# Disable the unnecessary RDKit warnings
+rdkit.RDLogger.DisableLog("rdApp.*")
+
+import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
+
+# fcntl is only available on Unix. Without it the store files aren't locked,
+# so only a single run should use a root_output_folder at a time.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# The FingerprintStore objects already made by this process, keyed by their
+# folder. This lets every generation of a run share the same store.
+FINGERPRINT_STORES = {}
+
+
+def lock_file(file_object, lock_type):
+    """
+    Lock or unlock an open store file, so runs sharing the store don't read
+    or write it while another run is appending to it. Does nothing if fcntl
+    is not available.
+
+    Inputs:
+    :param file file_object: an open file
+    :param str lock_type: "shared" to read, "exclusive" to write or "unlock"
+    """
+
+    if fcntl is None:
+        return
+
+    lock_flags = {
+        "shared": fcntl.LOCK_SH,
+        "exclusive": fcntl.LOCK_EX,
+        "unlock": fcntl.LOCK_UN,
+    }
+    fcntl.flock(file_object.fileno(), lock_flags[lock_type])
+
+
+class FingerprintStore(object):
+    """
+    Maps the canonical SMILES of ligands to their diversity fingerprints,
+    optionally backed by a packed binary file (fingerprints.bin) and an index
+    (fingerprints.idx) with a line of "SMILES<tab>offset<tab>length" for
+    each fingerprint.
+
+    Appends to the files are made while holding an exclusive lock on
+    fingerprints.bin, so the offset in each index line always points at the
+    bytes written with it.
+    """
+
+    def __init__(self, store_dir=None):
+        """
+        Initialize the store and read the index of an existing store folder.
+        The fingerprints themselves are only read when they are requested.
+
+        Inputs:
+        :param str store_dir: the folder to keep the store in. If None the
+            fingerprints are only kept in memory.
+        """
+
+        self.store_dir = store_dir
+        self.fingerprints = {}
+        # The SMILES strings fingerprints were looked up by which aren't
+        # canonical, mapped to their canonical SMILES
+        self.aliases = {}
+        self.index = {}
+
+        if self.store_dir is None:
+            return
+
+        if os.path.exists(self.store_dir) is False:
+            os.makedirs(self.store_dir, exist_ok=True)
+
+        self.bin_file = self.store_dir + os.sep + "fingerprints.bin"
+        self.idx_file = self.store_dir + os.sep + "fingerprints.idx"
+
+        # Open in append mode so a store made by another run at the same
+        # time isn't truncated
+        open(self.bin_file, "ab").close()
+        open(self.idx_file, "a").close()
+
+        # Entries past the end of the binary file are from an interrupted
+        # write and are ignored
+        with open(self.bin_file, "rb") as bin_f:
+            lock_file(bin_f, "shared")
+            try:
+                bin_size = os.path.getsize(self.bin_file)
+                with open(self.idx_file, "r") as f:
+                    lines = f.readlines()
+            finally:
+                lock_file(bin_f, "unlock")
+
+        for line in lines:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) != 3:
+                continue
+            try:
+                offset = int(parts[1])
+                length = int(parts[2])
+            except ValueError:
+                continue
+            if offset + length > bin_size:
+                continue
+            self.index[parts[0]] = [offset, length]
+
+    def __len__(self):
+        """
+        Returns:
+        :returns: int length: the number of ligands in the store
+        """
+
+        return len(set(self.canonical_keys()) | set(self.index.keys()))
+
+    def canonical_keys(self):
+        """
+        Returns:
+        :returns: list keys: the canonical SMILES of the fingerprints held in
+            memory, without the SMILES strings they were looked up by
+        """
+
+        return [
+            key for key in self.fingerprints.keys()
+            if key not in self.aliases.keys()
+        ]
+
+    def get_key(self, smiles):
+        """
+        Get the key a SMILES string is stored under.
+
+        Inputs:
+        :param str smiles: a SMILES string
+
+        Returns:
+        :returns: str key: the canonical SMILES of the SMILES string, or the
+            SMILES string itself if rdkit could not read it
+        """
+
+        if smiles in self.aliases.keys():
+            return self.aliases[smiles]
+
+        key = MOH.canonicalize_smiles(smiles)
+        if key is None:
+            key = smiles
+
+        return key
+
+    def get(self, smiles):
+        """
+        Get the fingerprint of a SMILES string. It is first looked up as it is
+        given, then by its canonical SMILES.
+
+        Inputs:
+        :param str smiles: a SMILES string
+
+        Returns:
+        :returns: rdkit.DataStructs.cDataStructs.UIntSparseIntVect fp: the
+            fingerprint of the SMILES string. None if it is not in the store.
+        """
+
+        if smiles in self.fingerprints.keys():
+            return self.fingerprints[smiles]
+
+        key = self.get_key(smiles)
+        if key in self.fingerprints.keys():
+            fp = self.fingerprints[key]
+        elif key in self.index.keys():
+            offset, length = self.index[key]
+            with open(self.bin_file, "rb") as f:
+                f.seek(offset)
+                fp = DataStructs.UIntSparseIntVect(f.read(length))
+            self.fingerprints[key] = fp
+        else:
+            return None
+
+        self.remember_alias(smiles, key, fp)
+
+        return fp
+
+    def remember_alias(self, smiles, key, fp):
+        """
+        Keep a fingerprint in memory under the SMILES string it was looked up
+        by as well as its canonical SMILES, so the next lookup by the same
+        string doesn't need to canonicalize it.
+
+        Inputs:
+        :param str smiles: a SMILES string
+        :param str key: the canonical SMILES of the SMILES string
+        :param rdkit.DataStructs.cDataStructs.UIntSparseIntVect fp: the
+            fingerprint of the SMILES string
+        """
+
+        if smiles == key:
+            return
+
+        self.aliases[smiles] = key
+        self.fingerprints[smiles] = fp
+
+    def add(self, smiles, fp):
+        """
+        Add the fingerprint of a SMILES string to the store, under its
+        canonical SMILES.
+
+        Inputs:
+        :param str smiles: a SMILES string
+        :param rdkit.DataStructs.cDataStructs.UIntSparseIntVect fp: the
+            fingerprint of the SMILES string
+        """
+
+        key = self.get_key(smiles)
+        self.fingerprints[key] = fp
+        self.remember_alias(smiles, key, fp)
+
+        if self.store_dir is None or key in self.index.keys():
+            return
+        # SMILES with tabs or newlines can't be written to the index
+        if "\t" in key or "\n" in key:
+            return
+
+        fp_binary = fp.ToBinary()
+        with open(self.bin_file, "ab") as bin_f:
+            # Hold the lock for both files, and take the offset under it, so
+            # another run can't append between taking the offset, writing
+            # the fingerprint and writing its index line
+            lock_file(bin_f, "exclusive")
+            try:
+                bin_f.seek(0, os.SEEK_END)
+                offset = bin_f.tell()
+                bin_f.write(fp_binary)
+                bin_f.flush()
+                with open(self.idx_file, "a") as f:
+                    f.write("{}\t{}\t{}\n".format(key, offset, len(fp_binary)))
+            finally:
+                lock_file(bin_f, "unlock")
+        self.index[key] = [offset, len(fp_binary)]
+
+
+def get_fingerprint_store(vars):
+    """
+    Get the fingerprint store of the run, making it if this is the first time
+    it is needed. It is kept in the fingerprint_store folder of the
+    root_output_folder.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: FingerprintStore fingerprint_store: the store of the run
+    """
+
+    store_dir = (
+        os.path.abspath(vars["root_output_folder"].replace('"', ""))
+        + os.sep
+        + "fingerprint_store"
+        + os.sep
+        + "rdkit_{}".format(rdkit.__version__)
+    )
+
+    if store_dir not in FINGERPRINT_STORES.keys():
+        FINGERPRINT_STORES[store_dir] = FingerprintStore(store_dir)
+
+    return FINGERPRINT_STORES[store_dir]
@@ -0,0 +1,386 @@
+"""
+This script handles a columnar copy of each generation's ranked .smi file.
+
+Every generation_N_ranked.smi file is read back (and string split) several
+times: to seed the next generation, to look up the scores of ligands passed
+through to the next generation and to plot the run. When a ranked .smi file
+is written a population store is now saved next to it, in a folder named
+generation_N_ranked_population. It holds:
+    - columns.npy: a numpy structured array with one record per ligand. It
+        has the typed columns score (the fitness metric, column -2 of the
+        .smi), diversity (column -1), generation and the position of the
+        ligand's fields (SMILES, ID, ...) in the string pool.
+    - fields.bin and fields_offsets.npy: a string pool of every text field
+        of the ranked .smi and the offset of each one.
+    - parents.bin and parents_offsets.npy: a string pool of the parent IDs
+        of each ligand.
+    - source.json: the size and modification time of the .smi file the store
+        was made with, so a .smi file which was changed afterwards is read
+        from the .smi file instead.
+
+The .npy files are memory-mapped when loaded, so getting the scores of a
+generation doesn't parse any text. The .smi files are still written as the
+human readable export of each generation.
+"""
+import __future__
+
+import os
+import json
+
+import numpy
+
+COLUMNS_DTYPE = numpy.dtype(
+    [
+        ("score", numpy.float64),
+        ("diversity", numpy.float64),
+        ("generation", numpy.int32),
+        ("first_field", numpy.int64),
+        ("num_fields", numpy.int32),
+    ]
+)
+# The strings of a string pool are separated by this, so a range of them can
+# be decoded and split in one go
+STRING_SEPARATOR = "\x00"
+
+
+def get_population_store_folder(ranked_smi_file):
+    """
+    Get the folder of the population store of a ranked .smi file.
+
+    Inputs:
+    :param str ranked_smi_file: the path to a generation_N_ranked.smi file
+
+    Returns:
+    :returns: str store_folder: the path to the population store folder
+    """
+
+    if ranked_smi_file.endswith(".smi"):
+        ranked_smi_file = ranked_smi_file[:-4]
+
+    return ranked_smi_file + "_population" + os.sep
+
+
+def get_parent_ids(lig_id):
+    """
+    Get the IDs of the parents of a ligand from its ID. AutoGrow names a
+    child ligand by putting the IDs of its parents in parentheses in front
+    of its own ID. ie. "(Gen_3_Mutant_37_747+ZINC51)Gen_4_Mutant_15_52" has
+    the parents "Gen_3_Mutant_37_747" and "ZINC51"
+
+    Inputs:
+    :param str lig_id: the full ID of a ligand
+
+    Returns:
+    :returns: str parents: the parent IDs separated by "+". "" if the ligand
+        has no parents (ie. a source compound)
+    """
+
+    if lig_id.startswith("(") is False or ")" not in lig_id:
+        return ""
+
+    return lig_id[1 : lig_id.rindex(")")]
+
+
+def get_float(value):
+    """
+    Convert a field of a ranked .smi file to a float.
+
+    Inputs:
+    :param str value: the text of the field
+
+    Returns:
+    :returns: float value: the value of the field. numpy.nan if it isn't
+        a number
+    """
+
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return numpy.nan
+
+
+def save_string_pool(file_prefix, strings):
+    """
+    Save a list of strings as a string pool: a .bin file of the utf-8
+    strings separated by STRING_SEPARATOR and an _offsets.npy file of where
+    each string starts. The last offset is where a string after the last
+    one would start.
+
+    Inputs:
+    :param str file_prefix: the path of the pool without its extension
+    :param list strings: the strings to save
+    """
+
+    encoded_strings = [x.encode("utf-8") for x in strings]
+    offsets = numpy.zeros(len(encoded_strings) + 1, dtype=numpy.int64)
+    if len(encoded_strings) != 0:
+        offsets[1:] = numpy.cumsum([len(x) + 1 for x in encoded_strings])
+
+    with open(file_prefix + ".bin", "wb") as f:
+        f.write(STRING_SEPARATOR.encode("utf-8").join(encoded_strings))
+    numpy.save(file_prefix + "_offsets.npy", offsets)
+
+
+class StringPool(object):
+    """
+    A memory-mapped string pool saved by save_string_pool().
+    """
+
+    def __init__(self, file_prefix):
+        """
+        Inputs:
+        :param str file_prefix: the path of the pool without its extension
+        """
+
+        self.offsets = numpy.load(file_prefix + "_offsets.npy", mmap_mode="r")
+        if os.path.getsize(file_prefix + ".bin") == 0:
+            self.data = numpy.zeros(0, dtype=numpy.uint8)
+        else:
+            self.data = numpy.memmap(file_prefix + ".bin", dtype=numpy.uint8, mode="r")
+
+    def __len__(self):
+        """
+        Returns:
+        :returns: int length: the number of strings in the pool
+        """
+
+        return len(self.offsets) - 1
+
+    def get_strings(self, first, last):
+        """
+        Get a range of strings from the pool.
+
+        Inputs:
+        :param int first: the index of the first string
+        :param int last: the index after the last string
+
+        Returns:
+        :returns: list strings: the decoded strings
+        """
+
+        if last <= first:
+            return []
+
+        start = int(self.offsets[first])
+        end = int(self.offsets[last]) - 1
+        text = bytes(self.data[start:end]).decode("utf-8")
+
+        return text.split(STRING_SEPARATOR)
+
+
+def save_ranked_population(ranked_smi_file, ligand_info_list, generation_num):
+    """
+    Save the population store of a ranked .smi file. This must be called
+    after the ranked .smi file has been written.
+
+    Inputs:
+    :param str ranked_smi_file: the path to the generation_N_ranked.smi file
+    :param list ligand_info_list: the list of ligands written to the ranked
+        .smi file. Each ligand is a list of its fields. ie. ["CCCC",
+        "zinc123", "zinc123", "-7.1", "3.2"]
+    :param int generation_num: the generation number of the ligands
+    """
+
+    store_folder = get_population_store_folder(ranked_smi_file)
+    if os.path.exists(store_folder) is False:
+        os.makedirs(store_folder, exist_ok=True)
+
+    # The source.json is written last, so a store which was only partly
+    # written is never used
+    source_file = store_folder + "source.json"
+    if os.path.exists(source_file) is True:
+        os.remove(source_file)
+
+    columns = numpy.zeros(len(ligand_info_list), dtype=COLUMNS_DTYPE)
+    all_fields = []
+    all_parents = []
+    for i, ligand_info in enumerate(ligand_info_list):
+        fields = [str(x) for x in ligand_info]
+
+        columns[i]["score"] = get_float(fields[-2]) if len(fields) > 1 else numpy.nan
+        columns[i]["diversity"] = get_float(fields[-1])
+        columns[i]["generation"] = generation_num
+        columns[i]["first_field"] = len(all_fields)
+        columns[i]["num_fields"] = len(fields)
+
+        all_fields.extend(fields)
+        all_parents.append(get_parent_ids(fields[1]) if len(fields) > 1 else "")
+
+    numpy.save(store_folder + "columns.npy", columns)
+    save_string_pool(store_folder + "fields", all_fields)
+    save_string_pool(store_folder + "parents", all_parents)
+
+    with open(source_file, "w") as f:
+        json.dump(
+            {
+                "smi_size": os.path.getsize(ranked_smi_file),
+                "smi_mtime": os.path.getmtime(ranked_smi_file),
+                "num_ligands": len(ligand_info_list),
+            },
+            f,
+        )
+
+
+class RankedPopulation(object):
+    """
+    A memory-mapped population store of one generation.
+    """
+
+    def __init__(self, store_folder):
+        """
+        Inputs:
+        :param str store_folder: the path to the population store folder
+        """
+
+        self.columns = numpy.load(store_folder + "columns.npy", mmap_mode="r")
+        self.fields = StringPool(store_folder + "fields")
+        self.parents = StringPool(store_folder + "parents")
+        self.index_of_ligands = None
+
+    def __len__(self):
+        """
+        Returns:
+        :returns: int length: the number of ligands in the generation
+        """
+
+        return len(self.columns)
+
+    def get_scores(self):
+        """
+        Returns:
+        :returns: numpy.array scores: the fitness metric (ie. docking score)
+            of every ligand
+        """
+
+        return self.columns["score"]
+
+    def get_diversity_scores(self):
+        """
+        Returns:
+        :returns: numpy.array diversity_scores: the diversity score of every
+            ligand
+        """
+
+        return self.columns["diversity"]
+
+    def get_row(self, index):
+        """
+        Get the fields of a single ligand.
+
+        Inputs:
+        :param int index: the index of the ligand
+
+        Returns:
+        :returns: list ligand_info: the fields of the ligand. ie. ["CCCC",
+            "zinc123", "zinc123", "-7.1", "3.2"]
+        """
+
+        first_field = int(self.columns[index]["first_field"])
+        num_fields = int(self.columns[index]["num_fields"])
+
+        return self.fields.get_strings(first_field, first_field + num_fields)
+
+    def get_usable_list_of_smiles(self):
+        """
+        Get every ligand as a list of its fields, the same as
+        Ranking.get_usable_format() gives for the ranked .smi file.
+
+        Returns:
+        :returns: list usable_list_of_smiles: list of SMILES and their
+            associated information
+        """
+
+        all_fields = self.fields.get_strings(0, len(self.fields))
+        first_fields = self.columns["first_field"].tolist()
+        num_fields = self.columns["num_fields"].tolist()
+
+        return [
+            all_fields[first_fields[i] : first_fields[i] + num_fields[i]]
+            for i in range(0, len(first_fields))
+        ]
+
+    def get_index_of_ligands(self):
+        """
+        Index the ligands by their SMILES and ID. If a ligand is listed more
+        than once the row with the best (most negative) score is used. The
+        index is only made once per RankedPopulation.
+
+        Returns:
+        :returns: dict index_of_ligands: the row index of each ligand keyed by
+            a tuple of its SMILES and ID
+        """
+
+        if self.index_of_ligands is not None:
+            return self.index_of_ligands
+
+        all_fields = self.fields.get_strings(0, len(self.fields))
+        first_fields = self.columns["first_field"].tolist()
+        num_fields = self.columns["num_fields"].tolist()
+        scores = self.columns["score"].tolist()
+
+        index_of_ligands = {}
+        for i in range(0, len(first_fields)):
+            if num_fields[i] < 2:
+                continue
+            key = (all_fields[first_fields[i]], all_fields[first_fields[i] + 1])
+            if key in index_of_ligands.keys():
+                if (scores[i] < scores[index_of_ligands[key]]) is False:
+                    continue
+            index_of_ligands[key] = i
+
+        self.index_of_ligands = index_of_ligands
+
+        return index_of_ligands
+
+    def get_parents(self, index):
+        """
+        Get the parent IDs of a ligand.
+
+        Inputs:
+        :param int index: the index of the ligand
+
+        Returns:
+        :returns: list parents: the IDs of the parents of the ligand
+        """
+
+        parents = self.parents.get_strings(index, index + 1)[0]
+        if parents == "":
+            return []
+
+        return parents.split("+")
+
+
+def load_ranked_population(ranked_smi_file):
+    """
+    Load the population store of a ranked .smi file.
+
+    Inputs:
+    :param str ranked_smi_file: the path to a generation_N_ranked.smi file
+
+    Returns:
+    :returns: RankedPopulation population: the memory-mapped population
+        store. None if there is no store or if the .smi file was changed
+        after the store was saved.
+    """
+
+    store_folder = get_population_store_folder(ranked_smi_file)
+    source_file = store_folder + "source.json"
+    if os.path.exists(source_file) is False or os.path.exists(ranked_smi_file) is False:
+        return None
+
+    try:
+        with open(source_file, "r") as f:
+            source = json.load(f)
+    except ValueError:
+        return None
+
+    if source["smi_size"] != os.path.getsize(ranked_smi_file):
+        return None
+    if source["smi_mtime"] != os.path.getmtime(ranked_smi_file):
+        return None
+
+    population = RankedPopulation(store_folder)
+    if len(population) != source["num_ligands"]:
+        return None
+
+    return population
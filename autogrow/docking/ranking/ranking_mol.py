@@ -6,6 +6,7 @@ import __future__
 import os
 import random
 
+import numpy
 import rdkit
 import rdkit.Chem as Chem
 from rdkit.Chem.rdMolDescriptors import GetMorganFingerprint
@@ -18,6 +19,11 @@ import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as
 import autogrow.docking.ranking.selecting.rank_selection as Rank_Sel
 import autogrow.docking.ranking.selecting.roulette_selection as Roulette_Sel
 import autogrow.docking.ranking.selecting.tournament_selection as Tournament_Sel
+import autogrow.docking.ranking.population_store as PopulationStore
+from autogrow.docking.ranking.selecting.population_table import (
+    PopulationTable,
+    as_population_table,
+)
 
 
 def create_seed_list(usable_list_of_smiles, num_seed_diversity,
@@ -37,10 +43,14 @@ def create_seed_list(usable_list_of_smiles, num_seed_diversity,
     It will return this list with the complete information of each chosen mol
     (weighted_order_list)
 
+    The usable_list_of_smiles is indexed into a PopulationTable once and
+    every selector reads its scores from that table.
+
     Inputs:
     :param list usable_list_of_smiles: a list with SMILES strings, names, and
         information about the smiles from either the previous generation or the
-        source compound list
+        source compound list, or a PopulationTable of them (see
+        get_population_table)
     :param int num_seed_diversity: the number of seed molecules which come
         from diversity selection
     :param int num_seed_dock_fitness: the number of seed molecules which come
@@ -55,17 +65,19 @@ def create_seed_list(usable_list_of_smiles, num_seed_diversity,
         weighted ranking ie ["CCCC"  "zinc123"   1    -0.1]
     """
 
+    population = as_population_table(usable_list_of_smiles)
+
     if selector_choice == "Roulette_Selector":
 
         print("Roulette_Selector")
         # Get seed molecules based on docking scores
         docking_fitness_smiles_list = Roulette_Sel.spin_roulette_selector(
-            usable_list_of_smiles, num_seed_dock_fitness, "docking"
+            population, num_seed_dock_fitness, "docking"
         )
 
         # Get seed molecules based on diversity scores
         diversity_smile_list = Roulette_Sel.spin_roulette_selector(
-            usable_list_of_smiles, num_seed_diversity, "diversity"
+            population, num_seed_diversity, "diversity"
         )
 
     elif selector_choice == "Rank_Selector":
@@ -77,12 +89,12 @@ def create_seed_list(usable_list_of_smiles, num_seed_diversity,
 
         # Get seed molecules based on docking scores
         docking_fitness_smiles_list = Rank_Sel.run_rank_selector(
-            usable_list_of_smiles, num_seed_dock_fitness, -2, False
+            population, num_seed_dock_fitness, -2, False
         )
 
         # Get seed molecules based on diversity scores
         diversity_smile_list = Rank_Sel.run_rank_selector(
-            usable_list_of_smiles, num_seed_diversity, -1, False
+            population, num_seed_diversity, -1, False
         )
 
     elif selector_choice == "Tournament_Selector":
@@ -94,12 +106,12 @@ def create_seed_list(usable_list_of_smiles, num_seed_diversity,
 
         # Get seed molecules based on docking scores
         docking_fitness_smiles_list = Tournament_Sel.run_Tournament_Selector(
-            usable_list_of_smiles, num_seed_dock_fitness, tourn_size, -2, True
+            population, num_seed_dock_fitness, tourn_size, -2, True
         )
 
         # Get seed molecules based on diversity scores
         diversity_smile_list = Tournament_Sel.run_Tournament_Selector(
-            usable_list_of_smiles, num_seed_diversity, tourn_size, -1, True
+            population, num_seed_diversity, tourn_size, -1, True
         )
 
     else:
@@ -118,7 +130,7 @@ def create_seed_list(usable_list_of_smiles, num_seed_diversity,
         # information such as the ligand name/id, the smiles string, the
         # diversity and docking score...
         chosen_mol_full_data_list = get_chosen_mol_full_data_list(
-            chosen_mol_list, usable_list_of_smiles
+            chosen_mol_list, population
         )
 
     elif selector_choice == "Tournament_Selector":
@@ -163,20 +175,27 @@ def get_chosen_mol_full_data_list(chosen_mol_list, usable_list_of_smiles):
     :param list chosen_mol_list: a list of chosen molecules
     :param list usable_list_of_smiles: List of all the possibly chosen ligs
         and all the of the info about it (ie. ligand name, SMILES string, docking
-        score, diversity score...) ["CCCC"  "zinc123"   1    -0.1  -0.1]
+        score, diversity score...) ["CCCC"  "zinc123"   1    -0.1  -0.1], or
+        a PopulationTable of them
 
     Returns:
     :returns: list weighted_order_list: a list of all the SMILES with all of
         the associated information in a random order
     """
 
-    sorted_list = sorted(usable_list_of_smiles, key=lambda x: float(x[-2]))
+    # Index the best scoring entry of each SMILES (the entry which sorting by
+    # score would find first) rather than searching the list for each chosen
+    # mol
+    population = as_population_table(usable_list_of_smiles)
+    best_indices = population.get_best_index_per_smiles(population.get_column(-2))
+    index_of_smiles = {}
+    for i in best_indices.tolist():
+        index_of_smiles[population.smiles[i]] = i
+
     weighted_order_list = []
     for smile in chosen_mol_list:
-        for smile_pair in sorted_list:
-            if smile == smile_pair[0]:
-                weighted_order_list.append(smile_pair)
-                break
+        if smile in index_of_smiles.keys():
+            weighted_order_list.append(population.rows[index_of_smiles[smile]])
 
     if len(weighted_order_list) != len(chosen_mol_list):
         raise AssertionError(
@@ -243,6 +262,101 @@ def get_usable_format(infile):
     return usable_list_of_smiles
 
 
+def get_ranked_usable_format(ranked_smi_file):
+    """
+    This gets the ligands of a generation's ranked .smi file in the same
+    format as get_usable_format(). If the population store saved with the
+    ranked .smi file is there and up to date it is loaded instead of parsing
+    the .smi file.
+
+    Inputs:
+    :param str ranked_smi_file: the path to a generation_N_ranked.smi file
+
+    Returns:
+    :returns: list usable_list_of_smiles: list of SMILES and their associated
+        information formatted into a list which is usable by the rest of Autogrow
+    """
+
+    population = PopulationStore.load_ranked_population(ranked_smi_file)
+    if population is None:
+        return get_usable_format(ranked_smi_file)
+
+    return population.get_usable_list_of_smiles()
+
+
+def get_population_table(usable_list_of_smiles, ranked_smi_file=None):
+    """
+    Index a usable_list_of_smiles into a PopulationTable for the selectors.
+    If the ligands came from a generation's ranked .smi file and its
+    population store is up to date, the docking and diversity scores are
+    taken from the store's typed columns rather than converting the fields
+    of every ligand to floats.
+
+    Inputs:
+    :param list usable_list_of_smiles: list of SMILES and their associated
+        information formatted into a list which is usable by the rest of Autogrow
+    :param str ranked_smi_file: the path to the generation_N_ranked.smi file
+        the ligands came from. None if they didn't come from one.
+
+    Returns:
+    :returns: PopulationTable population: the indexed table of the ligands
+    """
+
+    population = None
+    if ranked_smi_file is not None:
+        population = PopulationStore.load_ranked_population(ranked_smi_file)
+    if population is None:
+        return PopulationTable(usable_list_of_smiles)
+
+    index_of_ligands = population.get_index_of_ligands()
+    row_indices = []
+    for lig in usable_list_of_smiles:
+        key = (str(lig[0]), str(lig[1])) if len(lig) > 1 else None
+        if key not in index_of_ligands.keys():
+            # Not every ligand is in the store so read the scores from the
+            # rows
+            return PopulationTable(usable_list_of_smiles)
+        row_indices.append(index_of_ligands[key])
+
+    row_indices = numpy.array(row_indices, dtype=int)
+    columns = {
+        -2: numpy.array(population.get_scores()[row_indices], dtype=float),
+        -1: numpy.array(population.get_diversity_scores()[row_indices], dtype=float),
+    }
+
+    return PopulationTable(usable_list_of_smiles, columns)
+
+
+def get_ranked_ligands(ranked_smi_file, ligand_keys):
+    """
+    Get the ligands of a generation's ranked .smi file for a set of ligands.
+    If the population store of the ranked .smi file is up to date only the
+    rows of those ligands are read from it. Otherwise the whole ranked .smi
+    file is read.
+
+    Inputs:
+    :param str ranked_smi_file: the path to a generation_N_ranked.smi file
+    :param list ligand_keys: a list of [SMILES, ID] of the ligands to get
+
+    Returns:
+    :returns: list ranked_ligands: list of the SMILES and their associated
+        information of the ligands which are in the ranked .smi file
+    """
+
+    population = PopulationStore.load_ranked_population(ranked_smi_file)
+    if population is None:
+        return get_usable_format(ranked_smi_file)
+
+    index_of_ligands = population.get_index_of_ligands()
+    ranked_ligands = []
+    for smiles, lig_id in ligand_keys:
+        key = (str(smiles), str(lig_id))
+        if key in index_of_ligands.keys():
+            ranked_ligands.append(population.get_row(index_of_ligands[key]))
+
+    return ranked_ligands
+
+
 def convert_usable_list_to_lig_dict(usable_list_of_smiles):
     """
     This will convert a list created by get_usable_format() to a dictionary
@@ -272,7 +386,66 @@ def convert_usable_list_to_lig_dict(usable_list_of_smiles):
 
 
 ##### Called in the docking class ######
-def score_and_append_diversity_scores(molecules_list):
+def get_diversity_scores(fps, diversity_sample_size=None):
+    """
+    This function sums the Dice similarity of each fingerprint to every other
+    fingerprint in the population.
+
+    Each fingerprint is compared to the whole population at once with
+    DataStructs.BulkDiceSimilarity. The similarities of each row are then
+    added up in order (numpy.cumsum adds sequentially) so the sums are the
+    same as adding each DataStructs.DiceSimilarity one at a time.
+
+    Comparing every pair is quadratic in the population size. If a
+    diversity_sample_size is given and the population is larger than it,
+    each fingerprint is instead only compared to that many randomly chosen
+    fingerprints and the sum is scaled up to the size of the population. This
+    approximate score has the same expected value as the exact score.
+
+    Inputs:
+    :param list fps: list of the Morgan fingerprints of the population
+    :param int diversity_sample_size: the number of other fingerprints to
+        compare each fingerprint to. If None or 0 every pair is compared.
+
+    Returns:
+    :returns: list diversity_scores: the sum of the similarities of each
+        fingerprint to all the other fingerprints
+    """
+
+    num_fps = len(fps)
+    if diversity_sample_size is None or int(diversity_sample_size) <= 0 \
+            or int(diversity_sample_size) >= num_fps - 1:
+        diversity_sample_size = None
+    else:
+        diversity_sample_size = int(diversity_sample_size)
+
+    diversity_scores = []
+    for i in range(0, num_fps):
+        if num_fps == 1:
+            # Nothing to compare to
+            diversity_score = 0
+        elif diversity_sample_size is None:
+            similarities = numpy.array(
+                DataStructs.BulkDiceSimilarity(fps[i], fps), dtype=float
+            )
+            # A molecule is not compared to itself
+            similarities[i] = 0.0
+            diversity_score = float(numpy.cumsum(similarities)[-1])
+        else:
+            # Pick from the other molecules by skipping over index i
+            sample = random.sample(range(0, num_fps - 1), diversity_sample_size)
+            sample_fps = [fps[j] if j < i else fps[j + 1] for j in sample]
+            similarities = DataStructs.BulkDiceSimilarity(fps[i], sample_fps)
+            diversity_score = (
+                sum(similarities) * float(num_fps - 1) / diversity_sample_size
+            )
+        diversity_scores.append(diversity_score)
+
+    return diversity_scores
+
+
+def score_and_append_diversity_scores(molecules_list, diversity_sample_size=None,
+                                      fingerprint_store=None):
     """
     This function will take list of molecules which makes up a population. It
     will then create a diversity score for each molecules:
@@ -305,78 +478,86 @@ def score_and_append_diversity_scores(molecules_list):
                     makes this funciton usable for multiple codes
         It will remove any Nones from the input list
 
+        Fingerprints are reused from the fingerprint_store if one is given.
+
+        For large populations an approximate diversity score can be used
+        instead, which compares each molecule to a random sample of
+        diversity_sample_size molecules (see get_diversity_scores).
+
     Inputs:
     :param list molecules_list: list of all molecules in the populations with
     the respective info
+    :param int diversity_sample_size: the number of molecules to compare each
+        molecule to. If None or 0 every pair is compared.
+    :param FingerprintStore fingerprint_store: a store of the fingerprints
+        of already seen SMILES strings to reuse and add to. If None every
+        fingerprint is made from scratch.
 
     Returns:
     :returns: list molecules_list: list of all molecules in the populations
         with the respective info and append diversity score
     """
 
-    mol_list = []
+    fps_list = []
 
     for pair in molecules_list:
         if pair is not None:
             smile = pair[0]
             # name = pair[1]
-            try:
-                mol = Chem.MolFromSmiles(smile, sanitize=False)
-            except:
-                mol = None
-
-            if mol is None:
-                raise AssertionError(
-                    "mol in list failed to sanitize. Issue in Ranking.py \
-                                    def score_and_append_diversity_scores"
-                )
-
-            mol = MOH.check_sanitization(mol)
-            if mol is None:
-                raise AssertionError(
-                    "mol in list failed to sanitize. Issue in Ranking.py \
-                                        def score_and_append_diversity_scores"
-                )
 
-            mol = MOH.try_deprotanation(mol)
-            if mol is None:
-                raise AssertionError(
-                    "mol in list failed to sanitize. Issue in Ranking.py \
+            # Ligands already in the fingerprint store were already
+            # sanitized and fingerprinted in an earlier generation
+            fp = None
+            if fingerprint_store is not None:
+                fp = fingerprint_store.get(smile)
+
+            if fp is None:
+                try:
+                    mol = Chem.MolFromSmiles(smile, sanitize=False)
+                except:
+                    mol = None
+
+                if mol is None:
+                    raise AssertionError(
+                        "mol in list failed to sanitize. Issue in Ranking.py \
                                         def score_and_append_diversity_scores"
-                )
+                    )
+
+                mol = MOH.check_sanitization(mol)
+                if mol is None:
+                    raise AssertionError(
+                        "mol in list failed to sanitize. Issue in Ranking.py \
+                                            def score_and_append_diversity_scores"
+                    )
+
+                mol = MOH.try_deprotanation(mol)
+                if mol is None:
+                    raise AssertionError(
+                        "mol in list failed to sanitize. Issue in Ranking.py \
+                                            def score_and_append_diversity_scores"
+                    )
+
+                fp = GetMorganFingerprint(mol, 10, useFeatures=True)
+                if fingerprint_store is not None:
+                    fingerprint_store.add(smile, fp)
 
             temp = [x for x in pair]
-            temp.append(mol)
-            if temp[-1] is None:
-                print(temp)
-                print("None in temp list, skip this one")
-                continue
-            if temp[-1] is not None:
-                mol_list.append(temp)
+            temp.append(fp)
+            fps_list.append(temp)
         else:
             print("noneitem in molecules_list in score_and_append_diversity_scores")
 
-    fps_list = []
-    for molecule in mol_list:
-        fp = GetMorganFingerprint(molecule[-1], 10, useFeatures=True)
-        temp = [x for x in molecule]
-        temp.append(fp)
-        fps_list.append(temp)
+    # if DiceSimilarity=1.0 its a perfect match, the smaller the number the
+    # more diverse it is. The sum of all of these gives the distance from the
+    # normal. The smaller the number means the more distant
+    diversity_scores = get_diversity_scores(
+        [molecule[-1] for molecule in fps_list], diversity_sample_size
+    )
 
     fps_list_w_div_score = []
     for i in range(0, len(fps_list)):
-        diversity_score = 0
-        for j in range(0, len(fps_list)):
-            if i != j:
-                # if DiceSimilarity=1.0 its a perfect match, the smaller the
-                # number the more diverse it is. The sum of all of these gives
-                # the distance from the normal. The smaller the number means
-                # the more distant
-                diversity_score = diversity_score + DataStructs.DiceSimilarity(
-                    fps_list[i][-1], fps_list[j][-1]
-                )
         temp = [x for x in fps_list[i]]
-        temp.append(str(diversity_score))
+        temp.append(str(diversity_scores[i]))
         fps_list_w_div_score.append(temp)
 
     # take the diversity score and append to the last column in the original
@@ -0,0 +1,189 @@
+"""
+This script holds an indexed table of a population of ligands which the
+selectors use to choose ligands with numpy rather than by sorting and
+scanning lists.
+"""
+import __future__
+
+import numpy
+
+
+class PopulationTable(object):
+    """
+    An indexed view of a usable_list_of_smiles. The rows are kept as they are
+    and any numeric column (ie. the docking score at -2 or the diversity
+    score at -1) is converted to a numpy array once, the first time it is
+    needed. Columns which are already typed (ie. read from a generation's
+    population store) can be given up front so they are never converted.
+    """
+
+    def __init__(self, usable_list_of_smiles, columns=None):
+        """
+        Inputs:
+        :param list usable_list_of_smiles: a list with all the information of
+            all the mols in the population. ie. [["CCCC", "zinc123", -7.1,
+            3.2], ...]
+        :param dict columns: numpy arrays of float columns keyed by their
+            column idx, in the same order as usable_list_of_smiles. ie. {-2:
+            docking scores, -1: diversity scores}. None if every column
+            should be read from the rows.
+        """
+
+        self.rows = usable_list_of_smiles
+        self.smiles = [x[0] for x in usable_list_of_smiles]
+        self.columns = {}
+        if columns is not None:
+            for column_idx in columns.keys():
+                self.columns[column_idx] = columns[column_idx]
+
+    def __len__(self):
+        """
+        Returns:
+        :returns: int length: the number of ligands in the population
+        """
+
+        return len(self.rows)
+
+    def get_column(self, column_idx):
+        """
+        Get a column of the population as a numpy array of floats.
+
+        Inputs:
+        :param int column_idx: the idx of the column within each ligand's
+            list. ie. -2 for the docking score and -1 for the diversity score
+
+        Returns:
+        :returns: numpy.array column: the float value of the column for every
+            ligand
+        """
+
+        if column_idx not in self.columns.keys():
+            self.columns[column_idx] = numpy.array(
+                [float(x[column_idx]) for x in self.rows], dtype=float
+            )
+
+        return self.columns[column_idx]
+
+    def get_sort_keys(self, column_idx, reverse_sort=False):
+        """
+        Get keys for a column where a smaller key is always a better score.
+
+        Inputs:
+        :param int column_idx: the idx of the column to rank by
+        :param bol reverse_sort: True if the most positive number is the best
+            choice. False if the most negative number is the best choice.
+
+        Returns:
+        :returns: numpy.array keys: the key of every ligand
+        """
+
+        if reverse_sort is True:
+            return -self.get_column(column_idx)
+
+        return self.get_column(column_idx)
+
+    def get_unique_row_indices(self):
+        """
+        Get the index of the first copy of each distinct row. Ligands which
+        are listed more than once with exactly the same info are only
+        counted once.
+
+        Returns:
+        :returns: numpy.array indices: the indices of the distinct rows in
+            the order they appear
+        """
+
+        seen_rows = set([])
+        indices = []
+        for i, row in enumerate(self.rows):
+            row_key = tuple(row)
+            if row_key in seen_rows:
+                continue
+            seen_rows.add(row_key)
+            indices.append(i)
+
+        return numpy.array(indices, dtype=int)
+
+    def get_best_index_per_smiles(self, keys, indices=None):
+        """
+        Get the index of the best scoring row of each distinct SMILES string.
+        If several rows of a SMILES string tie the first is used.
+
+        Inputs:
+        :param numpy.array keys: the sort key of every ligand (see
+            get_sort_keys). The smallest key is the best.
+        :param numpy.array indices: the rows to consider. If None every row is
+            considered.
+
+        Returns:
+        :returns: numpy.array best_indices: the index of the best row of each
+            distinct SMILES string in the order the SMILES first appear
+        """
+
+        if indices is None:
+            indices = numpy.arange(len(self.rows))
+
+        key_list = keys.tolist()
+        best_index_of_smiles = {}
+        for i in indices.tolist():
+            smiles = self.smiles[i]
+            if smiles not in best_index_of_smiles.keys():
+                best_index_of_smiles[smiles] = i
+            elif key_list[i] < key_list[best_index_of_smiles[smiles]]:
+                best_index_of_smiles[smiles] = i
+
+        return numpy.array(list(best_index_of_smiles.values()), dtype=int)
+
+
+def as_population_table(usable_list_of_smiles):
+    """
+    Get a PopulationTable for the selectors. A PopulationTable is used as it
+    is and a list is indexed into a new one.
+
+    Inputs:
+    :param list usable_list_of_smiles: a list with all the information of all
+        the mols in the population or a PopulationTable of them
+
+    Returns:
+    :returns: PopulationTable population: the indexed table of the mols
+    """
+
+    if isinstance(usable_list_of_smiles, PopulationTable):
+        return usable_list_of_smiles
+
+    if type(usable_list_of_smiles) is not type([]):
+        raise Exception(
+            "usable_list_of_smiles Must be a list or a PopulationTable, wrong data type"
+        )
+
+    return PopulationTable(usable_list_of_smiles)
+
+
+def get_top_k_indices(keys, indices, k):
+    """
+    Get the k indices with the smallest keys, best first. Ties are broken by
+    the smaller index, so this is the same as the first k of a stable sort.
+
+    numpy.argpartition finds the kth best key without sorting everything.
+    Only the indices with a key at least as good as it are then sorted.
+
+    Inputs:
+    :param numpy.array keys: the sort key of every ligand
+    :param numpy.array indices: the indices to choose from
+    :param int k: the number of indices to choose
+
+    Returns:
+    :returns: numpy.array top_indices: the k best indices, best first
+    """
+
+    if k <= 0:
+        return numpy.array([], dtype=int)
+
+    if k < len(indices):
+        candidate_keys = keys[indices]
+        kth_position = numpy.argpartition(candidate_keys, k - 1)[k - 1]
+        indices = indices[candidate_keys <= candidate_keys[kth_position]]
+
+    order = numpy.lexsort((indices, keys[indices]))
+
+    return indices[order][:k]
@@ -3,9 +3,11 @@ This script is use to select molecules using a ranked selector
 """
 import __future__
 
+from autogrow.docking.ranking.selecting.population_table import (
+    as_population_table,
+    get_top_k_indices,
+)
 
-import os
-import random
 
 def run_rank_selector(usable_list_of_smiles, number_to_chose,
                       column_idx_to_select, reverse_sort=False):
@@ -14,11 +16,15 @@ def run_rank_selector(usable_list_of_smiles, number_to_chose,
     top rank scores for that critera. The number is choses is defined by
     number_to_chose.
 
+    The scores are read into numpy arrays (see PopulationTable) and the top
+    ligands are found with numpy.argpartition rather than sorting the whole
+    population.
+
     This is an alternative to the weight roulette style selectors.
 
     Inputs:
     :param list usable_list_of_smiles: a list with all the information of all
-        the mols in the previous generation
+        the mols in the previous generation or a PopulationTable of them
     :param int number_to_chose: the number of molecules to chose based on
         diversity score
     :param int column_idx_to_select: the idx to use as the criteria for
@@ -33,10 +39,9 @@ def run_rank_selector(usable_list_of_smiles, number_to_chose,
         selection, without replacement,
     """
 
-    if type(usable_list_of_smiles) is not type([]):
-        raise Exception("usable_list_of_smiles Must be a list, wrong data type")
+    population = as_population_table(usable_list_of_smiles)
 
-    num_ligands = len(usable_list_of_smiles)
+    num_ligands = len(population)
     if num_ligands == 0:
         raise Exception(
             "usable_list_of_smiles is an empty list. There is nothing to chose from."
@@ -46,58 +51,28 @@ def run_rank_selector(usable_list_of_smiles, number_to_chose,
         top_choice_smile_order = []
         return top_choice_smile_order
 
-    # Sort by chosen idx property
-    sorted_list = sorted(
-        usable_list_of_smiles,
-        key=lambda x: float(x[column_idx_to_select]),
-        reverse=reverse_sort,
-    )
+    keys = population.get_sort_keys(column_idx_to_select, reverse_sort)
 
     # remove any redundants
-    new_sorted_list = []
-    temp_list_info = []
-    for i in range(len(sorted_list)):
-        info = sorted_list[i]
-        if "\t".join(info) in temp_list_info:
-            continue
-
-        temp_list_info.append("\t".join(info))
-        new_sorted_list.append(info)
-
-    del sorted_list
-    del temp_list_info
-    if len(new_sorted_list) < number_to_chose:
+    unique_indices = population.get_unique_row_indices()
+    if len(unique_indices) < number_to_chose:
 
         raise Exception(
             "Asked for {} but only {} availabe to chose from \
             There are more ligands to chose to seed the list than ligands to select from. \
             Please lower the top_mols_to_seed_next_generation and/or \
             diversity_mols_to_seed_first_generation".format(
-                number_to_chose, len(new_sorted_list)
+                number_to_chose, len(unique_indices)
             )
         )
 
-    new_sorted_list = sorted(
-        new_sorted_list,
-        key=lambda x: float(x[column_idx_to_select]),
-        reverse=reverse_sort,
-    )
-
-    if len(list(set([x[0] for x in new_sorted_list]))) >= number_to_chose:
-        sorted_list = []
-        smiles_list = []
-        for mol_info in new_sorted_list:
-            if mol_info[0] in smiles_list:
-                continue
-            else:
-                sorted_list.append(mol_info)
-                smiles_list.append(mol_info[0])
-    else:
-        sorted_list = new_sorted_list
-
-    top_choice_smile_order = []
-    for i in range(0, number_to_chose):
-        smile = sorted_list[i]
-        top_choice_smile_order.append(smile[0])
+    # Only keep the best scoring copy of each SMILES if there are enough
+    # distinct SMILES
+    best_indices = population.get_best_index_per_smiles(keys, unique_indices)
+    if len(best_indices) >= number_to_chose:
+        unique_indices = best_indices
+
+    top_indices = get_top_k_indices(keys, unique_indices, number_to_chose)
+    top_choice_smile_order = [population.smiles[i] for i in top_indices]
 
     return top_choice_smile_order
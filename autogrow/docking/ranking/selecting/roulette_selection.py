@@ -3,8 +3,11 @@ This script is use to select molecules using a roulette selector
 """
 import __future__
 
+import numpy
 import numpy.random as rn
 
+from autogrow.docking.ranking.selecting.population_table import as_population_table
+
 
 def spin_roulette_selector(usable_list_of_smiles, number_to_chose,
                            docking_or_diversity):
@@ -14,7 +17,7 @@ def spin_roulette_selector(usable_list_of_smiles, number_to_chose,
 
     Inputs:
     :param list usable_list_of_smiles: a list with all the information of all
-        the mols in the previous generation
+        the mols in the previous generation or a PopulationTable of them
     :param int number_to_chose: the number of molecules to chose based on
         docking score
     :param str docking_or_diversity: an string describing either "docking" or
@@ -25,10 +28,9 @@ def spin_roulette_selector(usable_list_of_smiles, number_to_chose,
         weighted selection, without replacement, -weighted by its docking score
     """
 
-    if type(usable_list_of_smiles) is not type([]):
-        raise Exception("usable_list_of_smiles Must be a list, wrong data type")
+    population = as_population_table(usable_list_of_smiles)
 
-    num_ligands = len(usable_list_of_smiles)
+    num_ligands = len(population)
     if num_ligands == 0:
         raise Exception(
             "usable_list_of_smiles is an empty list. There is nothing to chose from."
@@ -38,20 +40,25 @@ def spin_roulette_selector(usable_list_of_smiles, number_to_chose,
         top_choice_smile_order = []
         return top_choice_smile_order
 
-    adjusted = adjust_scores(usable_list_of_smiles, docking_or_diversity)
+    adjusted = adjust_scores(population, docking_or_diversity)
 
-    total = sum(adjusted)
-    probability = [x / total for x in adjusted]
-    smiles_list = [x[0] for x in usable_list_of_smiles]
+    # numpy.cumsum adds the scores in order, like sum() of a list
+    total = numpy.cumsum(adjusted)[-1]
+    probability = adjusted / total
 
-    top_choice_smile_order = rn.choice(
-        smiles_list, size=number_to_chose, replace=False, p=probability
+    # Pick the indices of the chosen ligands rather than making numpy copy
+    # every SMILES string into an array
+    chosen_indices = rn.choice(
+        len(population), size=number_to_chose, replace=False, p=probability
+    )
+    top_choice_smile_order = numpy.array(
+        [population.smiles[i] for i in chosen_indices]
     )
 
     return top_choice_smile_order
 
 
-def adjust_scores(usable_list_of_smiles, docking_or_diversity):
+def adjust_scores(population, docking_or_diversity):
     """
     This function adjusts the scores appropriately. This is where we weight
     the scores so smaller differences are more pronounced and where we adjust
@@ -59,35 +66,35 @@ def adjust_scores(usable_list_of_smiles, docking_or_diversity):
     while diversity score is the smallest positive number is the most unique.
 
     Inputs:
-    :param list usable_list_of_smiles: a list with all the information of all
-        the mols in the previous generation
+    :param PopulationTable population: the indexed table of all the mols in
+        the previous generation
     :param str docking_or_diversity: an string describing either "docking"
         or "diversity" this tells the function how to adjust the weighted
         scores
 
     Returns:
-    :returns: list adjusted: list of ligand scores which have been weighted
-        and adjusted
+    :returns: numpy.array adjusted: array of ligand scores which have been
+        weighted and adjusted
     """
 
     if docking_or_diversity == "docking":
-        weight_scores = [float(x[-1]) for x in usable_list_of_smiles]
+        weight_scores = population.get_column(-1)
         # minimum is the most positive value from usable_list_of_smiles the
         # more negative the docking score the better the dock
-        minimum = max(weight_scores) + 0.1
+        minimum = float(numpy.max(weight_scores)) + 0.1
         if minimum < 0:
             minimum = 0
 
-        adjusted = [(x ** 10) + minimum for x in weight_scores]
+        adjusted = numpy.power(weight_scores, 10.0) + minimum
 
     elif docking_or_diversity == "diversity":
 
-        weight_scores = [float(x[-1]) for x in usable_list_of_smiles]
+        weight_scores = population.get_column(-1)
 
         # adjust by squaring the number to make the discrpency larger and
         # invert by dividing 1/x^2 (because the more diverse a mol is the
         # smaller the number)
-        adjusted = [(x ** -2) for x in weight_scores]
+        adjusted = numpy.power(weight_scores, -2.0)
 
     else:
         raise Exception("docking_or_diversity choice not an option")
@@ -3,9 +3,11 @@ This script is use to select molecules using a tournament selector
 """
 import __future__
 
-import random
 import math
-import copy
+
+import numpy
+
+from autogrow.docking.ranking.selecting.population_table import as_population_table
 
 
 def run_Tournament_Selector(list_of_ligands, num_to_chose, tourn_size,
@@ -27,7 +29,7 @@ def run_Tournament_Selector(list_of_ligands, num_to_chose, tourn_size,
 
     Inputs:
     :param list list_of_ligands: The list of lists containing info about
-        ligands with scores to select from.
+        ligands with scores to select from or a PopulationTable of them.
     :param int num_to_chose: the number of ligands to be chosen total this
         also is the number of tournaments that will be conducted.
     :param float tourn_size: percentage of the total pool of ligands to be
@@ -43,8 +45,8 @@ def run_Tournament_Selector(list_of_ligands, num_to_chose, tourn_size,
         info for each ligand with potential for redundancy
     """
 
-    if type(list_of_ligands) is not type([]):
-        raise Exception("list_of_ligands Must be a list, wrong data type")
+    population = as_population_table(list_of_ligands)
+    list_of_ligands = population.rows
 
     num_ligands = len(list_of_ligands)
     if num_ligands == 0:
@@ -60,22 +62,20 @@ def run_Tournament_Selector(list_of_ligands, num_to_chose, tourn_size,
 
     num_per_tourn = int(math.ceil(num_ligands * tourn_size))
 
+    scores = population.get_column(idx_to_sel)
+
     chosen_ligands = []
-    list_of_ligands_reduced = copy.deepcopy(list_of_ligands)
     for i in range(0, num_to_chose):
         chosen_ligand = run_one_tournament(
-            list_of_ligands, num_per_tourn, idx_to_sel, favor_most_negative
+            list_of_ligands, num_per_tourn, scores, favor_most_negative
         )
-        list_of_ligands_reduced = [
-            x for x in list_of_ligands_reduced if x != chosen_ligand
-        ]
         chosen_ligands.append(chosen_ligand)
 
     return chosen_ligands
 #
 
 
-def run_one_tournament(list_of_ligands, num_per_tourn, idx_to_sel,
+def run_one_tournament(list_of_ligands, num_per_tourn, scores,
                        favor_most_negative=True):
     """
     This runs a single tournament style selection given a list of ligands and
@@ -94,13 +94,16 @@ def run_one_tournament(list_of_ligands, num_per_tourn, idx_to_sel,
         -num_per_tourn is the int(math.ceil(num_ligands * tourn_size)) so that
             it rounds to the nearest int with a minimum values of 1
 
+    All the competitors of the tournament are drawn at once with numpy and
+    the winner is the first competitor with the best score.
+
     Inputs:
     :param list list_of_ligands: The list of lists containing info about
         ligands with scores to select from.
     :param int num_per_tourn: the number of ligands to be tested in each
         tournament.
-    :param int idx_to_sel: the idx within each sublist which will serve as
-        the metric for each tournament.
+    :param numpy.array scores: the metric of each ligand which the
+        tournament is decided by.
     :param bol favor_most_negative: True if the most negative number is
         the best solution. False if the most positive number is the best
         solution default to True.
@@ -112,23 +115,16 @@ def run_one_tournament(list_of_ligands, num_per_tourn, idx_to_sel,
 
     num_ligands = len(list_of_ligands)
 
-    chosen_option = []
-    temp = []
-    for i in range(0, num_per_tourn):
-        temp.append(i)
-        if i == 0:
-            chosen_option = list_of_ligands[random.randint(0, num_ligands - 1)]
-        else:
-            choice = list_of_ligands[random.randint(0, num_ligands - 1)]
-            if favor_most_negative is True:
-                if float(chosen_option[idx_to_sel]) > float(choice[idx_to_sel]):
-                    chosen_option = choice
-                else:
-                    continue
-            elif favor_most_negative is False:
-                if float(chosen_option[idx_to_sel]) < float(choice[idx_to_sel]):
-                    chosen_option = choice
-                else:
-                    continue
+    if num_per_tourn <= 0:
+        chosen_option = []
+        return chosen_option
+
+    competitors = numpy.random.randint(0, num_ligands, size=num_per_tourn)
+    if favor_most_negative is True:
+        winner = competitors[numpy.argmin(scores[competitors])]
+    else:
+        winner = competitors[numpy.argmax(scores[competitors])]
+
+    chosen_option = list_of_ligands[winner]
 
     return chosen_option
@@ -0,0 +1,736 @@
+"""
+This script rescores docked poses with NNScore 1.0 and NNScore 2.0 without
+starting a new python interpreter for every ligand.
+
+Running NNScore1.py or NNScore2.py as a program reloads the receptor,
+reassigns its charges, aromatic rings and secondary structure, and reloads
+the neural networks for every .pdbqt.vina file. Here the NNScore scripts
+are imported instead and an engine holding the loaded receptor and networks
+is kept per process, so a worker only does that work once and then scores
+every file it is given.
+
+The networks are converted to numpy weight matrices so every network is run
+on every pose of a file in a few matrix multiplications rather than one unit
+at a time.
+
+The engines write .nn1 and .nn2 files with the same score lines the NNScore
+programs print, so the NN1 and NN2 scoring classes read them unchanged.
+"""
+import __future__
+
+import os
+import io
+import contextlib
+import importlib.util
+import math
+
+import numpy
+
+import autogrow.docking.scoring.nn_score_exe.vina_terms as VinaTerms
+
+# Engines already made by this process. The keys are (engine type, script
+# path, receptor path, receptor modification time, extra setting) so a
+# changed receptor file is reloaded.
+NN_ENGINE_CACHE = {}
+
+
+def load_nnscore_module(script_path, module_name):
+    """
+    Import an NNScore script as a module. The command-line part of the
+    scripts only runs when they are executed directly so importing them
+    only defines their classes and functions.
+
+    Inputs:
+    :param str script_path: the path to NNScore.py or NNScore2.py
+    :param str module_name: the name to give the imported module
+
+    Returns:
+    :returns: module nnscore_module: the imported NNScore script
+    """
+
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    nnscore_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(nnscore_module)
+
+    return nnscore_module
+
+
+def get_engine(engine_class, script_path, receptor_file, extra_setting):
+    """
+    Get the engine of this process for a receptor, making it if this is the
+    first time this process has needed it.
+
+    Inputs:
+    :param class engine_class: NN1Engine or NN2Engine
+    :param str script_path: the path to NNScore.py or NNScore2.py
+    :param str receptor_file: the path to the receptor pdbqt file
+    :param extra_setting: the networks folder for NN1 or a tuple of the
+        vina executable and the --nn2_vina_terms choice for NN2
+
+    Returns:
+    :returns: object engine: an NN1Engine or NN2Engine ready to score files
+    """
+
+    script_path = os.path.abspath(script_path.replace('"', ""))
+    receptor_file = os.path.abspath(receptor_file.replace('"', ""))
+
+    key = (
+        engine_class.__name__,
+        script_path,
+        receptor_file,
+        os.path.getmtime(receptor_file),
+        extra_setting,
+    )
+    if key not in NN_ENGINE_CACHE.keys():
+        NN_ENGINE_CACHE[key] = engine_class(script_path, receptor_file, extra_setting)
+
+    return NN_ENGINE_CACHE[key]
+
+
+def get_nn1_engine(vars):
+    """
+    Get the NN1 engine of this process for the receptor in vars.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: object engine: an NN1Engine ready to score files
+    """
+
+    nn1_script = vars["nn1_script"].replace('"', "")
+    networks_dir = (
+        os.path.dirname(nn1_script)
+        + os.sep
+        + "networks"
+        + os.sep
+        + "top_3_networks"
+        + os.sep
+    )
+
+    return get_engine(
+        NN1Engine, nn1_script, vars["filename_of_receptor"] + "qt", networks_dir
+    )
+
+
+def get_nn2_engine(vars):
+    """
+    Get the NN2 engine of this process for the receptor in vars.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: object engine: an NN2Engine ready to score files
+    """
+
+    if "nn2_vina_terms" in vars.keys():
+        vina_terms_choice = vars["nn2_vina_terms"]
+    else:
+        vina_terms_choice = "VinaScoreOnly"
+
+    return get_engine(
+        NN2Engine,
+        vars["nn2_script"],
+        vars["filename_of_receptor"] + "qt",
+        (vars["docking_executable"], vina_terms_choice),
+    )
+
+
+def make_network_matrices(conec, weights, inno, eni, outno, deo, bias_unit):
+    """
+    Convert a feed-forward network in the connection list format used by
+    both NNScore scripts into dense numpy matrices.
+
+    Every non-input unit is placed in a layer one deeper than its deepest
+    source, so a whole layer can be computed with one matrix multiplication
+    once the layers before it are done.
+
+    Inputs:
+    :param list conec: a list of [source unit, target unit] pairs
+    :param list weights: the weight of each connection in conec
+    :param list inno: the unit of each network input
+    :param list eni: a list of [scale, offset] normalizing each input
+    :param list outno: the unit of each network output
+    :param list deo: a list of [scale, offset] denormalizing each output
+    :param int bias_unit: the source unit number which means a bias
+        (-1 for NNScore 1.0, 0 for NNScore 2.0)
+
+    Returns:
+    :returns: dict network: a dictionary of numpy arrays describing the
+        network. Networks with the same "signature" have the same shape and
+        can be stacked.
+    """
+
+    unit_numbers = set(inno) | set(outno)
+    for src, trg in conec:
+        unit_numbers.add(trg)
+        if src != bias_unit:
+            unit_numbers.add(src)
+    unit_positions = {}
+    for unit in sorted(unit_numbers):
+        unit_positions[unit] = len(unit_positions)
+
+    # Assign each target unit to a layer. Connections are ordered by target
+    # with the sources of a unit always computed before it.
+    unit_layer = {}
+    for unit in inno:
+        unit_layer[unit] = 0
+    for src, trg in conec:
+        src_layer = 0 if src == bias_unit else unit_layer.get(src, 0)
+        unit_layer[trg] = max(unit_layer.get(trg, 1), src_layer + 1)
+
+    layer_targets = {}
+    for src, trg in conec:
+        layer = unit_layer[trg]
+        if layer not in layer_targets.keys():
+            layer_targets[layer] = []
+        if trg not in layer_targets[layer]:
+            layer_targets[layer].append(trg)
+
+    layers = []
+    for layer in sorted(layer_targets.keys()):
+        targets = layer_targets[layer]
+        target_rows = {}
+        for trg in targets:
+            target_rows[trg] = len(target_rows)
+        weight_matrix = numpy.zeros((len(targets), len(unit_positions)))
+        bias_vector = numpy.zeros(len(targets))
+        for (src, trg), weight in zip(conec, weights):
+            if trg not in target_rows.keys():
+                continue
+            if src == bias_unit:
+                bias_vector[target_rows[trg]] += weight
+            else:
+                weight_matrix[target_rows[trg], unit_positions[src]] += weight
+        target_positions = numpy.array([unit_positions[trg] for trg in targets])
+        layers.append([target_positions, weight_matrix, bias_vector])
+
+    network = {
+        "num_units": len(unit_positions),
+        "input_positions": numpy.array([unit_positions[unit] for unit in inno]),
+        "input_scale": numpy.array([pair[0] for pair in eni], dtype=float),
+        "input_offset": numpy.array([pair[1] for pair in eni], dtype=float),
+        "layers": layers,
+        "output_positions": numpy.array([unit_positions[unit] for unit in outno]),
+        "output_scale": numpy.array([pair[0] for pair in deo], dtype=float),
+        "output_offset": numpy.array([pair[1] for pair in deo], dtype=float),
+    }
+    network["signature"] = (
+        network["num_units"],
+        tuple(network["input_positions"]),
+        tuple([tuple(layer[0]) for layer in layers]),
+        tuple(network["output_positions"]),
+    )
+
+    return network
+
+
+class NetworkEnsemble(object):
+    """
+    Runs a list of networks on a batch of input vectors. Networks with the
+    same shape are stacked so each of their layers is a single batched
+    matrix multiplication.
+    """
+
+    def __init__(self, networks):
+        """
+        Inputs:
+        :param list networks: the networks from make_network_matrices(), in
+            the order their outputs should be returned
+        """
+
+        self.num_networks = len(networks)
+        self.num_outputs = len(networks[0]["output_positions"])
+
+        groups = {}
+        for position, network in enumerate(networks):
+            if len(network["output_positions"]) != self.num_outputs:
+                raise Exception("All networks in an ensemble need the same number of outputs.")
+            if network["signature"] not in groups.keys():
+                groups[network["signature"]] = []
+            groups[network["signature"]].append(position)
+
+        self.groups = []
+        for signature in groups.keys():
+            positions = groups[signature]
+            nets = [networks[position] for position in positions]
+            layers = []
+            for layer_index in range(len(nets[0]["layers"])):
+                layers.append(
+                    [
+                        nets[0]["layers"][layer_index][0],
+                        numpy.stack([net["layers"][layer_index][1] for net in nets]),
+                        numpy.stack([net["layers"][layer_index][2] for net in nets]),
+                    ]
+                )
+            self.groups.append(
+                {
+                    "positions": numpy.array(positions),
+                    "num_units": nets[0]["num_units"],
+                    "input_positions": nets[0]["input_positions"],
+                    "input_scale": numpy.stack([net["input_scale"] for net in nets]),
+                    "input_offset": numpy.stack([net["input_offset"] for net in nets]),
+                    "layers": layers,
+                    "output_positions": nets[0]["output_positions"],
+                    "output_scale": numpy.stack([net["output_scale"] for net in nets]),
+                    "output_offset": numpy.stack([net["output_offset"] for net in nets]),
+                }
+            )
+
+    def evaluate(self, input_vectors):
+        """
+        Run every network on every input vector.
+
+        The NNScore scripts use math.exp, which raises an OverflowError
+        instead of returning inf. Those cases are reported in overflowed so
+        the callers can handle them the same way the scripts do.
+
+        Inputs:
+        :param list input_vectors: a list of input vectors (one per pose)
+
+        Returns:
+        :returns: numpy.array outputs: the outputs of each network for each
+            input, with shape (networks, inputs, outputs)
+        :returns: numpy.array overflowed: True where math.exp would have
+            overflowed, with shape (networks, inputs)
+        """
+
+        num_inputs = len(input_vectors)
+        outputs = numpy.zeros((self.num_networks, num_inputs, self.num_outputs))
+        overflowed = numpy.zeros((self.num_networks, num_inputs), dtype=bool)
+        if num_inputs == 0:
+            return outputs, overflowed
+
+        for group in self.groups:
+            num_used = len(group["input_positions"])
+            inputs = numpy.array(
+                [list(vector)[:num_used] for vector in input_vectors], dtype=float
+            )
+
+            units = numpy.zeros((len(group["positions"]), num_inputs, group["num_units"]))
+            units[:, :, group["input_positions"]] = (
+                inputs[numpy.newaxis, :, :] * group["input_scale"][:, numpy.newaxis, :]
+                + group["input_offset"][:, numpy.newaxis, :]
+            )
+
+            group_overflowed = numpy.zeros((len(group["positions"]), num_inputs), dtype=bool)
+            for target_positions, weight_matrices, bias_vectors in group["layers"]:
+                activations = (
+                    numpy.matmul(units, weight_matrices.transpose(0, 2, 1))
+                    + bias_vectors[:, numpy.newaxis, :]
+                )
+                with numpy.errstate(over="ignore"):
+                    exp_activations = numpy.exp(-activations)
+                group_overflowed = group_overflowed | numpy.isinf(exp_activations).any(axis=2)
+                units[:, :, target_positions] = 1.0 / (1.0 + exp_activations)
+
+            outputs[group["positions"]] = (
+                units[:, :, group["output_positions"]]
+                * group["output_scale"][:, numpy.newaxis, :]
+                + group["output_offset"][:, numpy.newaxis, :]
+            )
+            overflowed[group["positions"]] = group_overflowed
+
+        return outputs, overflowed
+
+
+class NN1Engine(object):
+    """
+    Scores .pdbqt.vina files with NNScore 1.0 using a receptor and networks
+    which are loaded once.
+    """
+
+    def __init__(self, script_path, receptor_file, networks_dir):
+        """
+        Import NNScore.py and load the receptor and the networks.
+
+        Inputs:
+        :param str script_path: the path to NNScore.py
+        :param str receptor_file: the path to the receptor pdbqt file
+        :param str networks_dir: the folder holding the network files
+        """
+
+        self.nnscore = load_nnscore_module(script_path, "autogrow_nnscore1")
+        # Complex uses this global when printing steric clash warnings
+        self.nnscore.receptor_name = receptor_file
+
+        self.receptor = self.nnscore.PDB()
+        self.receptor.LoadPDB(receptor_file)
+
+        # Same order as the -networks_dir option of NNScore.py
+        networks = []
+        for filename in os.listdir(networks_dir):
+            if os.path.isfile(networks_dir + filename):
+                net = self.nnscore.FFNet(networks_dir + filename)
+                networks.append(
+                    make_network_matrices(
+                        net.conec, net.weights, net.inno, net.eni, net.outno, net.deo, -1
+                    )
+                )
+        self.ensemble = NetworkEnsemble(networks)
+
+    def get_pose_complex(self, pose_lines):
+        """
+        Measure the receptor-ligand interactions of a single pose.
+
+        Inputs:
+        :param list pose_lines: the stripped pdbqt lines of the pose
+
+        Returns:
+        :returns: object acomplex: the NNScore.py Complex of the pose
+        :returns: str printout: any warnings NNScore printed
+        """
+
+        printout = io.StringIO()
+        with contextlib.redirect_stdout(printout):
+            ligand = self.nnscore.PDB()
+            ligand.LoadPDB_from_list(pose_lines)
+            acomplex = self.nnscore.Complex(ligand, self.receptor)
+
+        return acomplex, printout.getvalue()
+
+    def score_poses(self, complexes):
+        """
+        Score a list of poses. This matches process_ligand() in NNScore.py.
+
+        Inputs:
+        :param list complexes: the Complex of each pose
+
+        Returns:
+        :returns: list average_scores: the average score of the networks for
+            each pose or -999999.9 if the networks were not trained for that
+            complex
+        """
+
+        outputs, overflowed = self.ensemble.evaluate(
+            [acomplex.nn_input for acomplex in complexes]
+        )
+        if overflowed.any():
+            # NNScore.py can not score these poses either
+            raise OverflowError("math range error")
+
+        average_scores = []
+        for pose_index, acomplex in enumerate(complexes):
+            total = 0
+            for net_index in range(self.ensemble.num_networks):
+                score = float(outputs[net_index, pose_index, 0] - outputs[net_index, pose_index, 1])
+                total = total + score
+            average_score = total / self.ensemble.num_networks
+
+            if acomplex.bad_training != "":
+                average_score = -999999.9
+            average_scores.append(average_score)
+
+        return average_scores
+
+    def score_vina_file(self, vina_output_file):
+        """
+        Score every pose in a vina output file. Poses are split on the MODEL
+        lines, the same way NNScore.py does with -vina_output.
+
+        Inputs:
+        :param str vina_output_file: Path to a vina output file to be rescored
+
+        Returns:
+        :returns: str output: the text NNScore.py would report, ending with
+            the "Best score:" line read by the NN1 scoring class
+        """
+
+        with open(vina_output_file, "r") as f:
+            lines = f.readlines()
+
+        # Group the lines of each pose
+        poses = []
+        thelines = []
+        label = ""
+        for line in lines:
+            if "MODEL " in line:
+                if len(thelines) != 0:
+                    poses.append([label, thelines])
+                thelines = [line.strip()]
+                label = line.strip()
+            else:
+                thelines.append(line.strip())
+        poses.append([label, thelines])
+
+        complexes = []
+        printouts = []
+        for label, pose_lines in poses:
+            acomplex, printout = self.get_pose_complex(pose_lines)
+            if acomplex.bad_training != "":
+                printout = printout + acomplex.bad_training + "\n"
+            complexes.append(acomplex)
+            printouts.append(printout)
+        average_scores = self.score_poses(complexes)
+
+        output = []
+        best_binder = -10000000.0
+        best_binder_name = ""
+        for pose_index, (label, pose_lines) in enumerate(poses):
+            name = vina_output_file + ", " + label
+            average_score = average_scores[pose_index]
+            printout = printouts[pose_index]
+            if best_binder < average_score:
+                best_binder = average_score
+                best_binder_name = name
+
+            output.append("Ligand: " + name)
+            if printout != "":
+                output.append(printout)
+            output.append("\tAverage score:  {}".format(average_score))
+            output.append("")
+
+        output.append("Best score: {} ({})".format(best_binder, best_binder_name))
+
+        return "\n".join(output) + "\n"
+
+
+class NN2Parameters(object):
+    """
+    Stands in for the command_line_parameters class of NNScore2.py, which
+    parses sys.argv. binana only reads how to get the Vina terms from it.
+    """
+
+    def __init__(self, vina_executable, vina_terms_choice, receptor_file):
+        """
+        Inputs:
+        :param str vina_executable: the path to the vina executable
+        :param str vina_terms_choice: "VinaScoreOnly" to run vina
+            --score_only on every pose or "PythonVinaTerms" to calculate the
+            same terms in python
+        :param str receptor_file: the path to the receptor pdbqt file
+        """
+
+        self.params = {"vina_executable": vina_executable}
+
+        if vina_terms_choice == "PythonVinaTerms":
+            self.vina_term_calculator = VinaTerms.VinaTermCalculator(receptor_file)
+            self.params[
+                "vina_score_only_function"
+            ] = self.vina_term_calculator.score_only_output
+        elif vina_terms_choice != "VinaScoreOnly":
+            raise Exception(
+                "nn2_vina_terms must be VinaScoreOnly or PythonVinaTerms, not {}".format(
+                    vina_terms_choice
+                )
+            )
+
+
+class NN2Engine(object):
+    """
+    Scores .pdbqt.vina files with NNScore 2.0 using a receptor and networks
+    which are loaded once.
+    """
+
+    def __init__(self, script_path, receptor_file, vina_settings):
+        """
+        Import NNScore2.py and load the receptor and the 20 networks. The
+        secondary structure of the receptor is assigned here so every ligand
+        reuses it.
+
+        Inputs:
+        :param str script_path: the path to NNScore2.py
+        :param str receptor_file: the path to the receptor pdbqt file
+        :param tuple vina_settings: the path to the vina executable and the
+            --nn2_vina_terms choice
+        """
+
+        self.nnscore = load_nnscore_module(script_path, "autogrow_nnscore2")
+        self.parameters = NN2Parameters(
+            vina_settings[0], vina_settings[1], receptor_file
+        )
+
+        printout = io.StringIO()
+        with contextlib.redirect_stdout(printout):
+            self.receptor = self.nnscore.PDB()
+            self.receptor.LoadPDB_from_file(receptor_file)
+            self.receptor.OrigFileName = receptor_file
+            self.receptor.assign_secondary_structure()
+
+        # NNScore2.py stores its networks as 1-indexed dictionaries
+        networks = []
+        for net_array in self.nnscore.networks():
+            networks.append(
+                make_network_matrices(
+                    [
+                        [net_array["conec"][xn][1], net_array["conec"][xn][2]]
+                        for xn in range(1, len(net_array["conec"]) + 1)
+                    ],
+                    [net_array["weights"][xn] for xn in range(1, len(net_array["conec"]) + 1)],
+                    [net_array["inno"][k] for k in range(1, len(net_array["inno"]) + 1)],
+                    [
+                        [net_array["eni"][k][1], net_array["eni"][k][2]]
+                        for k in range(1, len(net_array["inno"]) + 1)
+                    ],
+                    [net_array["outno"][k] for k in range(1, len(net_array["outno"]) + 1)],
+                    [
+                        [net_array["deo"][k][1], net_array["deo"][k][2]]
+                        for k in range(1, len(net_array["outno"]) + 1)
+                    ],
+                    0,
+                )
+            )
+        self.ensemble = NetworkEnsemble(networks)
+
+    def get_pose_input_vector(self, lig_array, temp_filename, line_header):
+        """
+        Measure the receptor-ligand interactions of a single pose with binana.
+
+        Inputs:
+        :param list lig_array: the pdbqt lines of the pose
+        :param str temp_filename: the file the pose is written to so vina
+            can score it
+        :param str line_header: the text put at the start of each line
+
+        Returns:
+        :returns: list input_vector: the network inputs of the pose
+        """
+
+        printout = io.StringIO()
+        with contextlib.redirect_stdout(printout):
+            d = self.nnscore.binana(
+                lig_array,
+                self.receptor,
+                self.parameters,
+                line_header,
+                temp_filename,
+                self.receptor.OrigFileName,
+            )
+
+        return d.input_vector
+
+    def get_pose_output(self, network_scores, network_overflowed, line_header):
+        """
+        Make the lines calculate_score() in NNScore2.py prints for a pose.
+
+        Inputs:
+        :param numpy.array network_scores: the score of each network
+        :param numpy.array network_overflowed: True for the networks which
+            could not score the pose because of an overflow error
+        :param str line_header: the text put at the start of each line
+
+        Returns:
+        :returns: list output: the lines NNScore2.py prints for this pose
+        """
+
+        output = []
+        scores = []
+        total = 0.0
+        for net_index in range(self.ensemble.num_networks):
+            if bool(network_overflowed[net_index]) is True:
+                output.append(
+                    line_header
+                    + "The output of network #"
+                    + str(len(scores) + 1)
+                    + " could not be determined because of an overflow error!"
+                )
+                continue
+
+            val = float(network_scores[net_index])
+            output.append(
+                line_header
+                + "Network #"
+                + str(len(scores) + 1)
+                + " gave a score of "
+                + str(round(val, 3))
+                + " ("
+                + self.nnscore.score_to_kd(val)
+                + ")"
+            )
+            scores.append(val)
+            total = total + val
+
+        if len(scores) == 0:
+            output.append(
+                line_header
+                + "Could not compute the score of this receptor-ligand complex"
+                + " because none of the networks returned a valid score."
+            )
+            return output
+
+        average = total / len(scores)
+        best_score = 0.0
+        sum = 0.0
+        for score in scores:
+            if score > best_score:
+                best_score = score
+            sum = sum + math.pow(score - average, 2)
+        stdev = math.pow(sum / (len(scores) - 1), 0.5)
+
+        # These are printed as tuples by NNScore2.py and the NN2 scoring
+        # class reads the score from that format
+        output.append("")
+        output.append(
+            str(
+                (
+                    line_header + "Best Score:         ",
+                    round(best_score, 3),
+                    "(" + self.nnscore.score_to_kd(best_score) + ")",
+                )
+            )
+        )
+        output.append(
+            str(
+                (
+                    line_header + "Average Score:      ",
+                    round(average, 3),
+                    "(" + self.nnscore.score_to_kd(average) + ")",
+                )
+            )
+        )
+        output.append(str((line_header + "Standard Deviation: ", round(stdev, 3))))
+        output.append("")
+
+        return output
+
+    def score_vina_file(self, lig):
+        """
+        Score every pose in a ligand file. Poses are split on the ENDMDL
+        lines, the same way NNScore2.py does with -ligand.
+
+        Inputs:
+        :param str lig: Path to the pdbqt file to be rescored
+
+        Returns:
+        :returns: str output: the per pose results NNScore2.py would report
+        """
+
+        with open(lig, "r") as f:
+            lines = f.readlines()
+
+        input_vectors = []
+        lig_array = []
+        model_id = 1
+        # The empty string marks the end of the file, like f.readline() in
+        # NNScore2.py
+        for line in lines + [""]:
+            if line[:6] != "ENDMDL":
+                lig_array.append(line)
+            if line[:6] == "ENDMDL" or len(line) == 0:
+                if len(lig_array) != 0 and lig_array != [""]:
+                    temp_filename = lig + ".MODEL_" + str(model_id) + ".pdbqt"
+                    try:
+                        input_vectors.append(
+                            self.get_pose_input_vector(lig_array, temp_filename, "\t")
+                        )
+                    finally:
+                        if os.path.exists(temp_filename) is True:
+                            os.remove(temp_filename)
+
+                    lig_array = []
+                    model_id = model_id + 1
+
+        # Every network scores every pose at once
+        outputs, overflowed = self.ensemble.evaluate(input_vectors)
+
+        output = []
+        for pose_index in range(len(input_vectors)):
+            output.append("MODEL " + str(pose_index + 1))
+            output.extend(
+                self.get_pose_output(
+                    outputs[:, pose_index, 0], overflowed[:, pose_index], "\t"
+                )
+            )
+
+        return "\n".join(output) + "\n"
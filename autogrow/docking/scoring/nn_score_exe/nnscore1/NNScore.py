@@ -8,6 +8,7 @@ import __future__
 import sys
 import math
 import time
+import numpy
 import os
 import random
 
@@ -439,6 +440,8 @@ class PDB:
 
     def __init__ (self):
         self.AllAtoms = {}
+        self.coordinate_array = None
+        self.coordinate_array_indices = []
 
     def LoadPDB(self, FileName):
 
@@ -452,6 +455,36 @@ class PDB:
         self.LoadPDB_from_list(lines)
 
 
+    def get_coordinate_array(self):
+        # The coordinates of all the atoms as a numpy array, in the same
+        # order as AllAtoms. This is only built once, as a receptor is
+        # reused for every ligand pose.
+        if self.coordinate_array is None:
+            self.coordinate_array_indices = list(self.AllAtoms.keys())
+            self.coordinate_array = numpy.array([[self.AllAtoms[index].coordinates.x, self.AllAtoms[index].coordinates.y, self.AllAtoms[index].coordinates.z] for index in self.coordinate_array_indices], dtype=float).reshape(-1, 3)
+        return self.coordinate_array
+
+    def indices_of_atoms_near(self, coordinates, cutoff):
+        # For each row of coordinates (an N x 3 numpy array), get the AllAtoms
+        # indices of the atoms that may be closer than cutoff, in AllAtoms
+        # order. A small margin is added so that rounding differences never
+        # drop an atom; callers still check the exact distance with dist_to.
+        atom_coordinates = self.get_coordinate_array()
+        cutoff = cutoff + 0.01
+        near_indices = [[] for i in range(len(coordinates))]
+        if len(atom_coordinates) == 0 or len(coordinates) == 0: return near_indices
+
+        # Only atoms inside the box around coordinates need distances
+        in_box = numpy.all((atom_coordinates >= coordinates.min(axis=0) - cutoff) & (atom_coordinates <= coordinates.max(axis=0) + cutoff), axis=1)
+        box_positions = numpy.nonzero(in_box)[0]
+        if len(box_positions) == 0: return near_indices
+
+        deltas = coordinates[:, numpy.newaxis, :] - atom_coordinates[box_positions][numpy.newaxis, :, :]
+        close = numpy.sum(deltas * deltas, axis=2) < cutoff * cutoff
+        for row, position in zip(*numpy.nonzero(close)):
+            near_indices[row].append(self.coordinate_array_indices[box_positions[position]])
+        return near_indices
+
     def print_out_info(self):
         for index in self.AllAtoms:
             print(self.AllAtoms[index].CreatePDBLine())
@@ -460,6 +493,7 @@ class PDB:
 
         autoindex = 1
         self.entropy_count = 0
+        self.coordinate_array = None
 
         '''for line in file.readlines():
             if "between atoms" in line and " A " in line:
@@ -589,10 +623,14 @@ class Complex:
         for key in lig_types_combos:
             self.lig_types[key] = 0
 
-        # Here you could remove receptor atoms that are far from the ligand... not currently implemented, but would speed things up a bit.
         self.bad_training = ""
 
-        for ligand_index in ligand.AllAtoms:
+        # Only receptor atoms within 4 A of a ligand atom contribute, so those
+        # are found for every ligand atom at once with numpy rather than
+        # measuring the distance to every receptor atom.
+        receptor_atoms_near_ligand = receptor.indices_of_atoms_near(ligand.get_coordinate_array(), 4.0)
+
+        for ligand_position, ligand_index in enumerate(ligand.AllAtoms):
             ligand_atom = ligand.AllAtoms[ligand_index]
 
             # also keep track of the different ligand types
@@ -603,7 +641,7 @@ class Complex:
             else:
                 self.lig_types[lig_type] = self.lig_types[lig_type] + 1
 
-            for receptor_index in receptor.AllAtoms:
+            for receptor_index in receptor_atoms_near_ligand[ligand_position]:
                 receptor_atom = receptor.AllAtoms[receptor_index]
                 dist = ligand_atom.coordinates.dist_to(receptor_atom.coordinates)
                 if dist < 0.5: print("There may be steric clashes between " +ligand_name + ", " + receptor_name)
@@ -670,375 +708,378 @@ ligand_name = ""
 vina_output = ""
 autodock_output = ""
 
-for index in range(1,len(sys.argv)):
-    var = sys.argv[index].strip()
-    if var.upper() == "-RECEPTOR": receptor_name = sys.argv[index+1]
-    if var.upper() == "-LIGAND": ligand_name = sys.argv[index+1]
-    if var.upper() == "-VINA_OUTPUT": vina_output = sys.argv[index+1]
-    if var.upper() == "-AUTODOCK_OUTPUT": autodock_output = sys.argv[index+1]  ###### ADD TO USER MANUAL #####
-    if var.upper() == "-NETWORK": networks.append(sys.argv[index+1])
-    if var.upper() == "-NETWORKS_DIR": # a directory containing only networks
-        sys.argv[index+1] = sys.argv[index+1].replace("\\","/")
-        if sys.argv[index+1][-1:] != "/": sys.argv[index+1] = sys.argv[index+1] + "/"
-        for filename in os.listdir(sys.argv[index+1]):
-            if os.path.isfile(sys.argv[index+1] + filename): networks.append(sys.argv[index+1] + filename)
-
-print("")
-print("NNScore " + version)
-print("")
-print(program_info)
-print("")
-print("If you use NNScore in your research, please cite the following reference:")
-print("  NNScore: A Neural-Network-Based Scoring Function for the Characterization")
-print("  of Protein-Ligand Complexes. Jacob D. Durrant, J. Andrew McCammon. Journal")
-print("  of Chemical Information and Modeling, 2010, 50 (10), pp 1865-1871.")
-print("")
-
-error = False
-if receptor_name == "":
-    error = True
-    extra_message = "Error! Required parameters were not passed to NNScore!"
-if len(networks) == 0:
-    error = True
-    extra_message = "Error! Required parameters were not passed to NNScore!"
-if ligand_name == "" and vina_output == "" and autodock_output == "":
-    error = True
-    extra_message = "Error! Required parameters were not passed to NNScore!"
-if ligand_name != "" and vina_output != "":
-    error = True
-    extra_message = "Error! You cannot use both -ligand and -vina_output!"
-if ligand_name != "" and autodock_output != "":
-    error = True
-    extra_message = "Error! You cannot use both -ligand and -autodock_output!"
-if autodock_output != "" and vina_output != "":
-    error = True
-    extra_message = "Error! You cannot use both -autodock_output and -vina_output!"
-
-if error is True:
-    print(extra_message)
-    print("\nParameters are:")
-    print("\t-receptor <pdbqt filename>")
-    print("\t-ligand <pdbqt filename>")
-    print("\t-vina_output <vina output filename>")
-    print("\t-autodock_output <autodock output filename>")
-    print("\t-network <network filename>")
-    print("\t-networks_dir <directory>")
+# The command-line program only runs when this file is executed directly so
+# the classes above can be imported (ie. by AutoGrow4's rescoring engine).
+if __name__ == "__main__":
+    for index in range(1,len(sys.argv)):
+        var = sys.argv[index].strip()
+        if var.upper() == "-RECEPTOR": receptor_name = sys.argv[index+1]
+        if var.upper() == "-LIGAND": ligand_name = sys.argv[index+1]
+        if var.upper() == "-VINA_OUTPUT": vina_output = sys.argv[index+1]
+        if var.upper() == "-AUTODOCK_OUTPUT": autodock_output = sys.argv[index+1]  ###### ADD TO USER MANUAL #####
+        if var.upper() == "-NETWORK": networks.append(sys.argv[index+1])
+        if var.upper() == "-NETWORKS_DIR": # a directory containing only networks
+            sys.argv[index+1] = sys.argv[index+1].replace("\\","/")
+            if sys.argv[index+1][-1:] != "/": sys.argv[index+1] = sys.argv[index+1] + "/"
+            for filename in os.listdir(sys.argv[index+1]):
+                if os.path.isfile(sys.argv[index+1] + filename): networks.append(sys.argv[index+1] + filename)
+
     print("")
-    print("Note: It is best to use multiple neural networks to judge ligand binding by")
-    print("consensus. Commandline parameters can be used to add neural-network files")
-    print("to the list of those that will be used. To add a single neural network to")
-    print("the list, use the -network parameter to specify a single network file. To")
-    print("add mutliple networks to the list, create a directory containing only")
-    print("network files and specify the path to that directory using the -networks_dir")
-    print("parameter.")
+    print("NNScore " + version)
     print("")
-    print("Note: Only pdbqt files of the receptor and ligand are accepted. Scripts to")
-    print("convert from pdb to pdbqt are included in the AutoDockTools package:")
-    print("http://autodock.scripps.edu/resources/adt")
+    print(program_info)
     print("")
-    print("Note: If an AutoDock Vina or AutoDock output file is specified, NNScore will")
-    print("evaluate all docked poses and return the best NNScore calculated. To score an")
-    print("AutoDock output file, modify the mglenv and prepare_ligand4_location variables")
-    print("at the begining of this python file.")
+    print("If you use NNScore in your research, please cite the following reference:")
+    print("  NNScore: A Neural-Network-Based Scoring Function for the Characterization")
+    print("  of Protein-Ligand Complexes. Jacob D. Durrant, J. Andrew McCammon. Journal")
+    print("  of Chemical Information and Modeling, 2010, 50 (10), pp 1865-1871.")
     print("")
-    print("Examples:")
-    print("\t python NNScore.py -receptor neuraminidase.pdbqt -ligand oseltamivir.pdbqt -network ./networks/top_3_networks/12.net")
-    print("\t python NNScore.py -receptor integrase.pdbqt -ligand raltegravir.pdbqt -networks_dir ./networks/top_3_networks/")
-    print("\t python NNScore.py -receptor integrase.pdbqt -vina_output docked_poses.vina.out -networks_dir ./networks/top_3_networks/")
-    print("\t python NNScore.py -receptor integrase.pdbqt -autodock_output docked_poses.autodock.out -networks_dir ./networks/top_3_networks/")
-    print("\t python NNScore.py -receptor protease.pdbqt -ligand tipranavir.pdbqt -networks_dir ./networks/top_24_networks/ -network ./networks/top_3_networks/16.net")
+
+    error = False
+    if receptor_name == "":
+        error = True
+        extra_message = "Error! Required parameters were not passed to NNScore!"
+    if len(networks) == 0:
+        error = True
+        extra_message = "Error! Required parameters were not passed to NNScore!"
+    if ligand_name == "" and vina_output == "" and autodock_output == "":
+        error = True
+        extra_message = "Error! Required parameters were not passed to NNScore!"
+    if ligand_name != "" and vina_output != "":
+        error = True
+        extra_message = "Error! You cannot use both -ligand and -vina_output!"
+    if ligand_name != "" and autodock_output != "":
+        error = True
+        extra_message = "Error! You cannot use both -ligand and -autodock_output!"
+    if autodock_output != "" and vina_output != "":
+        error = True
+        extra_message = "Error! You cannot use both -autodock_output and -vina_output!"
+
+    if error is True:
+        print(extra_message)
+        print("\nParameters are:")
+        print("\t-receptor <pdbqt filename>")
+        print("\t-ligand <pdbqt filename>")
+        print("\t-vina_output <vina output filename>")
+        print("\t-autodock_output <autodock output filename>")
+        print("\t-network <network filename>")
+        print("\t-networks_dir <directory>")
+        print("")
+        print("Note: It is best to use multiple neural networks to judge ligand binding by")
+        print("consensus. Commandline parameters can be used to add neural-network files")
+        print("to the list of those that will be used. To add a single neural network to")
+        print("the list, use the -network parameter to specify a single network file. To")
+        print("add mutliple networks to the list, create a directory containing only")
+        print("network files and specify the path to that directory using the -networks_dir")
+        print("parameter.")
+        print("")
+        print("Note: Only pdbqt files of the receptor and ligand are accepted. Scripts to")
+        print("convert from pdb to pdbqt are included in the AutoDockTools package:")
+        print("http://autodock.scripps.edu/resources/adt")
+        print("")
+        print("Note: If an AutoDock Vina or AutoDock output file is specified, NNScore will")
+        print("evaluate all docked poses and return the best NNScore calculated. To score an")
+        print("AutoDock output file, modify the mglenv and prepare_ligand4_location variables")
+        print("at the begining of this python file.")
+        print("")
+        print("Examples:")
+        print("\t python NNScore.py -receptor neuraminidase.pdbqt -ligand oseltamivir.pdbqt -network ./networks/top_3_networks/12.net")
+        print("\t python NNScore.py -receptor integrase.pdbqt -ligand raltegravir.pdbqt -networks_dir ./networks/top_3_networks/")
+        print("\t python NNScore.py -receptor integrase.pdbqt -vina_output docked_poses.vina.out -networks_dir ./networks/top_3_networks/")
+        print("\t python NNScore.py -receptor integrase.pdbqt -autodock_output docked_poses.autodock.out -networks_dir ./networks/top_3_networks/")
+        print("\t python NNScore.py -receptor protease.pdbqt -ligand tipranavir.pdbqt -networks_dir ./networks/top_24_networks/ -network ./networks/top_3_networks/16.net")
+        print("")
+        sys.exit()
+
+
+    print("Receptor: "+ receptor_name)
     print("")
-    sys.exit()
 
+    def process_ligand(ligand_name, ligand, receptor):
+        global networks
+        print("Ligand: "+ ligand_name)
+        print(" = " * len("Ligand: "+ ligand_name))
+        if len(networks) == 1:
+                print("\tNetwork: ", networks[0])
+        else:
+                print("\tNetworks: ")
+                for net in networks:
+                        print("\t\t", net)
 
-print("Receptor: "+ receptor_name)
-print("")
+        print("")
 
-def process_ligand(ligand_name, ligand, receptor):
-    global networks
-    print("Ligand: "+ ligand_name)
-    print(" = " * len("Ligand: "+ ligand_name))
-    if len(networks) == 1:
-            print("\tNetwork: ", networks[0])
-    else:
-            print("\tNetworks: ")
-            for net in networks:
-                    print("\t\t", net)
+        acomplex = Complex(ligand, receptor)
+        scores = []
+
+        # describe binding
+        print("\tAtom types (one ligand, one receptor) within 2 angstroms of each other:")
+        first = 1
+        something = 1
+        for item in acomplex.proximity_2:
+                value = acomplex.proximity_2[item]
+                if value != 0:
+                        something = 0
+                        addin = ""
+                        if first != 1: addin = "; "
+                        first = 0
+
+                        print(addin + "(" + str(item.replace("_",', ')) + "), " + str(value))
+                        if value == 1:
+                                sys.stdout.write(" time")
+                        else:
+                                sys.stdout.write(" times")
+        if something == 1:
+            print("(None)")
 
-    print("")
+        print("")
+        print("")
+        print("\tAtom types (one ligand, one receptor) within 4 angstroms of each other:")
+        first = 1
+        something = 1
+        for item in acomplex.proximity_4:
+                value = acomplex.proximity_4[item]
+                if value != 0:
+                        something = 0
+                        addin = ""
+                        if first != 1: addin = "; "
+                        first = 0
+
+                        print(addin + "(" + str(item.replace("_",', ')) + "), " + str(value))
+                        if value == 1:
+                                sys.stdout.write(" time")
+                        else:
+                                sys.stdout.write(" times")
+        if something == 1: print("(None)")
+        print("")
+        print("")
+        print("\tRelative coulombic energy between atom types (one ligand, one receptor) within 4 angtroms of each other:")
+        first = 1
+        something = 1
+        for item in acomplex.coulomb_energy:
+                value = round(acomplex.coulomb_energy[item],3)
+                if value != 0:
+                        something = 0
+                        addin = ""
+                        if first != 1: addin = "; "
+                        first = 0
+
+                        print(addin + "(" + str(item.replace("_",', ')) + "), " + str(value))
+                        if value == 1:
+                                sys.stdout.write(" unit")
+                        else:
+                                sys.stdout.write(" units")
+        if something == 1: print("(None)")
+        print("")
+        print("")
+        print("\tAtom types in the ligand:")
+        first = 1
+        something = 1
+        for item in acomplex.lig_types:
+                value = acomplex.lig_types[item]
+                if value != 0:
+                        something = 0
+                        addin = ""
+                        if first != 1: addin = "; "
+                        first = 0
+
+                        print(addin + str(item.replace("_",', ')) + ", " + str(value))
+                        if value == 1:
+                                sys.stdout.write(" time")
+                        else:
+                                sys.stdout.write(" times")
+        if something == 1: print("(None)")
+        print("")
+        print("")
 
-    acomplex = Complex(ligand, receptor)
-    scores = []
-
-    # describe binding
-    print("\tAtom types (one ligand, one receptor) within 2 angstroms of each other:")
-    first = 1
-    something = 1
-    for item in acomplex.proximity_2:
-            value = acomplex.proximity_2[item]
-            if value != 0:
-                    something = 0
-                    addin = ""
-                    if first != 1: addin = "; "
-                    first = 0
-
-                    print(addin + "(" + str(item.replace("_",', ')) + "), " + str(value))
-                    if value == 1:
-                            sys.stdout.write(" time")
-                    else:
-                            sys.stdout.write(" times")
-    if something == 1:
-        print("(None)")
 
-    print("")
-    print("")
-    print("\tAtom types (one ligand, one receptor) within 4 angstroms of each other:")
-    first = 1
-    something = 1
-    for item in acomplex.proximity_4:
-            value = acomplex.proximity_4[item]
-            if value != 0:
-                    something = 0
-                    addin = ""
-                    if first != 1: addin = "; "
-                    first = 0
-
-                    print(addin + "(" + str(item.replace("_",', ')) + "), " + str(value))
-                    if value == 1:
-                            sys.stdout.write(" time")
-                    else:
-                            sys.stdout.write(" times")
-    if something == 1: print("(None)")
-    print("")
-    print("")
-    print("\tRelative coulombic energy between atom types (one ligand, one receptor) within 4 angtroms of each other:")
-    first = 1
-    something = 1
-    for item in acomplex.coulomb_energy:
-            value = round(acomplex.coulomb_energy[item],3)
-            if value != 0:
-                    something = 0
-                    addin = ""
-                    if first != 1: addin = "; "
-                    first = 0
-
-                    print(addin + "(" + str(item.replace("_",', ')) + "), " + str(value))
-                    if value == 1:
-                            sys.stdout.write(" unit")
-                    else:
-                            sys.stdout.write(" units")
-    if something == 1: print("(None)")
-    print("")
-    print("")
-    print("\tAtom types in the ligand:")
-    first = 1
-    something = 1
-    for item in acomplex.lig_types:
-            value = acomplex.lig_types[item]
-            if value != 0:
-                    something = 0
-                    addin = ""
-                    if first != 1: addin = "; "
-                    first = 0
-
-                    print(addin + str(item.replace("_",', ')) + ", " + str(value))
-                    if value == 1:
-                            sys.stdout.write(" time")
-                    else:
-                            sys.stdout.write(" times")
-    if something == 1: print("(None)")
-    print("")
-    print("")
 
+        # self.coulomb_energy = {} # where to store energy info
+        # self.proximity_2 = {} # where to store proximity info (within 2 A)
+        # self.proximity_4 = {} # where to store proximity info (within 3.5 A)
+        # self.lig_types = {}
 
 
-    # self.coulomb_energy = {} # where to store energy info
-    # self.proximity_2 = {} # where to store proximity info (within 2 A)
-    # self.proximity_4 = {} # where to store proximity info (within 3.5 A)
-    # self.lig_types = {}
+        for net in networks:
+                print("\tUsing network " + net + " to predict binding: ")
+                net_name = net
+                net = FFNet(net_name)
+                result = net.call(acomplex.nn_input)
+                score = result[0] - result[1]
+                print("\t", score)
+                scores.append(score)
+                if score < 0:
+                        print("(bad binder)")
+                else:
+                        print("(good binder)")
 
+        # compute average score
+        total = 0
+        for score in scores: total = total + score
+        average_score = total/len(scores)
 
-    for net in networks:
-            print("\tUsing network " + net + " to predict binding: ")
-            net_name = net
-            net = FFNet(net_name)
-            result = net.call(acomplex.nn_input)
-            score = result[0] - result[1]
-            print("\t", score)
-            scores.append(score)
-            if score < 0:
-                    print("(bad binder)")
-            else:
-                    print("(good binder)")
+        if acomplex.bad_training != "":
+            print(acomplex.bad_training)
+            average_score = -999999.9
 
-    # compute average score
-    total = 0
-    for score in scores: total = total + score
-    average_score = total/len(scores)
+        return average_score
 
-    if acomplex.bad_training != "":
-        print(acomplex.bad_training)
-        average_score = -999999.9
+    if ligand_name != "": # so a single pdbqt ligand was provided
+        ligand = PDB()
+        ligand.LoadPDB(ligand_name)
 
-    return average_score
+        receptor = PDB()
+        receptor.LoadPDB(receptor_name)
 
-if ligand_name != "": # so a single pdbqt ligand was provided
-    ligand = PDB()
-    ligand.LoadPDB(ligand_name)
+        average_score = process_ligand(ligand_name, ligand, receptor)
 
-    receptor = PDB()
-    receptor.LoadPDB(receptor_name)
+        print("")
+        print("Average score: ", average_score)
 
-    average_score = process_ligand(ligand_name, ligand, receptor)
+        if average_score < 0:
+                print("(bad binder)")
+        else:
+                print("(good binder)")
 
-    print("")
-    print("Average score: ", average_score)
+        print("")
 
-    if average_score < 0:
-            print("(bad binder)")
-    else:
-            print("(good binder)")
+    elif vina_output != "": # so a vina output file has been passed
+        receptor = PDB()
+        receptor.LoadPDB(receptor_name)
 
-    print("")
+        file = open(vina_output,"r")
+        lines = file.readlines()
+        file.close()
 
-elif vina_output != "": # so a vina output file has been passed
-    receptor = PDB()
-    receptor.LoadPDB(receptor_name)
-
-    file = open(vina_output,"r")
-    lines = file.readlines()
-    file.close()
-
-    thelines = []
-    label = ""
-
-    best_binder = -10000000.0
-    best_binder_name = ""
-
-    for line in lines:
-        if "MODEL " in line:
-            if len(thelines) != 0:
-
-                # so create a complex of this frame and the receptor, get the score
-                ligand = PDB()
-                ligand.LoadPDB_from_list(thelines)
-                average_score = process_ligand(vina_output + ", " +label, ligand, receptor)
-                if best_binder < average_score:
-                    best_binder = average_score
-                    best_binder_name = vina_output + ", " +label
-                print("\n\tAverage score: ", average_score)
-                if average_score < 0: print("(bad binder)")
-                else: print("(good binder)")
-                print("")
-                thelines = [line.strip()]
-
-            else: thelines = [line.strip()]
-
-            label = line.strip()
-
-        else: thelines.append(line.strip())
-
-    # so create a complex of this frame and the receptor, get the score
-    ligand = PDB()
-    ligand.LoadPDB_from_list(thelines)
-    average_score = process_ligand(vina_output + ", " +label, ligand, receptor)
-    if best_binder < average_score:
-        best_binder = average_score
-        best_binder_name = vina_output + ", " +label
-    print("\n\tAverage score: ", average_score)
-    if average_score < 0: print("(bad binder)")
-    else: print("(good binder)")
-    print("")
-    print("Best score:", best_binder,"(" + best_binder_name + ")")
-    print("")
-elif autodock_output != "":
-    receptor = PDB()
-    receptor.LoadPDB(receptor_name)
-
-    file = open(autodock_output,"r")
-    lines = file.readlines()
-    file.close()
-
-    for t in range(len(lines)):
-        if "Keeping original residue number (specified in the input PDBQ file) for outputting." in lines[t]: break
-
-    pdbs = []
-    thelines = []
-    for i in range(t+2,len(lines)):
-        line = lines[i]
-        if " l " in line:
-            print("Atom name \"l\" being interpreted as \"Cl.\"")
-            line = line.replace(' l ','Cl ')
-        if " r " in line:
-            print("Atom name \"r\" being interpreted as \"Br.\"")
-            line = line.replace(' r ','Br ')
-    if " A " in line:
-        print("Atom name \"A\" being interpreted as \"C\" (i.e. an aromatic carbon).")
-        line = line.replace(' A ',' C ')
-        if "ENDMDL" in line:
-            thelines.append(line)
-            pdbs.append(thelines)
-            thelines = []
-        else: thelines.append(line)
-
-    # now, printOut PBD files in temp directory
-    if not os.path.exists(sys.path[0] + os.sep + "tmp"):
-        os.mkdir(sys.path[0] + os.sep + "tmp")
-        print("Created directory " + sys.path[0] + os.sep + 'tmp' + os.sep)
-
-    # now, pick a random id number
-    id = random.randrange(0, 1000000)
-
-    filenames = []
-
-    for pdb in pdbs:
-        name = pdb[0]
-        name = name.replace("\t"," ")
-        while "  " in name: name = name.replace("  "," ")
-        name = name.replace(" ", "_").strip()
-        filename = sys.path[0] + os.sep + 'tmp' + os.sep + name +"."+ str(id) + ".pdb"
-        filenames.append(filename)
-
-        f = open(filename,'w')
-        f.writelines(pdb)
-        f.close()
-
-    # now convert the pdbs into pdbqts
-    runstring = ''
-    if mglenv.strip() != "": runstring = 'source ' + mglenv + '; '
-    runstring = runstring + prepare_ligand4_location
-    print('Converting frames from AutoDock output file into individual pdbqt files...')
-    for filename in filenames:
-        torun = runstring + " -l " + filename + " -o " + filename + "qt"
-        print("\t"+torun)
-        os.system(torun)
-
-    best_binder = -10000000.0
-    best_binder_name = ""
-
-    for filename in filenames:
-        filename = filename+"qt"
+        thelines = []
+        label = ""
 
-        ligand = PDB()
-        ligand.LoadPDB(filename)
+        best_binder = -10000000.0
+        best_binder_name = ""
 
-        tmp = os.path.basename(filename)
-        tmp = tmp.split(".")
-        tmp = tmp[0]
-        ligand_name = autodock_output + ", " + tmp.replace("_",' ')
+        for line in lines:
+            if "MODEL " in line:
+                if len(thelines) != 0:
 
-        average_score = process_ligand(ligand_name, ligand, receptor)
+                    # so create a complex of this frame and the receptor, get the score
+                    ligand = PDB()
+                    ligand.LoadPDB_from_list(thelines)
+                    average_score = process_ligand(vina_output + ", " +label, ligand, receptor)
+                    if best_binder < average_score:
+                        best_binder = average_score
+                        best_binder_name = vina_output + ", " +label
+                    print("\n\tAverage score: ", average_score)
+                    if average_score < 0: print("(bad binder)")
+                    else: print("(good binder)")
+                    print("")
+                    thelines = [line.strip()]
+
+                else: thelines = [line.strip()]
+
+                label = line.strip()
+
+            else: thelines.append(line.strip())
+
+        # so create a complex of this frame and the receptor, get the score
+        ligand = PDB()
+        ligand.LoadPDB_from_list(thelines)
+        average_score = process_ligand(vina_output + ", " +label, ligand, receptor)
         if best_binder < average_score:
             best_binder = average_score
-            best_binder_name = ligand_name
+            best_binder_name = vina_output + ", " +label
         print("\n\tAverage score: ", average_score)
         if average_score < 0: print("(bad binder)")
         else: print("(good binder)")
         print("")
-    print("Best score:", best_binder,"(" + best_binder_name + ")")
-    print("")
+        print("Best score:", best_binder,"(" + best_binder_name + ")")
+        print("")
+    elif autodock_output != "":
+        receptor = PDB()
+        receptor.LoadPDB(receptor_name)
+
+        file = open(autodock_output,"r")
+        lines = file.readlines()
+        file.close()
+
+        for t in range(len(lines)):
+            if "Keeping original residue number (specified in the input PDBQ file) for outputting." in lines[t]: break
+
+        pdbs = []
+        thelines = []
+        for i in range(t+2,len(lines)):
+            line = lines[i]
+            if " l " in line:
+                print("Atom name \"l\" being interpreted as \"Cl.\"")
+                line = line.replace(' l ','Cl ')
+            if " r " in line:
+                print("Atom name \"r\" being interpreted as \"Br.\"")
+                line = line.replace(' r ','Br ')
+        if " A " in line:
+            print("Atom name \"A\" being interpreted as \"C\" (i.e. an aromatic carbon).")
+            line = line.replace(' A ',' C ')
+            if "ENDMDL" in line:
+                thelines.append(line)
+                pdbs.append(thelines)
+                thelines = []
+            else: thelines.append(line)
+
+        # now, printOut PBD files in temp directory
+        if not os.path.exists(sys.path[0] + os.sep + "tmp"):
+            os.mkdir(sys.path[0] + os.sep + "tmp")
+            print("Created directory " + sys.path[0] + os.sep + 'tmp' + os.sep)
+
+        # now, pick a random id number
+        id = random.randrange(0, 1000000)
+
+        filenames = []
+
+        for pdb in pdbs:
+            name = pdb[0]
+            name = name.replace("\t"," ")
+            while "  " in name: name = name.replace("  "," ")
+            name = name.replace(" ", "_").strip()
+            filename = sys.path[0] + os.sep + 'tmp' + os.sep + name +"."+ str(id) + ".pdb"
+            filenames.append(filename)
+
+            f = open(filename,'w')
+            f.writelines(pdb)
+            f.close()
+
+        # now convert the pdbs into pdbqts
+        runstring = ''
+        if mglenv.strip() != "": runstring = 'source ' + mglenv + '; '
+        runstring = runstring + prepare_ligand4_location
+        print('Converting frames from AutoDock output file into individual pdbqt files...')
+        for filename in filenames:
+            torun = runstring + " -l " + filename + " -o " + filename + "qt"
+            print("\t"+torun)
+            os.system(torun)
+
+        best_binder = -10000000.0
+        best_binder_name = ""
+
+        for filename in filenames:
+            filename = filename+"qt"
+
+            ligand = PDB()
+            ligand.LoadPDB(filename)
+
+            tmp = os.path.basename(filename)
+            tmp = tmp.split(".")
+            tmp = tmp[0]
+            ligand_name = autodock_output + ", " + tmp.replace("_",' ')
+
+            average_score = process_ligand(ligand_name, ligand, receptor)
+            if best_binder < average_score:
+                best_binder = average_score
+                best_binder_name = ligand_name
+            print("\n\tAverage score: ", average_score)
+            if average_score < 0: print("(bad binder)")
+            else: print("(good binder)")
+            print("")
+        print("Best score:", best_binder,"(" + best_binder_name + ")")
+        print("")
 
-    # now delete files
-    for filename in filenames:
-        os.remove(filename)
-        os.remove(filename + "qt")
+        # now delete files
+        for filename in filenames:
+            os.remove(filename)
+            os.remove(filename + "qt")
@@ -0,0 +1,477 @@
+"""
+This script calculates the AutoDock Vina 1.1.2 scoring terms of a ligand pose
+in python, giving the same values as running `vina --score_only`.
+
+NNScore 2.0 uses the Vina affinity and the five intermolecular Vina terms
+(gauss 1, gauss 2, repulsion, hydrophobic and hydrogen bonding) as network
+inputs. Getting them from the vina executable means writing every pose to a
+file and starting a vina process for it. VinaTermCalculator instead loads and
+types the receptor once and then scores each pose in the same process.
+
+This follows the Vina 1.1.2 source:
+    - atoms are given X-Score (XS) types from their AutoDock type and the
+      atoms they are covalently bonded to
+    - the terms are summed over every ligand-receptor pair of heavy atoms
+      closer than 8 A
+    - the affinity is taken from the same precalculated energy table Vina
+      uses, with each ligand atom's energy "curled" and the total divided by
+      the torsion penalty
+"""
+import __future__
+
+import math
+
+import numpy
+
+# AutoDock type: [element, covalent radius]. Elements are "Met" for metals
+AD_TYPE_PROPERTIES = {
+    "C": ["C", 0.77],
+    "A": ["C", 0.77],
+    "N": ["N", 0.75],
+    "O": ["O", 0.73],
+    "P": ["P", 1.06],
+    "S": ["S", 1.02],
+    "H": ["H", 0.37],
+    "F": ["F", 0.71],
+    "I": ["I", 1.33],
+    "NA": ["N", 0.75],
+    "OA": ["O", 0.73],
+    "SA": ["S", 1.02],
+    "HD": ["H", 0.37],
+    "Mg": ["Met", 1.30],
+    "Mn": ["Met", 1.39],
+    "Zn": ["Met", 1.31],
+    "Ca": ["Met", 1.74],
+    "Fe": ["Met", 1.25],
+    "Cl": ["Cl", 0.99],
+    "Br": ["Br", 1.14],
+}
+MAX_COVALENT_RADIUS = 1.74
+BOND_LENGTH_ALLOWANCE_FACTOR = 1.1
+
+# The XS types, in Vina's order, and their properties
+XS_TYPES = [
+    "C_H", "C_P", "N_P", "N_D", "N_A", "N_DA", "O_P", "O_D", "O_A", "O_DA",
+    "S_P", "P_P", "F_H", "Cl_H", "Br_H", "I_H", "Met_D",
+]
+XS_VDW_RADII = numpy.array(
+    [1.9, 1.9, 1.8, 1.8, 1.8, 1.8, 1.7, 1.7, 1.7, 1.7, 2.0, 2.1, 1.5, 1.8, 2.0, 2.2, 1.2]
+)
+XS_IS_HYDROPHOBIC = numpy.array(
+    [xs_type in ["C_H", "F_H", "Cl_H", "Br_H", "I_H"] for xs_type in XS_TYPES]
+)
+XS_IS_DONOR = numpy.array(
+    [xs_type in ["N_D", "N_DA", "O_D", "O_DA", "Met_D"] for xs_type in XS_TYPES]
+)
+XS_IS_ACCEPTOR = numpy.array(
+    [xs_type in ["N_A", "N_DA", "O_A", "O_DA"] for xs_type in XS_TYPES]
+)
+
+# The default weights of Vina 1.1.2
+WEIGHT_GAUSS1 = -0.035579
+WEIGHT_GAUSS2 = -0.005156
+WEIGHT_REPULSION = 0.840245
+WEIGHT_HYDROPHOBIC = -0.035069
+WEIGHT_HYDROGEN = -0.587439
+WEIGHT_ROT = 0.05846
+
+CUTOFF = 8.0
+CUTOFF_SQR = CUTOFF * CUTOFF
+# Vina samples its precalculated energies at this many points per A^2
+PRECALCULATE_FACTOR = 32.0
+# The value Vina "curls" the energy of each ligand atom with in --score_only
+AUTHENTIC_V = 1000.0
+
+
+def parse_pdbqt_atom_line(line):
+    """
+    Get the coordinates and AutoDock type of a PDBQT ATOM/HETATM line.
+
+    Inputs:
+    :param str line: a PDBQT ATOM or HETATM line
+
+    Returns:
+    :returns: list coordinates: the [x, y, z] coordinates of the atom
+    :returns: str ad_type: the AutoDock type of the atom
+    """
+
+    coordinates = [float(line[30:38]), float(line[38:46]), float(line[46:54])]
+    ad_type = line[77:79].strip()
+    if ad_type not in AD_TYPE_PROPERTIES.keys():
+        raise Exception("Atom type {} is not supported by Vina 1.1.2.".format(ad_type))
+
+    return coordinates, ad_type
+
+
+def find_close_pairs(coordinates, max_distance):
+    """
+    Find every pair of atoms closer than a distance.
+
+    Inputs:
+    :param numpy.array coordinates: the coordinates of the atoms (N x 3)
+    :param float max_distance: the distance cutoff
+
+    Returns:
+    :returns: list pairs: a list of [i, j, distance] with i < j
+    """
+
+    pairs = []
+    # Done in blocks so a large receptor never needs an N x N matrix
+    block_size = 512
+    for start in range(0, len(coordinates), block_size):
+        block = coordinates[start:start + block_size]
+        deltas = block[:, numpy.newaxis, :] - coordinates[numpy.newaxis, :, :]
+        distances = numpy.sqrt(numpy.sum(deltas * deltas, axis=2))
+        rows, columns = numpy.nonzero(distances < max_distance)
+        for row, column in zip(rows, columns):
+            i = start + row
+            if i < column:
+                pairs.append([i, column, distances[row, column]])
+
+    return pairs
+
+
+def assign_xs_types(ad_types, bonds):
+    """
+    Assign the XS type of every atom, as model::assign_types() does in
+    Vina 1.1.2. Hydrogens get no XS type (-1) and are not scored.
+
+    Inputs:
+    :param list ad_types: the AutoDock type of each atom
+    :param list bonds: for each atom, the list of atoms it is bonded to
+
+    Returns:
+    :returns: numpy.array xs_types: the index of each atom's XS type in
+        XS_TYPES or -1
+    """
+
+    xs_types = []
+    for i, ad_type in enumerate(ad_types):
+        element = AD_TYPE_PROPERTIES[ad_type][0]
+        bonded_elements = [AD_TYPE_PROPERTIES[ad_types[j]][0] for j in bonds[i]]
+
+        acceptor = ad_type in ["OA", "NA"]
+        donor = element == "Met" or "HD" in [ad_types[j] for j in bonds[i]]
+
+        if element == "H":
+            xs_type = None
+        elif element == "C":
+            bonded_to_heteroatom = False
+            for bonded_element in bonded_elements:
+                if bonded_element not in ["H", "C"]:
+                    bonded_to_heteroatom = True
+            xs_type = "C_P" if bonded_to_heteroatom is True else "C_H"
+        elif element in ["N", "O"]:
+            if acceptor is True and donor is True:
+                xs_type = element + "_DA"
+            elif acceptor is True:
+                xs_type = element + "_A"
+            elif donor is True:
+                xs_type = element + "_D"
+            else:
+                xs_type = element + "_P"
+        elif element in ["S", "P"]:
+            xs_type = element + "_P"
+        elif element == "Met":
+            xs_type = "Met_D"
+        else:
+            xs_type = element + "_H"
+
+        xs_types.append(-1 if xs_type is None else XS_TYPES.index(xs_type))
+
+    return numpy.array(xs_types, dtype=int)
+
+
+def calculate_terms(xs_1, xs_2, r):
+    """
+    Calculate the five Vina terms for pairs of atoms.
+
+    Inputs:
+    :param numpy.array xs_1: the XS type of the first atom of each pair
+    :param numpy.array xs_2: the XS type of the second atom of each pair
+    :param numpy.array r: the distance between the atoms of each pair
+
+    Returns:
+    :returns: list terms: numpy arrays of the gauss 1, gauss 2, repulsion,
+        hydrophobic and hydrogen bonding terms of each pair
+    """
+
+    # The surface distance
+    d = r - (XS_VDW_RADII[xs_1] + XS_VDW_RADII[xs_2])
+
+    gauss_1 = numpy.exp(-((d / 0.5) ** 2))
+    gauss_2 = numpy.exp(-(((d - 3.0) / 2.0) ** 2))
+    repulsion = numpy.where(d < 0, d * d, 0.0)
+
+    # slope_step(bad=1.5, good=0.5, d)
+    hydrophobic = numpy.where(d <= 0.5, 1.0, numpy.where(d >= 1.5, 0.0, (d - 1.5) / (0.5 - 1.5)))
+    hydrophobic = numpy.where(XS_IS_HYDROPHOBIC[xs_1] & XS_IS_HYDROPHOBIC[xs_2], hydrophobic, 0.0)
+
+    # slope_step(bad=0, good=-0.7, d)
+    hydrogen = numpy.where(d <= -0.7, 1.0, numpy.where(d >= 0.0, 0.0, d / -0.7))
+    h_bond_possible = (XS_IS_DONOR[xs_1] & XS_IS_ACCEPTOR[xs_2]) | (
+        XS_IS_DONOR[xs_2] & XS_IS_ACCEPTOR[xs_1]
+    )
+    hydrogen = numpy.where(h_bond_possible, hydrogen, 0.0)
+
+    return [gauss_1, gauss_2, repulsion, hydrophobic, hydrogen]
+
+
+def make_energy_table():
+    """
+    Make Vina's precalculated energy table. For every pair of XS types the
+    weighted energy is sampled at r^2 = i / 32, and entry i holds the average
+    of samples i and i + 1.
+
+    Returns:
+    :returns: numpy.array energy_table: the energies with shape (number of
+        XS types, number of XS types, number of samples)
+    """
+
+    num_samples = int(PRECALCULATE_FACTOR * CUTOFF_SQR) + 3
+    rs = numpy.sqrt(numpy.arange(num_samples) / PRECALCULATE_FACTOR)
+    num_types = len(XS_TYPES)
+
+    xs_1 = numpy.repeat(numpy.arange(num_types), num_types)
+    xs_2 = numpy.tile(numpy.arange(num_types), num_types)
+    terms = calculate_terms(
+        xs_1[:, numpy.newaxis], xs_2[:, numpy.newaxis], rs[numpy.newaxis, :]
+    )
+    smooth = (
+        WEIGHT_GAUSS1 * terms[0]
+        + WEIGHT_GAUSS2 * terms[1]
+        + WEIGHT_REPULSION * terms[2]
+        + WEIGHT_HYDROPHOBIC * terms[3]
+        + WEIGHT_HYDROGEN * terms[4]
+    )
+    next_smooth = numpy.concatenate([smooth[:, 1:], numpy.zeros((len(smooth), 1))], axis=1)
+    energy_table = (smooth + next_smooth) / 2
+
+    return energy_table.reshape(num_types, num_types, num_samples)
+
+
+class VinaTermCalculator(object):
+    """
+    Calculates the Vina 1.1.2 --score_only output of ligand poses against a
+    receptor which is loaded once.
+    """
+
+    def __init__(self, receptor_file):
+        """
+        Load the receptor and assign the XS types of its atoms.
+
+        Inputs:
+        :param str receptor_file: the path to the receptor pdbqt file
+        """
+
+        self.receptor_file = receptor_file
+
+        coordinates = []
+        ad_types = []
+        with open(receptor_file, "r") as f:
+            for line in f.readlines():
+                if line[:4] == "ATOM" or line[:6] == "HETATM":
+                    atom_coordinates, ad_type = parse_pdbqt_atom_line(line)
+                    coordinates.append(atom_coordinates)
+                    ad_types.append(ad_type)
+        coordinates = numpy.array(coordinates, dtype=float).reshape(-1, 3)
+
+        # Every receptor atom can bond with every other receptor atom
+        bonds = [[] for i in range(len(ad_types))]
+        max_bond_length = BOND_LENGTH_ALLOWANCE_FACTOR * 2 * MAX_COVALENT_RADIUS
+        for i, j, r in find_close_pairs(coordinates, max_bond_length):
+            bond_length = AD_TYPE_PROPERTIES[ad_types[i]][1] + AD_TYPE_PROPERTIES[ad_types[j]][1]
+            if r < BOND_LENGTH_ALLOWANCE_FACTOR * bond_length:
+                bonds[i].append(j)
+                bonds[j].append(i)
+
+        xs_types = assign_xs_types(ad_types, bonds)
+        heavy_atoms = xs_types >= 0
+        self.coordinates = coordinates[heavy_atoms]
+        self.xs_types = xs_types[heavy_atoms]
+
+        self.energy_table = make_energy_table()
+
+    def load_ligand(self, ligand_file):
+        """
+        Load a ligand pose and assign the XS types of its atoms.
+
+        Bonds are only made between atoms which Vina treats as rigidly
+        connected: atoms in the same torsion tree fragment, or the parent
+        atom of a BRANCH and the atoms of that branch's fragment. The bonds
+        of the latter kind are rotatable.
+
+        Inputs:
+        :param str ligand_file: the path to the ligand pose pdbqt file
+
+        Returns:
+        :returns: numpy.array coordinates: the coordinates of every atom
+        :returns: numpy.array xs_types: the XS type of every atom
+        :returns: float num_tors: the number of torsions Vina penalizes
+        """
+
+        coordinates = []
+        ad_types = []
+        fragment_of_atom = []
+        serial_to_index = {}
+        # [fragment id, the parent atom serial of the BRANCH that started it]
+        fragment_stack = [[0, None]]
+        fragment_parents = {0: None}
+        num_fragments = 1
+
+        with open(ligand_file, "r") as f:
+            for line in f.readlines():
+                if line[:4] == "ATOM" or line[:6] == "HETATM":
+                    atom_coordinates, ad_type = parse_pdbqt_atom_line(line)
+                    serial_to_index[int(line[6:11])] = len(ad_types)
+                    coordinates.append(atom_coordinates)
+                    ad_types.append(ad_type)
+                    fragment_of_atom.append(fragment_stack[-1][0])
+                elif line[:6] == "BRANCH":
+                    parent_serial = int(line.split()[1])
+                    fragment_parents[num_fragments] = parent_serial
+                    fragment_stack.append([num_fragments, parent_serial])
+                    num_fragments = num_fragments + 1
+                elif line[:9] == "ENDBRANCH":
+                    fragment_stack.pop()
+
+        coordinates = numpy.array(coordinates, dtype=float).reshape(-1, 3)
+
+        bonds = [[] for i in range(len(ad_types))]
+        rotatable_bonds = set([])
+        for i, j, r in find_close_pairs(coordinates, BOND_LENGTH_ALLOWANCE_FACTOR * 2 * MAX_COVALENT_RADIUS):
+            if fragment_of_atom[i] == fragment_of_atom[j]:
+                rotatable = False
+            else:
+                parent_i = fragment_parents[fragment_of_atom[i]]
+                parent_j = fragment_parents[fragment_of_atom[j]]
+                if parent_j is not None and serial_to_index.get(parent_j) == i:
+                    rotatable = True
+                elif parent_i is not None and serial_to_index.get(parent_i) == j:
+                    rotatable = True
+                else:
+                    continue
+
+            bond_length = AD_TYPE_PROPERTIES[ad_types[i]][1] + AD_TYPE_PROPERTIES[ad_types[j]][1]
+            if r < BOND_LENGTH_ALLOWANCE_FACTOR * bond_length:
+                bonds[i].append(j)
+                bonds[j].append(i)
+                if rotatable is True:
+                    rotatable_bonds.add((i, j))
+                    rotatable_bonds.add((j, i))
+
+        xs_types = assign_xs_types(ad_types, bonds)
+
+        # Each rotatable bond to a heavy atom with more than one heavy
+        # neighbor adds half a torsion for the atom on the other side
+        num_heavy_neighbors = [
+            len([j for j in bonds[i] if AD_TYPE_PROPERTIES[ad_types[j]][0] != "H"])
+            for i in range(len(ad_types))
+        ]
+        num_tors = 0.0
+        for i in range(len(ad_types)):
+            if AD_TYPE_PROPERTIES[ad_types[i]][0] == "H":
+                continue
+            for j in bonds[i]:
+                if (i, j) not in rotatable_bonds:
+                    continue
+                if AD_TYPE_PROPERTIES[ad_types[j]][0] == "H":
+                    continue
+                if num_heavy_neighbors[j] > 1:
+                    num_tors = num_tors + 0.5
+
+        return coordinates, xs_types, num_tors
+
+    def score_only(self, ligand_file):
+        """
+        Calculate the affinity and the intermolecular terms of a ligand pose.
+
+        Inputs:
+        :param str ligand_file: the path to the ligand pose pdbqt file
+
+        Returns:
+        :returns: float affinity: the Vina affinity (kcal/mol)
+        :returns: list terms: the gauss 1, gauss 2, repulsion, hydrophobic
+            and hydrogen bonding terms before weighting
+        """
+
+        coordinates, xs_types, num_tors = self.load_ligand(ligand_file)
+        heavy_atoms = xs_types >= 0
+        coordinates = coordinates[heavy_atoms]
+        xs_types = xs_types[heavy_atoms]
+
+        if len(coordinates) == 0 or len(self.coordinates) == 0:
+            return 0.0, [0.0, 0.0, 0.0, 0.0, 0.0]
+
+        deltas = coordinates[:, numpy.newaxis, :] - self.coordinates[numpy.newaxis, :, :]
+        r2 = (
+            deltas[:, :, 0] * deltas[:, :, 0]
+            + deltas[:, :, 1] * deltas[:, :, 1]
+            + deltas[:, :, 2] * deltas[:, :, 2]
+        )
+        ligand_positions, receptor_positions = numpy.nonzero(r2 < CUTOFF_SQR)
+        pair_r2 = r2[ligand_positions, receptor_positions]
+        xs_1 = xs_types[ligand_positions]
+        xs_2 = self.xs_types[receptor_positions]
+
+        terms = calculate_terms(xs_1, xs_2, numpy.sqrt(pair_r2))
+        terms = [float(numpy.sum(term)) for term in terms]
+
+        # Energy of each ligand atom from the precalculated table
+        pair_energies = self.energy_table[
+            xs_1, xs_2, (PRECALCULATE_FACTOR * pair_r2).astype(int)
+        ]
+        atom_energies = numpy.bincount(
+            ligand_positions, weights=pair_energies, minlength=len(coordinates)
+        )
+        # curl() softens the positive energies of clashing atoms
+        atom_energies = numpy.where(
+            atom_energies > 0,
+            atom_energies * (AUTHENTIC_V / (AUTHENTIC_V + atom_energies)),
+            atom_energies,
+        )
+        energy = float(numpy.sum(atom_energies))
+
+        # The torsion penalty
+        weight_rot = 5 * WEIGHT_ROT / 0.1 - 1
+        w = 0.1 * (weight_rot + 1)
+        divisor = 1 + w * num_tors / 5.0
+        if math.fabs(energy) < numpy.finfo(float).eps:
+            affinity = 0.0
+        else:
+            affinity = energy / divisor
+
+        return affinity, terms
+
+    def score_only_output(self, receptor_file, ligand_file):
+        """
+        Get the text `vina --score_only` prints for a ligand pose, so it can
+        replace running vina in NNScore2.py.
+
+        Inputs:
+        :param str receptor_file: the path to the receptor pdbqt file. This
+            must be the receptor the calculator was made with.
+        :param str ligand_file: the path to the ligand pose pdbqt file
+
+        Returns:
+        :returns: str output: the affinity and term lines printed by vina
+        """
+
+        if receptor_file != self.receptor_file:
+            raise Exception(
+                "VinaTermCalculator was made for {} not {}".format(
+                    self.receptor_file, receptor_file
+                )
+            )
+
+        affinity, terms = self.score_only(ligand_file)
+
+        output = "Affinity: {:.5f} (kcal/mol)\n".format(affinity)
+        output = output + "Intermolecular contributions to the terms, before weighting:\n"
+        output = output + "    gauss 1     : {:.5f}\n".format(terms[0])
+        output = output + "    gauss 2     : {:.5f}\n".format(terms[1])
+        output = output + "    repulsion   : {:.5f}\n".format(terms[2])
+        output = output + "    hydrophobic : {:.5f}\n".format(terms[3])
+        output = output + "    Hydrogen    : {:.5f}\n".format(terms[4])
+
+        return output
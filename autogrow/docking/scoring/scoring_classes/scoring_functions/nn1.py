@@ -9,6 +9,8 @@ import os
 import sys
 
 
+import autogrow.docking.execute_command as Execute
+import autogrow.docking.scoring.nn_score_exe.nn_score_engine as NNScoreEngine
 from autogrow.docking.scoring.scoring_classes.parent_scoring_class import ParentScoring
 from autogrow.docking.scoring.scoring_classes.scoring_functions.vina import VINA
 
@@ -224,22 +226,33 @@ def run_nn_rescoring(vars, vina_output_file):
 
     nn1_output = vina_output_file + ".nn1"
     # sys.executable is the path to python executable
-    torun = (
-        sys.executable + " "
-        + nn1_executable
-        + " -receptor "
-        + receptor
-        + " -vina_output "
-        + vina_output_file
-        + " -networks_dir "
-        + networks_dir
-        + " > "
-        + nn1_output
-    )
+    command_args = [
+        sys.executable,
+        nn1_executable,
+        "-receptor",
+        receptor,
+        "-vina_output",
+        vina_output_file,
+        "-networks_dir",
+        networks_dir,
+    ]
+
+    # The NNScore script is imported so this process only loads the receptor
+    # and networks once. If it can not be imported (ie. a user supplied
+    # script which runs on import) it is run as a separate program instead.
+    try:
+        engine = NNScoreEngine.get_nn1_engine(vars)
+    except:
+        engine = None
 
     # A list containing the file name as item 1 and whether it passed as item
     # 2
-    results = execute_nn_scoring(torun, nn1_output)
+    if engine is not None:
+        results = execute_nn_engine_scoring(engine, vina_output_file, nn1_output)
+    else:
+        results = execute_nn_scoring(
+            command_args, nn1_output, vars["docking_timeout_limit"]
+        )
 
     # Will be None if it passed. A list containing the file name as item 1 and
     # whether it passed as item 2. [PATH, True] means it passed. [PATH, False]
@@ -247,7 +260,35 @@ def run_nn_rescoring(vars, vina_output_file):
     return results
 
 
-def execute_nn_scoring(command, file_path):
+def execute_nn_engine_scoring(engine, input_file, file_path):
+    """
+    Run an individual NN scoring function with an engine which already holds
+    the loaded receptor and networks.
+
+    Inputs:
+    :param object engine: the NN1Engine of this process from
+        nn_score_engine.get_nn1_engine()
+    :param str input_file: Path to the file to be rescored
+    :param str file_path: Path to the file to save the rescoring output in
+
+    Returns:
+    :returns: list results of the rescoring function: [file_path,
+        it_rescored]. [PATH, True] means it passed. [PATH, False] means it failed
+        a results of all NN1 files.
+    """
+
+    try:
+        output = engine.score_vina_file(input_file)
+        with open(file_path, "w") as f:
+            f.write(output)
+        it_rescored = confirm_file_has_scoring(file_path)
+    except:
+        return [file_path, False]
+
+    return [file_path, it_rescored]
+
+
+def execute_nn_scoring(command_args, file_path, timeout=None):
     """
     Run an individual NN scoring function.
 
@@ -255,8 +296,11 @@ def execute_nn_scoring(command, file_path):
     item 2. [PATH, True] means it passed. [PATH, False] means it failed.
 
     Inputs:
-    :param str command: the rescoring bash style command to execute
-    :param str file_path: Path to a vina output file to be rescored
+    :param list command_args: the rescoring executable followed by its
+        arguments
+    :param str file_path: Path to the file to save the rescoring output in
+    :param float timeout: the maximum number of seconds to let the rescoring
+        run. If None it runs until it finishes.
 
     Returns:
     :returns: list results of the rescoring function: [file_path,
@@ -265,7 +309,14 @@ def execute_nn_scoring(command, file_path):
     """
 
     try:
-        os.system(command)
+        # Only stdout holds the scores, so stderr is kept out of the file
+        returncode, _ = Execute.run_command(
+            command_args, timeout=timeout, output_file=file_path,
+            merge_stderr=False
+        )
+        if returncode is None:
+            # It timed out or could not be started
+            return [file_path, False]
         it_rescored = confirm_file_has_scoring(file_path)
     except:
         return [file_path, False]
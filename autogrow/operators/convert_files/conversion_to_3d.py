@@ -31,6 +31,7 @@ sys.path.extend([GYPSUM_DIR, CURRENT_DIR, GYPSUM_GYPSUM_DIR])
 
 import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
 from autogrow.operators.convert_files.gypsum_dl.gypsum_dl.Start import prepare_molecules
+from autogrow.operators.convert_files.gypsum_dl.gypsum_dl.Start import prepare_molecules_batch
 
 
 
@@ -88,6 +89,12 @@ def convert_to_3d(vars, smi_file, smile_file_directory):
         .smi file
     """
 
+    if vars["streaming_pipeline"] is True:
+        # Each ligand will be converted to 3D by the same job which docks it
+        # See execute_docking.run_streaming_conversion_and_docking()
+        print("3D CONVERSION DEFERRED TO THE STREAMING DOCKING PIPELINE")
+        return
+
     print("CONVERTING SMILES TO SDF")
     # convert smiles in an .SMI file to sdfs using gypsum
     gypsum_output_folder_path = convert_smi_to_sdfs_with_gypsum(
@@ -103,9 +110,10 @@ def convert_to_3d(vars, smi_file, smile_file_directory):
 
 def convert_smi_to_sdfs_with_gypsum(vars, gen_smiles_file, smile_file_directory):
     """
-    Convert a file of SMILES to a set of 3d .sdf files using Gypsum. This does
-    so by making a set of .json files for running Gypsum for every ligand in
-    the .smi file.
+    Convert a file of SMILES to a set of 3d .sdf files using Gypsum. The
+    ligands are split into a few batches per processor and each batch is
+    converted by a single call to Gypsum-DL (see run_gypsum_batch), so
+    Gypsum-DL is only set up once per batch rather than once per ligand.
 
     This will print out the list of ligands which failed to convert to 3D.
 
@@ -121,12 +129,90 @@ def convert_smi_to_sdfs_with_gypsum(vars, gen_smiles_file, smile_file_directory)
         the 3D sdf's created by gypsum.
     """
 
+    gypsum_timeout_limit = vars["gypsum_timeout_limit"]
+
+    gypsum_output_folder_path, gypsum_log_path = make_gypsum_folders(
+        smile_file_directory
+    )
+    gypsum_params = make_gypsum_params(
+        "", gypsum_output_folder_path, vars["max_variants_per_compound"],
+        vars["gypsum_thoroughness"], vars["min_ph"], vars["max_ph"],
+        vars["pka_precision"],
+    )
+    ligands_to_convert = get_ligands_to_convert(gen_smiles_file)
+
+    if vars["resume_partial_generation"] is True:
+        # Skip the ligands which an earlier, interrupted attempt at this
+        # generation already converted
+        ligands_to_convert = remove_already_converted_ligands(
+            gypsum_log_path, gypsum_output_folder_path, ligands_to_convert
+        )
+
+    # Make a few batches per processor so a batch of slow ligands doesn't
+    # hold up the rest. Ligands are dealt out to the batches in turn.
+    number_of_processors = int(vars["parallelizer"].return_node())
+    num_batches = min(len(ligands_to_convert), number_of_processors * 4)
+    batches = [ligands_to_convert[i::num_batches] for i in range(num_batches)]
+
+    # create a the job_inputs to run gypsum in multithread
+    job_input = tuple(
+        [
+            tuple(
+                [
+                    gypsum_log_path,
+                    batch,
+                    gypsum_params,
+                    gypsum_timeout_limit,
+                ]
+            )
+            for batch in batches
+        ]
+    )
+
+    sys.stdout.flush()
+    failed_to_convert = vars["parallelizer"].run(job_input, run_gypsum_batch)
+    sys.stdout.flush()
+
+    lig_failed_to_convert = []
+    for failed_in_batch in failed_to_convert:
+        if failed_in_batch is not None:
+            lig_failed_to_convert.extend(failed_in_batch)
+    lig_failed_to_convert = list(set(lig_failed_to_convert))
+    if len(lig_failed_to_convert) > 0:
+        print("The Following ligands Failed to convert in Gypsum")
+        print("Likely due to a Timeout")
+        print(lig_failed_to_convert)
+    sys.stdout.flush()
+    return gypsum_output_folder_path
+
+
+def prepare_gypsum_submission(vars, gen_smiles_file, smile_file_directory):
+    """
+    Make the folders used by Gypsum and the .smi file and parameter
+    dictionary to submit to Gypsum for every ligand in a .smi file.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param str gen_smiles_file: the file name of the .smi file to be converted
+        to 3D sdf's
+    :param srt smile_file_directory: the directory path which contains the
+        .smi file
+
+    Returns:
+    :returns: str gypsum_output_folder_path: a path to the folder which the
+        3D sdf's created by gypsum will be placed in.
+    :returns: str gypsum_log_path: a path to the folder to place the log files
+        produced when running gypsum.
+    :returns: list list_of_gypsum_params: a list of dictionaries. Each
+        dictionary contains the Gypsum-DL parameters to convert a single
+        ligand from SMILES to 3D .sdf
+    """
+
     max_variants_per_compound = vars["max_variants_per_compound"]
     gypsum_thoroughness = vars["gypsum_thoroughness"]
     min_ph = vars["min_ph"]
     max_ph = vars["max_ph"]
     pka_precision = vars["pka_precision"]
-    gypsum_timeout_limit = vars["gypsum_timeout_limit"]
 
     # Make a new folder to put gypsum .smi's and json. Name folder
     # gypsum_submission_files.
@@ -134,15 +220,9 @@ def convert_smi_to_sdfs_with_gypsum(vars, gen_smiles_file, smile_file_directory)
     if os.path.exists(folder_path) is False:
         os.makedirs(folder_path)
 
-    # Make Output for Gypsum folder (where .sdf's go)
-    gypsum_output_folder_path = "{}3D_SDFs{}".format(smile_file_directory, os.sep)
-    if os.path.exists(gypsum_output_folder_path) is False:
-        os.makedirs(gypsum_output_folder_path)
-
-    # Make a folder to put the log files into within the 3D_SDFs folder
-    gypsum_log_path = "{}log{}".format(gypsum_output_folder_path, os.sep)
-    if os.path.exists(gypsum_log_path) is False:
-        os.makedirs(gypsum_log_path)
+    gypsum_output_folder_path, gypsum_log_path = make_gypsum_folders(
+        smile_file_directory
+    )
 
     # Make All of the json files to submit to gypsum
     list_of_gypsum_params = make_smi_and_gyspum_params(
@@ -156,36 +236,199 @@ def convert_smi_to_sdfs_with_gypsum(vars, gen_smiles_file, smile_file_directory)
         pka_precision,
     )
 
-    # create a the job_inputs to run gypsum in multithread
-    job_input = tuple(
-        [
-            tuple(
-                [
-                    gypsum_log_path,
-                    gypsum_params,
-                    gypsum_timeout_limit,
-                ]
+    return gypsum_output_folder_path, gypsum_log_path, list_of_gypsum_params
+
+
+def make_gypsum_folders(smile_file_directory):
+    """
+    Make the folder which Gypsum places its 3D .sdf files in and the folder
+    for its log files.
+
+    Inputs:
+    :param srt smile_file_directory: the directory path which contains the
+        .smi file
+
+    Returns:
+    :returns: str gypsum_output_folder_path: a path to the folder which the
+        3D sdf's created by gypsum will be placed in.
+    :returns: str gypsum_log_path: a path to the folder to place the log files
+        produced when running gypsum.
+    """
+
+    # Make Output for Gypsum folder (where .sdf's go)
+    gypsum_output_folder_path = "{}3D_SDFs{}".format(smile_file_directory, os.sep)
+    if os.path.exists(gypsum_output_folder_path) is False:
+        os.makedirs(gypsum_output_folder_path)
+
+    # Make a folder to put the log files into within the 3D_SDFs folder
+    gypsum_log_path = "{}log{}".format(gypsum_output_folder_path, os.sep)
+    if os.path.exists(gypsum_log_path) is False:
+        os.makedirs(gypsum_log_path)
+
+    return gypsum_output_folder_path, gypsum_log_path
+
+
+def remove_already_converted_ligands(gypsum_log_path, gypsum_output_folder_path,
+                                     ligands_to_convert):
+    """
+    Remove the ligands which were already converted to 3D by an earlier
+    attempt at the same generation. A ligand counts as converted if its
+    Gypsum log shows it completed and its .sdf files exist.
+
+    Inputs:
+    :param str gypsum_log_path: a path to the folder with the log files
+        produced when running gypsum.
+    :param str gypsum_output_folder_path: a path to the folder with the 3D
+        sdf's created by gypsum.
+    :param list ligands_to_convert: a list of the SMILES and abridged name of
+        every ligand to convert. ie. [["CCC", "Gen_4_Cross_702"]]
+
+    Returns:
+    :returns: list ligands_to_convert: the ligands which still need to be
+        converted
+    """
+
+    still_to_convert = []
+    for smile, lig_id in ligands_to_convert:
+        log_file = "{}{}_log.txt".format(gypsum_log_path, lig_id)
+        sdf_files = glob.glob("{}{}__*.sdf".format(gypsum_output_folder_path, lig_id))
+        if len(sdf_files) != 0 and check_gypsum_log_did_complete(log_file) is True:
+            continue
+        still_to_convert.append([smile, lig_id])
+
+    num_converted = len(ligands_to_convert) - len(still_to_convert)
+    if num_converted != 0:
+        print(
+            "{} ligands were already converted to 3D by an earlier attempt".format(
+                num_converted
             )
-            for gypsum_params in list_of_gypsum_params
-        ]
-    )
+        )
 
+    return still_to_convert
 
-    sys.stdout.flush()
-    failed_to_convert = vars["parallelizer"].run(
-        job_input, run_gypsum_multiprocessing
-    )
-    sys.stdout.flush()
 
+def get_short_ligand_name(ligand_name):
+    """
+    Abridge the name of a ligand for its file names.
 
-    lig_failed_to_convert = [x for x in failed_to_convert if x is not None]
-    lig_failed_to_convert = list(set(lig_failed_to_convert))
-    if len(lig_failed_to_convert) > 0:
-        print("The Following ligands Failed to convert in Gypsum")
-        print("Likely due to a Timeout")
-        print(lig_failed_to_convert)
-    sys.stdout.flush()
-    return gypsum_output_folder_path
+    ie. (Gen_30_Cross_639427+Gen_31_Cross_717928)Gen_34_Cross_709666 But bash
+    doesn't like + or () for file names so we will abridge lig_name_short
+    name for above example becomes Gen_34_Cross_709666 if ligand is from the
+    source files we wont split the name
+
+    Inputs:
+    :param str ligand_name: the full name of the ligand
+
+    Returns:
+    :returns: str lig_name_short: the abridged name of the ligand
+    """
+
+    if len(ligand_name.split(")")) == 2:
+        lig_name_short = ligand_name.split(")")[1]
+    elif len(ligand_name.split(")")) == 1:
+        lig_name_short = ligand_name
+    else:
+        printout = "Ligand name failed to abridge. Smiles may be \
+                    named in improper format please separate with _ \
+                    or camelcase. Our formatting is: \
+                    (Gen_2_Cross_631+Gen_3_Cross_744)Gen_4_Cross_702 \
+                    which reads as Gen_34_Cross_702 (aka ligand 702) \
+                    was produced by crossover using ligands: \
+                    Gen_2_Cross_631 and Gen_3_Cross_744. \
+                    This will abridge to Gen_4_Cross_702 for saving \
+                    files.\nThe failed ligand name was \
+                    {}".format(ligand_name)
+
+        print(printout)
+        raise Exception(printout)
+
+    return lig_name_short
+
+
+def get_ligands_to_convert(gen_smiles_file):
+    """
+    Read the SMILES and abridged name of every ligand in the
+    generation_*_to_convert.smi file.
+
+    Inputs:
+    :param str gen_smiles_file: the file name of the .smi file to be converted
+        to 3D sdf's
+
+    Returns:
+    :returns: list ligands_to_convert: a list of the SMILES and abridged name
+        of every ligand. ie. [["CCC", "Gen_4_Cross_702"]]
+    """
+
+    ligands_to_convert = []
+    with open(gen_smiles_file) as smiles_file:
+        for line in smiles_file:
+            if line == "\n":
+                continue
+            line = line.replace("\n", "")
+            line = line.replace("    ", "\t")
+            parts = line.split("\t")  # split line into parts separated by 4-spaces
+            if len(parts) == 0 or len(parts) == 1:
+                print(parts)
+
+            ligands_to_convert.append([parts[0], get_short_ligand_name(parts[1])])
+
+    return ligands_to_convert
+
+
+def make_gypsum_params(source, gypsum_output_folder_path, max_variance,
+                       gypsum_thoroughness, min_ph, max_ph, pka_precision):
+    """
+    Make the Gypsum-DL parameter dictionary used to convert ligands from
+    SMILES to 3D .sdf files.
+
+    Inputs:
+    :param str source: the .smi file of the ligands to convert. This is
+        "" for run_gypsum_batch, which is given the ligands in memory.
+    :param str gypsum_output_folder_path: a path to the folder with all of the
+        3D sdf's created by gypsum.
+    :param int max_variance: User variable for how many conformers per ligand
+        should be made by Gypsum
+    :param int gypsum_thoroughness: User variable for How widely Gypsum-DL
+        will search for low-energy conformers. Larger values increase run times
+        but can produce better results
+    :param float min_ph: User variable for Minimum pH to consider by
+        Dimorphite-DL
+    :param float max_ph: User variable for Maximum pH to consider by
+        Dimorphite-DL
+    :param float pka_precision: User variable for Size of pH substructure
+        ranges by Dimorphite-DL
+
+    Returns:
+    :returns: dict gypsum_params: the Gypsum-DL parameters
+    """
+
+    gypsum_params = {
+        "source": source,
+        "output_folder": gypsum_output_folder_path,
+        "num_processors": 1,
+        "job_manager": "serial",
+        "use_durrant_lab_filters": True,
+        "max_variants_per_compound": max_variance,
+        "thoroughness": gypsum_thoroughness,
+        "separate_output_files": True,
+        "add_pdb_output": False,
+        "add_html_output": False,
+        "min_ph": min_ph,
+        "max_ph": max_ph,
+        "pka_precision": pka_precision,
+        "skip_optimize_geometry": False,
+        "skip_alternate_ring_conformations": False,
+        "skip_adding_hydrogen": False,
+        "skip_making_tautomers": False,
+        "skip_enumerate_chiral_mol": False,
+        "skip_enumerate_double_bonds": False,
+        "let_tautomers_change_chirality": False,
+        "2d_output_only": False,
+        "cache_prerun": False,
+        "test": False,
+    }
+
+    return gypsum_params
 
 
 def make_smi_and_gyspum_params(gen_smiles_file, folder_path,
@@ -225,79 +468,22 @@ def make_smi_and_gyspum_params(gen_smiles_file, folder_path,
     """
     list_of_gypsum_params = []
 
-    with open(gen_smiles_file) as smiles_file:
-        for line in smiles_file:
-            if line == "\n":
-                continue
-            line = line.replace("\n", "")
-            line = line.replace("    ", "\t")
-            parts = line.split("\t")  # split line into parts separated by 4-spaces
-            if len(parts) == 0 or len(parts) == 1:
-                print(parts)
-            smile = parts[0]
-            # ligand_name example
-            # (Gen_30_Cross_639427+Gen_31_Cross_717928)Gen_34_Cross_709666 But
-            # bash doesn't like + or () for file names so we will abridge
-            # lig_name_short name for above example becomes
-            # Gen_34_Cross_709666 if ligand is from the source files we wont
-            # split the name
-
-            ligand_name = parts[1]
-            if len(ligand_name.split(")")) == 2:
-                lig_name_short = ligand_name.split(")")[1]
-            elif len(ligand_name.split(")")) == 1:
-                lig_name_short = ligand_name
-            else:
-                printout = "Ligand name failed to abridge. Smiles may be \
-                            named in improper format please separate with _ \
-                            or camelcase. Our formatting is: \
-                            (Gen_2_Cross_631+Gen_3_Cross_744)Gen_4_Cross_702 \
-                            which reads as Gen_34_Cross_702 (aka ligand 702) \
-                            was produced by crossover using ligands: \
-                            Gen_2_Cross_631 and Gen_3_Cross_744. \
-                            This will abridge to Gen_4_Cross_702 for saving \
-                            files.\nThe failed ligand name was \
-                            {}".format(ligand_name)
-
-                print(printout)
-                raise Exception(printout)
-
-            smi_line = "{}\t{}".format(smile, lig_name_short)
-
-            smi_path = "{}{}.smi".format(folder_path, lig_name_short)
-
-            # make .smi file
-            with open(smi_path, "w") as smi_file:
-                smi_file.write(smi_line)
-
-            # Make .json file
-            gypsum_params = {
-                "source": smi_path,
-                "output_folder": gypsum_output_folder_path,
-                "num_processors": 1,
-                "job_manager": "serial",
-                "use_durrant_lab_filters": True,
-                "max_variants_per_compound": max_variance,
-                "thoroughness": gypsum_thoroughness,
-                "separate_output_files": True,
-                "add_pdb_output": False,
-                "add_html_output": False,
-                "min_ph": min_ph,
-                "max_ph": max_ph,
-                "pka_precision": pka_precision,
-                "skip_optimize_geometry": False,
-                "skip_alternate_ring_conformations": False,
-                "skip_adding_hydrogen": False,
-                "skip_making_tautomers": False,
-                "skip_enumerate_chiral_mol": False,
-                "skip_enumerate_double_bonds": False,
-                "let_tautomers_change_chirality": False,
-                "2d_output_only": False,
-                "cache_prerun": False,
-                "test": False,
-            }
-
-            list_of_gypsum_params.append(gypsum_params)
+    for smile, lig_name_short in get_ligands_to_convert(gen_smiles_file):
+        smi_line = "{}\t{}".format(smile, lig_name_short)
+
+        smi_path = "{}{}.smi".format(folder_path, lig_name_short)
+
+        # make .smi file
+        with open(smi_path, "w") as smi_file:
+            smi_file.write(smi_line)
+
+        # Make .json file
+        gypsum_params = make_gypsum_params(
+            smi_path, gypsum_output_folder_path, max_variance,
+            gypsum_thoroughness, min_ph, max_ph, pka_precision,
+        )
+
+        list_of_gypsum_params.append(gypsum_params)
 
     return list_of_gypsum_params
 
@@ -353,6 +539,87 @@ def run_gypsum_multiprocessing(gypsum_log_path, gypsum_params,
     return None
 
 
+def run_gypsum_batch(gypsum_log_path, ligands_to_convert, gypsum_params,
+                     gypsum_timeout_limit):
+    """
+    This converts a batch of ligands from SMILES to 3D SDFs with a single
+    call to Gypsum-DL. This is used within a multithread.
+
+    Gypsum-DL is only set up once for the whole batch and each ligand has its
+    own timeout, so one ligand which stalls doesn't stop the rest of the
+    batch. The output of each ligand is written to its own log file, the same
+    as run_gypsum_multiprocessing().
+
+    Inputs:
+    :param str gypsum_log_path: a path to the folder to place the log files
+        produced when running gypsum.
+    :param list ligands_to_convert: a list of the SMILES and abridged name of
+        every ligand in the batch. ie. [["CCC", "Gen_4_Cross_702"]]
+    :param dict gypsum_params: dictionary of params to be feed to Gypsum-DL.
+        Its source is not used.
+    :param int gypsum_timeout_limit: this is taken from
+        vars["gypsum_timeout_limit"]. It determines the maximum amount of time to
+        run Gypsum per ligand
+
+    Returns:
+    :returns: list lig_failed_to_convert: the names of the ligands which
+        failed to convert to 3D sdf.
+    """
+
+    lig_failed_to_convert = []
+    for lig_id, completed in prepare_molecules_batch(
+            [tuple(x) for x in ligands_to_convert], gypsum_params,
+            gypsum_timeout_limit, gypsum_log_path
+    ):
+        if completed is False:
+            lig_failed_to_convert.append(lig_id)
+
+    sys.stdout.flush()
+
+    return lig_failed_to_convert
+
+
+def convert_single_ligand_to_pdbs(gypsum_log_path, gypsum_params,
+                                  gypsum_timeout_limit, pdb_subfolder_path):
+    """
+    Convert a single ligand from a SMILES to 3D .sdf files with Gypsum and
+    then convert those .sdf files to .pdb files. This is used by the
+    streaming docking pipeline, which converts and docks each ligand within a
+    single job.
+
+    Inputs:
+    :param str gypsum_log_path: a path to the folder to place the log files
+        produced when running gypsum.
+    :param dict gypsum_params: dictionary of params to be feed to Gypsum-DL to
+        convert to 3D sdf for a single ligand
+    :param int gypsum_timeout_limit: the maximum amount of time to run Gypsum
+        for the ligand
+    :param str pdb_subfolder_path: Path of the folder to place all created pdb
+        files
+
+    Returns:
+    :returns: str lig_id: the name of the ligand if it failed to convert to 3D
+        or None if it successfully converted.
+    :returns: list pdb_files: the paths of the .pdb files made for the ligand
+    """
+
+    lig_id = run_gypsum_multiprocessing(
+        gypsum_log_path, gypsum_params, gypsum_timeout_limit
+    )
+    if lig_id is not None:
+        return lig_id, []
+
+    lig_id = gypsum_params["source"].split(os.sep)[-1].replace(".smi", "")
+    sdfs_folder_path = gypsum_params["output_folder"]
+    sdf_files = glob.glob("{}{}__*.sdf".format(sdfs_folder_path, lig_id))
+    for sdf_file_path in sdf_files:
+        convert_single_sdf_to_pdb(pdb_subfolder_path, sdf_file_path)
+
+    pdb_files = glob.glob("{}{}__*.pdb".format(pdb_subfolder_path, lig_id))
+
+    return None, pdb_files
+
+
 def check_gypsum_log_did_complete(log_file_path):
     """
     This function checks a log_file_path to see if the last line reads
@@ -393,7 +660,7 @@ def check_gypsum_log_did_complete(log_file_path):
 
     if str(lastline) == "TIMEOUT":
         return False
-    if str(lastline) == "FAILED ERRORS WITH THE LIGAND":
+    if str(lastline) == "FAILEDERRORSWITHTHELIGAND":
         return None
     # passes
     return True
@@ -437,12 +704,24 @@ def convert_sdf_to_pdbs(vars, gen_folder_path, sdfs_folder_path):
         os.makedirs(pdb_subfolder_path)
 
     job_inputs = []
+    num_already_converted = 0
     for file_path in files:
         if "params" in file_path:
             continue
+        if vars["resume_partial_generation"] is True:
+            # Skip the .sdf files which an earlier, interrupted attempt at
+            # this generation already converted to PDBs
+            file_basename = basename(file_path).split("__input1")[0]
+            if len(glob.glob("{}{}__*.pdb".format(pdb_subfolder_path, file_basename))) != 0:
+                num_already_converted = num_already_converted + 1
+                continue
         job_inputs.append(tuple([pdb_subfolder_path, file_path]))
     job_inputs = tuple(job_inputs)
 
+    if len(job_inputs) == 0 and num_already_converted != 0:
+        # Every .sdf was converted by the earlier attempt
+        return
+
     # Check that there are .sdf files to test. If not raise Exception
     if len(job_inputs) == 0:
         printout = "\n\nThere are no SDF files were found to convert to PDB. "
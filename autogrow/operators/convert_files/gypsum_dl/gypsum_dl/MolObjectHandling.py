@@ -327,3 +327,23 @@ def handle_frag_check(mol):
 
 
 #
+
+
+def canonicalize_smiles(smiles_string):
+    """
+    Get the canonical isomeric SMILES of a SMILES string. This is the key
+    AutoGrow's caches and stores use for a ligand, so the same molecule
+    written two different ways is only stored once.
+    Returns None if RDKit can not read the SMILES.
+    """
+    try:
+        mol = Chem.MolFromSmiles(smiles_string)
+    except:
+        return None
+    if mol is None:
+        return None
+
+    return Chem.MolToSmiles(mol, isomericSmiles=True)
+
+
+#
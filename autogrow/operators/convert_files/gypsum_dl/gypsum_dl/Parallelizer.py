@@ -28,8 +28,15 @@ system. (Description provided by Harrison Green.)
 """
 
 import __future__
+import atexit
 import multiprocessing
 import sys
+import traceback
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 MPI_installed = False
 try:
@@ -39,13 +46,19 @@ try:
 except:
     MPI_installed = False
 
+# Large read-only objects registered with Parallelizer.register_context().
+# Every worker keeps its own copy so jobs only need to carry their per-job
+# arguments. Job functions retrieve these using get_context(name).
+WORKER_CONTEXT = {}
+
 
 class Parallelizer(object):
     """
     Abstract parallelization class
     """
 
-    def __init__(self, mode=None, num_procs=None, flag_for_low_level=False):
+    def __init__(self, mode=None, num_procs=None, flag_for_low_level=False,
+                 dynamic_scheduling=False):
         """
         This will initialize the Parallelizer class and kick off the specific classes for multiprocessing and MPI.
 
@@ -72,8 +85,12 @@ class Parallelizer(object):
                                         This will be overriden and fixed to a single processor if mode==serial
         :param bol flag_for_low_level: this will override mode and number of processors and set it to a multiprocess as serial. This is useful because
                                 a low-level program in mpi mode referenced by a top level program in mpi mode will have terrible problems. This means you can't mpi-multiprocess inside an mpi-multiprocess.
+        :param bol dynamic_scheduling: only used in mpi mode. If True rank 0 hands out small chunks of jobs to the other ranks as they ask for work
+                                instead of splitting the jobs into equal chunks up front. This balances the load when jobs take very different amounts of time.
         """
 
+        self.dynamic_scheduling = dynamic_scheduling
+
         if mode == "none" or mode == "None":
             mode = None
 
@@ -106,6 +123,10 @@ class Parallelizer(object):
             # Default setting will be multiprocessing
             self.mode = "multiprocessing"
 
+        # A persistent pool of worker processes is only made if
+        # start_pool() is called
+        self.pool_obj = None
+
         # Start MPI MODE if applicable
         if self.mode == "mpi":
             self.parallel_obj = self.start(self.mode)
@@ -125,6 +146,35 @@ class Parallelizer(object):
         else:
             self.num_procs = self.compute_nodes()
 
+    def __getstate__(self):
+        """
+        The persistent pool of worker processes can not be pickled, so it is
+        left behind if this object is ever pickled.
+        """
+
+        state = self.__dict__.copy()
+        state["pool_obj"] = None
+        return state
+
+    def start_pool(self):
+        """
+        Start a persistent pool of worker processes for multiprocessing mode.
+        Every later call to run() reuses these processes instead of starting
+        new ones. The pool is stopped by end() or when the program exits.
+
+        This does nothing in mpi or serial mode, or if only a single
+        processor is used.
+        """
+
+        if self.mode != "multiprocessing" or self.num_procs <= 1:
+            return
+
+        if self.pool_obj is not None:
+            return
+
+        self.pool_obj = ParallelPool(self.num_procs)
+        atexit.register(self.pool_obj.end)
+
     def test_import_MPI(self, mode, flag_for_low_level=False):
         """
         This tests for the ability of importing the MPI sublibrary from mpi4py.
@@ -250,6 +300,12 @@ class Parallelizer(object):
 
         if mode == None:
             mode = self.mode
+
+        # Stop the persistent pool of worker processes if there is one
+        if self.pool_obj is not None:
+            self.pool_obj.end()
+            self.pool_obj = None
+
         if mode == "mpi":
 
             if self.HAS_MPI == True and self.parallel_obj != None:
@@ -259,6 +315,82 @@ class Parallelizer(object):
             else:
                 raise Exception("mpi4py package must be available to use mpi mode")
 
+    def register_context(self, name, context_obj):
+        """
+        Register a large read-only object which every worker keeps a copy of.
+        This is sent to each worker once rather than being pickled into every
+        job. Job functions retrieve it with get_context(name).
+
+        Registering a new object with the same name replaces the old one.
+
+        Inputs:
+        :param str name: the name to register the object under
+        :param python_obj context_obj: the read-only object to share with
+            the workers
+        """
+
+        WORKER_CONTEXT[name] = context_obj
+
+        if self.mode == "mpi":
+            if not self.HAS_MPI:
+                raise Exception("mpi4py package must be available to use mpi mode")
+            self.parallel_obj.register_context(name, context_obj)
+
+        if self.pool_obj is not None:
+            self.pool_obj.register_context(name, context_obj)
+
+    def update_context(self, name, update_obj):
+        """
+        Update an object registered with register_context() in place, by
+        calling its update() method with update_obj in this process and in
+        every worker. Only update_obj is sent to the workers, so an object
+        which grows during a run (ie. a set of already made ligands) doesn't
+        need to be sent again in full.
+
+        The update may be applied more than once to the same object (ie. in
+        serial mode this process is also the worker), so update() must not
+        change the object when given something it already holds.
+
+        Inputs:
+        :param str name: the name the object was registered under
+        :param python_obj update_obj: the argument to pass to the update()
+            method of the registered object
+        """
+
+        if name not in WORKER_CONTEXT.keys():
+            raise Exception(
+                "No context named {} was registered with the Parallelizer".format(name)
+            )
+        WORKER_CONTEXT[name].update(update_obj)
+
+        if self.mode == "mpi":
+            if not self.HAS_MPI:
+                raise Exception("mpi4py package must be available to use mpi mode")
+            self.parallel_obj.update_context(name, update_obj)
+
+        if self.pool_obj is not None:
+            self.pool_obj.update_context(name, update_obj)
+
+    def clear_context(self, name):
+        """
+        Remove an object registered with register_context() from the
+        workers.
+
+        Inputs:
+        :param str name: the name the object was registered under
+        """
+
+        if name in WORKER_CONTEXT.keys():
+            del WORKER_CONTEXT[name]
+
+        if self.mode == "mpi":
+            if not self.HAS_MPI:
+                raise Exception("mpi4py package must be available to use mpi mode")
+            self.parallel_obj.clear_context(name)
+
+        if self.pool_obj is not None:
+            self.pool_obj.clear_context(name)
+
     def run(self, args, func, num_procs=None, mode=None):
         """
         Run a task in parallel across the system.
@@ -324,13 +456,18 @@ class Parallelizer(object):
             if not self.HAS_MPI:
                 raise Exception("mpi4py package must be available to use mpi mode")
 
+            if self.dynamic_scheduling == True:
+                return self.parallel_obj.run_dynamic(func, args)
+
             return self.parallel_obj.run(func, args)
 
         elif mode == "multiprocessing":
-            return MultiThreading(args, num_procs, func)
+            if self.pool_obj is not None and num_procs == self.num_procs:
+                return self.pool_obj.run(args, func)
+            return MultiThreading(args, num_procs, func, WORKER_CONTEXT)
         else:
             # serial is running the ParallelThreading with num_procs=1
-            return MultiThreading(args, 1, func)
+            return MultiThreading(args, 1, func, WORKER_CONTEXT)
 
     def pick_mode(self):
         """
@@ -439,6 +576,31 @@ class ParallelMPI(object):
 
         self.COMM.bcast(None, root=0)
 
+    def register_context(self, name, context_obj):
+        """
+        Broadcast a read-only object to every worker, which keeps it in its
+        WORKER_CONTEXT until it is cleared or replaced.
+        """
+
+        self.COMM.bcast(Context_update_obj(name, context_obj), root=0)
+
+    def update_context(self, name, update_obj):
+        """
+        Broadcast an update of a read-only object to every worker, which
+        passes it to the update() method of its copy of the object.
+        """
+
+        self.COMM.bcast(
+            Context_update_obj(name, update_obj, is_update=True), root=0
+        )
+
+    def clear_context(self, name):
+        """
+        Remove a read-only object from the WORKER_CONTEXT of every worker.
+        """
+
+        self.COMM.bcast(Context_update_obj(name, None, True), root=0)
+
     def _worker(self):
         """
         Worker processors wait in this function to receive new jobs
@@ -451,6 +613,16 @@ class ParallelMPI(object):
             if func is None:
                 exit(0)
 
+            # update of the read-only context
+            if type(func) == Context_update_obj:
+                func.apply()
+                continue
+
+            # dynamically scheduled job
+            if type(func) == Dynamic_job_obj:
+                self._dynamic_worker(func.func)
+                continue
+
             # receive arguments
             args_chunk = self.COMM.scatter([], root=0)
 
@@ -469,6 +641,23 @@ class ParallelMPI(object):
                 ]
                 result_chunk = self.COMM.gather(result_chunk, root=0)
 
+    def _dynamic_worker(self, func):
+        """
+        Worker processors ask rank 0 for a chunk of jobs, run it, and send the
+        results back with the request for the next chunk until rank 0 replies
+        with None.
+        """
+        message = None
+        while True:
+            self.COMM.send(message, dest=0)
+            chunk = self.COMM.recv(source=0)
+            if chunk is None:
+                return
+
+            start, args_chunk = chunk
+            message = (start, [func(*arg) for arg in args_chunk])
+            sys.stdout.flush()
+
     def handle_undersized_jobs(self, arr, n):
         if len(arr) > n:
             printout = "the length of the package is bigger than the length of the number of nodes!"
@@ -612,10 +801,223 @@ class ParallelMPI(object):
         sys.stdout.flush()
         return results
 
+    def run_dynamic(self, func, args, chunk_size=None):
+        """
+        Run a function in parallel across the current MPI cluster using
+        dynamic scheduling.
+
+        Rank 0 acts as the master. It hands out small chunks of args to the
+        worker ranks as they ask for work and collects the results as they
+        arrive, so a rank stuck on a few slow jobs does not hold up the others.
+
+        * func is a pure function of type (A)->(B)
+        * args is a list of type list(A)
+
+        Returns the result of type list(B) where result[i] = func(args[i]).
+
+        :param int chunk_size: the number of jobs handed out per request. If
+            None a small chunk size is picked from the number of jobs and ranks.
+        """
+        num_of_args_start = len(args)
+        if num_of_args_start == 0:
+            return []
+        args = self.check_and_format_args(args)
+
+        size = self.COMM.Get_size()
+        if size == 1:
+            # There are no worker ranks so run everything on rank 0
+            return [func(*arg) for arg in args]
+
+        num_workers = size - 1
+        if chunk_size is None:
+            chunk_size = max(1, num_of_args_start // (num_workers * 10))
+
+        chunks = [
+            (start, args[start : start + chunk_size])
+            for start in range(0, num_of_args_start, chunk_size)
+        ]
+
+        # tell the workers to start requesting jobs
+        self.COMM.bcast(Dynamic_job_obj(func), root=0)
+
+        results = [None] * num_of_args_start
+        status = mpi4py.MPI.Status()
+        next_chunk = 0
+        num_workers_done = 0
+        while num_workers_done < num_workers:
+            message = self.COMM.recv(source=mpi4py.MPI.ANY_SOURCE, status=status)
+            worker_rank = status.Get_source()
+
+            # A message is either None (first request) or the results of the
+            # last chunk this worker ran
+            if message is not None:
+                start, result_chunk = message
+                results[start : start + len(result_chunk)] = result_chunk
+
+            if next_chunk < len(chunks):
+                self.COMM.send(chunks[next_chunk], dest=worker_rank)
+                next_chunk = next_chunk + 1
+            else:
+                self.COMM.send(None, dest=worker_rank)
+                num_workers_done = num_workers_done + 1
+
+        sys.stdout.flush()
+        return results
+
 
 #
 
 
+class ParallelPool(object):
+    """
+    A persistent pool of worker processes for multiprocessing mode. The
+    processes are started once and reused by every call to run() so the cost
+    of starting processes and importing modules is only paid once.
+    """
+
+    def __init__(self, num_procs):
+        """
+        Start the worker processes.
+
+        :param int num_procs: the number of worker processes to start
+        """
+
+        self.num_procs = num_procs
+        self.task_queue = multiprocessing.Queue()
+        self.done_queue = multiprocessing.Queue()
+
+        # Each worker has its own control queue so context updates reach
+        # every worker rather than whichever worker grabs them first.
+        self.control_queues = [multiprocessing.Queue() for i in range(num_procs)]
+        self.context_version = 0
+
+        self.processes = []
+        for i in range(num_procs):
+            process = multiprocessing.Process(
+                target=pool_worker,
+                args=(
+                    self.task_queue,
+                    self.done_queue,
+                    self.control_queues[i],
+                    dict(WORKER_CONTEXT),
+                    self.context_version,
+                ),
+            )
+            process.start()
+            self.processes.append(process)
+
+        self.running = True
+
+    def register_context(self, name, context_obj):
+        """
+        Send a read-only object to every worker process.
+        """
+
+        self.context_version = self.context_version + 1
+        update = Context_update_obj(name, context_obj, False, self.context_version)
+        for control_queue in self.control_queues:
+            control_queue.put(update)
+
+    def update_context(self, name, update_obj):
+        """
+        Send an update of a read-only object to every worker process, which
+        passes it to the update() method of its copy of the object.
+        """
+
+        self.context_version = self.context_version + 1
+        update = Context_update_obj(
+            name, update_obj, False, self.context_version, is_update=True
+        )
+        for control_queue in self.control_queues:
+            control_queue.put(update)
+
+    def clear_context(self, name):
+        """
+        Remove a read-only object from every worker process.
+        """
+
+        self.context_version = self.context_version + 1
+        update = Context_update_obj(name, None, True, self.context_version)
+        for control_queue in self.control_queues:
+            control_queue.put(update)
+
+    def run(self, inputs, task_name):
+        """
+        Run a function over a list of inputs using the worker processes.
+
+        :param list inputs: a list of lists/tuples, each containing the
+            arguments for a single job
+        :param python_obj task_name: the function to run
+
+        :returns: list results: the results of every job in the same order
+            as inputs
+        """
+
+        if len(inputs) == 0:
+            return []
+
+        if self.running is False:
+            raise Exception("The Parallelizer pool has already been ended")
+
+        inputs = check_and_format_inputs_to_list_of_tuples(inputs)
+
+        # Jobs are tagged with the current context version so a worker
+        # applies every pending context update before running them.
+        for index, item in enumerate(inputs):
+            if not isinstance(item, tuple):
+                item = (item,)
+            self.task_queue.put((index, (task_name, item), self.context_version))
+
+        results = []
+        while len(results) < len(inputs):
+            try:
+                results.append(self.done_queue.get(timeout=10))
+            except queue.Empty:
+                for process in self.processes:
+                    if process.is_alive() is False:
+                        self.running = False
+                        raise Exception(
+                            "A Parallelizer worker process died unexpectedly"
+                        )
+
+        results.sort(key=lambda tup: tup[0])
+        results = [item[1] for item in results]
+
+        for result in results:
+            if type(result) == Worker_error_obj:
+                raise Exception(
+                    "A Parallelizer job failed with the following "
+                    + "error:\n{}".format(result.error_message)
+                )
+
+        return results
+
+    def end(self):
+        """
+        Tell the worker processes to stop and wait for them to exit.
+        """
+
+        if self.running is False:
+            return
+        self.running = False
+
+        for i in range(self.num_procs):
+            self.task_queue.put("STOP")
+
+        for process in self.processes:
+            process.join()
+
+
+class Worker_error_obj(object):
+    """
+    Returned by a pool worker in place of a result if the job raised an
+    exception
+    """
+
+    def __init__(self, error_message):
+        self.error_message = error_message
+
+
 class Empty_obj(object):
     """
     Create a unique Empty Object to hand to empty processors
@@ -624,6 +1026,60 @@ class Empty_obj(object):
     pass
 
 
+class Context_update_obj(object):
+    """
+    Message sent to MPI workers or pool workers to register, update or clear
+    a read-only context object
+    """
+
+    def __init__(self, name, context_obj, clear=False, version=None,
+                 is_update=False):
+        self.name = name
+        self.context_obj = context_obj
+        self.clear = clear
+        self.version = version
+        self.is_update = is_update
+
+    def apply(self):
+        """
+        Apply this update to the WORKER_CONTEXT of the current process
+        """
+
+        if self.clear == True:
+            if self.name in WORKER_CONTEXT.keys():
+                del WORKER_CONTEXT[self.name]
+        elif self.is_update == True:
+            WORKER_CONTEXT[self.name].update(self.context_obj)
+        else:
+            WORKER_CONTEXT[self.name] = self.context_obj
+
+
+class Dynamic_job_obj(object):
+    """
+    Message broadcast to MPI workers to start requesting chunks of jobs for
+    a dynamically scheduled run
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+
+def get_context(name):
+    """
+    Retrieve a read-only object registered with
+    Parallelizer.register_context() from within a job function.
+
+    :param str name: the name the object was registered under
+
+    :returns: the registered object
+    """
+    if name not in WORKER_CONTEXT.keys():
+        raise Exception(
+            "No context named {} was registered with the Parallelizer".format(name)
+        )
+    return WORKER_CONTEXT[name]
+
+
 #
 
 
@@ -635,7 +1091,7 @@ Adapted from examples on https://docs.python.org/2/library/multiprocessing.html
 
 
 
-def MultiThreading(inputs, num_procs, task_name):
+def MultiThreading(inputs, num_procs, task_name, context=None):
     """Initialize this object.
 
     Args:
@@ -644,6 +1100,8 @@ def MultiThreading(inputs, num_procs, task_name):
         num_procs (int): The number of processors to use.
         task_class_name (class): The class that governs what to do for each
             job on each processor.
+        context (dict): Read-only objects which are handed to each worker
+            process once rather than with every job.
     """
 
     results = []
@@ -671,7 +1129,7 @@ def MultiThreading(inputs, num_procs, task_name):
             output = job(*args)
             results.append(output)
     else:
-        results = start_processes(tasks, num_procs)
+        results = start_processes(tasks, num_procs, context)
 
     return results
 
@@ -681,7 +1139,9 @@ def MultiThreading(inputs, num_procs, task_name):
 ###
 
 
-def worker(input, output):
+def worker(input, output, context=None):
+    if context is not None:
+        WORKER_CONTEXT.update(context)
     for seq, job in iter(input.get, "STOP"):
         func, args = job
         result = func(*args)
@@ -689,6 +1149,23 @@ def worker(input, output):
         output.put(ret_val)
 
 
+def pool_worker(input, output, control, context, context_version):
+    WORKER_CONTEXT.update(context)
+    for seq, job, required_context_version in iter(input.get, "STOP"):
+        # apply any context updates sent before this job was submitted
+        while context_version < required_context_version:
+            update = control.get()
+            update.apply()
+            context_version = update.version
+
+        func, args = job
+        try:
+            result = func(*args)
+        except Exception:
+            result = Worker_error_obj(traceback.format_exc())
+        output.put((seq, result))
+
+
 def check_and_format_inputs_to_list_of_tuples(args):
     # Make sure args is a list of tuples
     if type(args) != list and type(args) != tuple:
@@ -737,7 +1214,7 @@ def count_processors(num_inputs, num_procs):
     return num_procs
 
 
-def start_processes(inputs, num_procs):
+def start_processes(inputs, num_procs, context=None):
     """
     Creates a queue of inputs and outputs
     """
@@ -752,7 +1229,9 @@ def start_processes(inputs, num_procs):
 
     # Start worker processes
     for i in range(num_procs):
-        multiprocessing.Process(target=worker, args=(task_queue, done_queue)).start()
+        multiprocessing.Process(
+            target=worker, args=(task_queue, done_queue, context)
+        ).start()
 
     # Get and print results
     results = []
@@ -22,6 +22,7 @@ import __future__
 import sys
 import json
 import os
+import contextlib
 from datetime import datetime
 from collections import OrderedDict
 
@@ -234,21 +235,8 @@ def prepare_molecules(args):
             msg = msg + "filename that ends in a .can, .smi, or .sdf extension?"
             Utils.exception(msg)
 
-        if detect_unassigned_bonds(smiles) is None:
-            Utils.log(
-                "WARNING: Throwing out SMILES because of unassigned bonds: " + smiles
-            )
-            continue
-
-        new_contnr = MolContainer(smiles, name, idx_counter, props)
-        if (
-            new_contnr.orig_smi_canonical == None
-            or type(new_contnr.orig_smi_canonical) != str
-        ):
-            Utils.log(
-                "WARNING: Throwing out SMILES because of it couldn't convert to mol: "
-                + smiles
-            )
+        new_contnr = make_mol_container(smiles, name, idx_counter, props)
+        if new_contnr is None:
             continue
 
         contnrs.append(new_contnr)
@@ -300,6 +288,134 @@ def prepare_molecules(args):
     params["Parallelizer"].end(params["job_manager"])
 
 
+def prepare_molecules_batch(smiles_data, args, timeout_limit=None, log_folder=None):
+    """Prepares a batch of small molecules, given in memory, with a single
+    setup. Unlike prepare_molecules(), which reads its molecules from the
+    "source" file and sets up the parameters, the Parallelizer and the
+    output folder every time it is called, this sets them up once and then
+    prepares and saves each molecule on its own. A molecule which fails or
+    times out doesn't affect the rest of the batch.
+
+    This is a generator. It yields the name of each molecule and whether it
+    was prepared, as soon as it is done. The molecules are prepared in
+    serial, as this is meant to be run within a job of a larger program.
+
+    :param smiles_data: A list of (SMILES, name) tuples.
+    :type smiles_data: list
+    :param args: The parameters, as for prepare_molecules(). "source" is not
+       used. output_folder must be given.
+    :type args: dict
+    :param timeout_limit: The maximum number of seconds to spend preparing a
+       single molecule. None by default, for no limit.
+    :type timeout_limit: float
+    :param log_folder: If given, the output of each molecule is written to a
+       file named NAME_log.txt in this folder rather than printed. If the
+       molecule times out the last line of its log reads "TIMEOUT" and if it
+       raised an error it reads "FAILED ERRORS WITH THE LIGAND". None by
+       default.
+    :type log_folder: str
+    :return: Yields the name of each molecule and True if it was prepared or
+       False if it failed or timed out.
+    :rtype: generator
+    """
+
+    # Set up the parameters once for the whole batch. The molecules come from
+    # smiles_data, so source is only a placeholder.
+    batch_args = {}
+    for key in args:
+        if key not in ["source", "json"]:
+            batch_args[key] = args[key]
+    batch_args["source"] = "batch.smi"
+    batch_args["job_manager"] = "serial"
+    batch_args["num_processors"] = 1
+    params = set_parameters(batch_args)
+    params["separate_output_files"] = True
+    params["add_html_output"] = False
+    params["Parallelizer"] = Parallelizer(
+        params["job_manager"], params["num_processors"], True
+    )
+
+    if os.path.exists(params["output_folder"]) == False:
+        os.makedirs(params["output_folder"])
+
+    if timeout_limit is not None:
+        # func_timeout is only needed when a time limit is given.
+        from func_timeout import func_timeout
+
+    for smiles, name in smiles_data:
+        log_file = None
+        if log_folder is not None:
+            log_file = open("{}{}_log.txt".format(log_folder, name), "w")
+
+        completed = True
+        with contextlib.redirect_stdout(
+            log_file if log_file is not None else sys.stdout
+        ):
+            try:
+                # Each molecule is in a container of its own, so it is saved
+                # as NAME__input1.sdf just as if it were prepared alone.
+                new_contnr = make_mol_container(smiles, name, 0, {})
+                if new_contnr is not None:
+                    if timeout_limit is None:
+                        execute_gypsum_dl([new_contnr], params)
+                    else:
+                        func_timeout(
+                            timeout_limit, execute_gypsum_dl,
+                            args=([new_contnr], params)
+                        )
+            except Exception:
+                completed = False
+                print("FAILED ERRORS WITH THE LIGAND")
+            except:
+                # func_timeout raises a BaseException when the molecule times
+                # out.
+                completed = False
+                print("TIMEOUT")
+
+            sys.stdout.flush()
+
+        if log_file is not None:
+            log_file.close()
+
+        yield name, completed
+
+
+def make_mol_container(smiles, name, index, props):
+    """Makes the molecule container of an input SMILES string.
+
+    :param smiles: The SMILES string.
+    :type smiles: str
+    :param name: The name of the molecule.
+    :type name: str
+    :param index: The index of the container.
+    :type index: int
+    :param props: The properties of the molecule.
+    :type props: dict
+    :return: The container, or None if the SMILES string had to be thrown
+       out.
+    :rtype: MolContainer.MolContainer|None
+    """
+
+    if detect_unassigned_bonds(smiles) is None:
+        Utils.log(
+            "WARNING: Throwing out SMILES because of unassigned bonds: " + smiles
+        )
+        return None
+
+    new_contnr = MolContainer(smiles, name, index, props)
+    if (
+        new_contnr.orig_smi_canonical == None
+        or type(new_contnr.orig_smi_canonical) != str
+    ):
+        Utils.log(
+            "WARNING: Throwing out SMILES because of it couldn't convert to mol: "
+            + smiles
+        )
+        return None
+
+    return new_contnr
+
+
 def execute_gypsum_dl(contnrs, params):
     """A function for doing all of the manipulations to each molecule.
 
@@ -702,6 +702,12 @@ class ProtSubstructFuncs:
 
     args = {}
 
+    # The substructures already loaded by this process, keyed by the pH
+    # range and precision they were loaded for. Gypsum-DL protonates each
+    # molecule with a new Protonate object, so this saves reading and
+    # compiling the substructures file for every molecule.
+    substructs_cache = {}
+
     @staticmethod
     def load_substructre_smarts_file():
         """Loads the substructure smarts file. Similar to just using readlines,
@@ -736,6 +742,10 @@ class ProtSubstructFuncs:
                  range.
         """
 
+        cache_key = (min_ph, max_ph, pka_std_range)
+        if cache_key in ProtSubstructFuncs.substructs_cache:
+            return ProtSubstructFuncs.substructs_cache[cache_key]
+
         subs = []
 
         for line in ProtSubstructFuncs.load_substructre_smarts_file():
@@ -762,6 +772,8 @@ class ProtSubstructFuncs:
 
                 sub["prot_states_for_pH"] = prot
                 subs.append(sub)
+
+        ProtSubstructFuncs.substructs_cache[cache_key] = subs
         return subs
 
     @staticmethod
@@ -25,8 +25,11 @@ rdkit.RDLogger.DisableLog("rdApp.*")
 
 
 import autogrow.operators.filter.execute_filters as Filter
+import autogrow.operators.filter.filter_verdict_cache as FilterVerdictCache
 import autogrow.operators.crossover.smiles_merge.smiles_merge as smiles_merge
 import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
+from autogrow.operators.ligand_registry import LigandRegistry
+from autogrow.operators.convert_files.gypsum_dl.gypsum_dl.Parallelizer import get_context
 
 
 
@@ -219,6 +222,23 @@ def make_crossovers(vars, generation_num, number_of_processors,
     new_ligands_list = []
     number_of_processors = int(vars["parallelizer"].return_node())
 
+    # Send the vars, the list of seed ligands and the filter verdict cache
+    # to the workers once rather than with every job. The verdict cache is
+    # made here, in the main process, so its on-disk store is only set up
+    # once.
+    vars["parallelizer"].register_context("crossover_vars", temp_vars)
+    vars["parallelizer"].register_context(
+        "crossover_ligands_list", list_previous_gen_smiles
+    )
+    vars["parallelizer"].register_context(
+        "crossover_verdict_cache",
+        FilterVerdictCache.get_filter_verdict_cache(vars),
+    )
+
+    # Set-backed registry of all smiles and smile_id's of all previously made
+    # smiles in this generation
+    registry = LigandRegistry(new_ligands_list)
+
     loop_counter = 0
     while loop_counter < 2000 and len(new_ligands_list) < num_crossovers_to_make:
 
@@ -242,12 +262,9 @@ def make_crossovers(vars, generation_num, number_of_processors,
             # smile_inputs = [x[0] for x in smile_pairs]
             # smile_names = [x[1] for x in smile_pairs]
 
-            # make a list of tuples for multi-processing Crossover
-            job_input = []
-            for i in smile_pairs:
-                temp = tuple([temp_vars, i, list_previous_gen_smiles])
-                job_input.append(temp)
-            job_input = tuple(job_input)
+            # make a list of tuples for multi-processing Crossover. The vars
+            # and seed ligands are retrieved from the registered context.
+            job_input = tuple([tuple([i]) for i in smile_pairs])
 
             # Example information:
             # result is a list of lists
@@ -257,7 +274,9 @@ def make_crossovers(vars, generation_num, number_of_processors,
             # Lig2_smile_pair = ["NCCCO","zinc456"]
             # Lig1 and lig 2 were used to generate the ligand_new_smiles
 
-            results = vars["parallelizer"].run(job_input, do_crossovers_smiles_merge)
+            results = vars["parallelizer"].run(
+                job_input, run_crossover_for_multithread
+            )
             results = [x for x in results if x is not None]
 
             for index, i in enumerate(results):
@@ -275,42 +294,24 @@ def make_crossovers(vars, generation_num, number_of_processors,
                 parent_lig_1_id = parent_lig_1_id.split(")")[-1]
                 parent_lig_2_id = parent_lig_2_id.split(")")[-1]
 
-                # Make a list of all smiles and smile_id's of all previously
-                # made smiles in this generation
-                list_of_already_made_smiles = []
-                list_of_already_made_id = []
-
-                # fill lists of all smiles and smile_id's of all previously
-                # made smiles in this generation
-                for x in new_ligands_list:
-                    list_of_already_made_smiles.append(x[0])
-                    list_of_already_made_id.append(x[1])
-
-                if child_lig_smile not in list_of_already_made_smiles:
+                if registry.has_smiles(child_lig_smile) is False:
                     # if the smiles string is unique to the list of previous
                     # smile strings in this round of reactions then we append
                     # it to the list of newly created ligands we append it
                     # with a unique ID, which also tracks the progress of the
                     # reactant
-                    is_name_unique = False
-                    while is_name_unique is False:
-
-                        # make unique ID with the 1st number being the
-                        # ligand_id_Name for the derived mol. second being the
-                        # lig2 number. Followed by Cross. folowed by the
-                        # generation number. followed by a  unique.
 
-                        random_id_num = random.randint(100, 1000000)
-                        new_lig_id = "({}+{})Gen_{}_Cross_{}".format(
+                    # make unique ID with the 1st number being the
+                    # ligand_id_Name for the derived mol. second being the
+                    # lig2 number. Followed by Cross. folowed by the
+                    # generation number. followed by a  unique.
+                    new_lig_id = registry.make_unique_id(
+                        "({}+{})Gen_{}_Cross_".format(
                             parent_lig_1_id,
                             parent_lig_2_id,
                             generation_num,
-                            random_id_num,
                         )
-
-                        # check name is unique
-                        if new_lig_id not in list_of_already_made_id:
-                            is_name_unique = True
+                    )
 
                     # make a temporary list containing the smiles string of
                     # the new product and the unique ID
@@ -319,9 +320,14 @@ def make_crossovers(vars, generation_num, number_of_processors,
                     # append the new ligand smile and ID to the list of all
                     # newly made ligands
                     new_ligands_list.append(ligand_info)
+                    registry.add(child_lig_smile, new_lig_id)
 
         loop_counter = loop_counter + 1
 
+    vars["parallelizer"].clear_context("crossover_vars")
+    vars["parallelizer"].clear_context("crossover_ligands_list")
+    vars["parallelizer"].clear_context("crossover_verdict_cache")
+
     if len(new_ligands_list) < num_crossovers_to_make:
         return None
 
@@ -368,7 +374,30 @@ def run_smiles_merge_prescreen(vars, ligands_list, ligand1_pair):
     return lig_2_pair
 
 
-def do_crossovers_smiles_merge(vars, lig1_smile_pair, ligands_list):
+def run_crossover_for_multithread(lig1_smile_pair):
+    """
+    This function runs do_crossovers_smiles_merge for a single Ligand 1 using
+    the vars, list of seed ligands and filter verdict cache from the read-only
+    context registered with the Parallelizer.
+
+    Inputs:
+    :param list lig1_smile_pair: a list with the SMILES string and info for
+        lig1
+
+    Returns:
+    :returns: list result: the output of do_crossovers_smiles_merge
+    """
+    vars = get_context("crossover_vars")
+    ligands_list = get_context("crossover_ligands_list")
+    verdict_cache = get_context("crossover_verdict_cache")
+
+    return do_crossovers_smiles_merge(
+        vars, lig1_smile_pair, ligands_list, verdict_cache
+    )
+
+
+def do_crossovers_smiles_merge(vars, lig1_smile_pair, ligands_list,
+                               verdict_cache=None):
     """
     This function will take the list of ligands to work on and the number in
     that list for the Ligand 1.
@@ -388,6 +417,8 @@ def do_crossovers_smiles_merge(vars, lig1_smile_pair, ligands_list):
         lig1
     :param list ligands_list: a list of all the seed ligands from the previous
         generation
+    :param FilterVerdictCache verdict_cache: the cache of the filter verdicts
+        of already filtered children. None to filter every child
 
     Returns:
     :returns: str ligand_new_smiles: a new mol's SMILES string
@@ -419,7 +450,7 @@ def do_crossovers_smiles_merge(vars, lig1_smile_pair, ligands_list):
         else:
             # Filter Here
             pass_or_not = Filter.run_filter_on_just_smiles(
-                ligand_new_smiles, vars["filter_object_dict"]
+                ligand_new_smiles, vars["filter_object_dict"], verdict_cache
             )
             if pass_or_not is False:
 
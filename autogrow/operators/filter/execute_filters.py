@@ -3,8 +3,7 @@ Top level for running filters.
 """
 import __future__
 
-import copy
-
+import numpy
 import rdkit
 from rdkit import Chem
 from rdkit.Chem.MolStandardize import rdMolStandardize
@@ -14,6 +13,8 @@ rdkit.RDLogger.DisableLog("rdApp.*")
 
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
 from autogrow.operators.filter.filter_classes.get_child_filter_class import get_all_subclasses
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorRecord
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorColumns
 
 import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
 from autogrow.operators.filter.filter_classes.filter_children_classes import *
@@ -71,6 +72,23 @@ def run_filter(vars, list_of_new_ligands):
     # Get the already generated dictionary of filter objects
     filter_object_dict = vars["filter_object_dict"]
 
+    filter_batch_size = vars["filter_batch_size"]
+    if filter_batch_size is not None and filter_batch_size > 0:
+        # Filter the ligands in chunks, one job per chunk
+        job_input = tuple(
+            [
+                tuple([list_of_new_ligands[i : i + filter_batch_size], filter_object_dict])
+                for i in range(0, len(list_of_new_ligands), filter_batch_size)
+            ]
+        )
+        results = vars["parallelizer"].run(job_input, run_filter_chunk)
+
+        ligands_which_passed_filter = []
+        for chunk_result in results:
+            ligands_which_passed_filter.extend(chunk_result)
+
+        return ligands_which_passed_filter
+
     # make a list of tuples for multi-processing Filter
     job_input = []
     for smiles_info in list_of_new_ligands:
@@ -104,7 +122,36 @@ def run_filter_mol(smiles_info, child_dict):
         returns None If the mol fails a filter.
     """
 
-    smiles_string = smiles_info[0]
+    mol = prepare_mol_for_filters(smiles_info[0])
+    if mol is None:
+        return None
+
+    if child_dict is not None:
+        # run through the filters
+        filter_result = run_all_selected_filters(mol, child_dict)
+
+        # see if passed
+        if filter_result is False:
+            return None
+        # it passed return the smiles_info
+        return smiles_info
+
+    # This will return None
+    return smiles_info
+
+
+def prepare_mol_for_filters(smiles_string):
+    """
+    Make the sanitized, deprotonated and uncharged mol of a SMILES string
+    which the filters are run on.
+
+    Inputs:
+    :param str smiles_string: a SMILES string
+
+    Returns:
+    :returns: rdkit.Chem.rdchem.Mol object mol: the mol to filter. None if
+        the SMILES string could not be sanitized.
+    """
 
     mol = Chem.MolFromSmiles(smiles_string, sanitize=False)
     # try sanitizing, which is necessary later
@@ -126,28 +173,107 @@ def run_filter_mol(smiles_info, child_dict):
     # This is done because logP is traditionally applied to neutral molecules
     uncharger_obj = rdMolStandardize.Uncharger()
     mol = uncharger_obj.uncharge(mol)
-    if mol is None:
-        return None
 
-    if child_dict is not None:
-        # run through the filters
-        filter_result = run_all_selected_filters(mol, child_dict)
+    return mol
 
-        # see if passed
-        if filter_result is False:
-            return None
-        # it passed return the smiles_info
-        return smiles_info
 
-    # This will return None
-    return smiles_info
+def run_filter_chunk(list_of_smiles_info, child_dict):
+    """
+    This runs a chunk of ligands through the selected filters. It gives the
+    same result as running run_filter_mol() on each ligand.
+
+    The filters which only compare descriptors to thresholds (ie. Lipinski
+    and Ghose) are run first on the whole chunk at once as numpy boolean
+    masks. Each is only run on the ligands which passed the filters before
+    it, so the substructure filters (ie. PAINS, BRENK and NIH) are only run
+    on the ligands which passed every threshold filter.
+
+    Inputs:
+    :param list list_of_smiles_info: a list of lists with info about a
+        ligand. ie. [["CCCCCCC","zinc123"], ["CCC","zinc456"]]
+    :param dict child_dict: This dictionary contains all the names of the
+        chosen filters as keys and the the filter objects as the items Or None if
+        User specifies no filters
 
+    Returns:
+    :returns: list ligands_which_passed_filter: the smiles_info of the
+        ligands which passed the filters, in the order they were given.
+    """
 
-def run_filter_on_just_smiles(smile_string, child_dict):
+    smiles_info_list = []
+    records = []
+    for smiles_info in list_of_smiles_info:
+        mol = prepare_mol_for_filters(smiles_info[0])
+        if mol is None:
+            continue
+        if child_dict is not None:
+            mol = MOH.check_sanitization(mol)
+            if mol is None:
+                continue
+        smiles_info_list.append(smiles_info)
+        records.append(DescriptorRecord(mol))
+
+    if child_dict is None:
+        return smiles_info_list
+
+    filter_objects = [child_dict[child] for child in list(child_dict.keys())]
+    column_filters = [x for x in filter_objects if x.uses_descriptor_columns is True]
+    other_filters = [x for x in filter_objects if x.uses_descriptor_columns is False]
+
+    # The indices of the ligands which have passed every filter so far
+    passed_indices = numpy.arange(len(records))
+    for filter_object in column_filters + other_filters:
+        if len(passed_indices) == 0:
+            break
+        columns = DescriptorColumns([records[i] for i in passed_indices.tolist()])
+        passed = filter_object.run_filter_on_columns(columns)
+        passed_indices = passed_indices[numpy.asarray(passed, dtype=bool)]
+
+    return [smiles_info_list[i] for i in passed_indices.tolist()]
+
+
+def run_filter_on_just_smiles(smile_string, child_dict, verdict_cache=None):
     """
     This takes a smiles_string and the selected filter list (child_dict) and
     runs it through the selected filters.
 
+    If a verdict_cache is given, a SMILES which was already filtered is not
+    sanitized or filtered again.
+
+    Inputs:
+    :param str smile_string: A smiles_string. example: smiles_info
+        ["CCCCCCC","zinc123"]
+    :param dict child_dict: This dictionary contains all the names of the
+        chosen filters as keys and the the filter objects as the items Or None if
+        User specifies no filters
+    :param FilterVerdictCache verdict_cache: the cache of the verdicts of
+        SMILES which were already filtered with child_dict. None to not cache
+        the verdicts
+
+    Returns:
+    :returns: str smile_string: smile_string if it passed the filter. returns
+        False If the mol fails a filter.
+    """
+
+    if verdict_cache is None:
+        return run_filter_on_smiles_uncached(smile_string, child_dict)
+
+    canonical_smiles, passed = verdict_cache.get_verdict(smile_string)
+    if passed is None:
+        passed = run_filter_on_smiles_uncached(smile_string, child_dict) is not False
+        verdict_cache.add_verdict(smile_string, canonical_smiles, passed)
+
+    if passed is False:
+        return False
+    return smile_string
+
+
+def run_filter_on_smiles_uncached(smile_string, child_dict):
+    """
+    This sanitizes a smiles_string and runs it through the selected filters
+    (child_dict). This is run by run_filter_on_just_smiles() for SMILES which
+    aren't in its verdict cache.
+
     Inputs:
     :param str smile_string: A smiles_string. example: smiles_info
         ["CCCCCCC","zinc123"]
@@ -189,6 +315,10 @@ def run_all_selected_filters(mol, child_dict):
     molecule. returns True if the mol passes all the chosen filters. returns
     False if the mol fails any of the filters.
 
+    Every filter is given the same DescriptorRecord of the mol, so a
+    descriptor used by several filters (ie. the molecular weight) is only
+    calculated once.
+
     Inputs:
     :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be tested
         if it passes the filters
@@ -200,18 +330,15 @@ def run_all_selected_filters(mol, child_dict):
         fails any filters.
     """
 
-    filters_failed = 0
     mol = MOH.check_sanitization(mol)
     if mol is None:
         return False
-    for child in list(child_dict.keys()):
-        mol_copy = copy.deepcopy(mol)
-        filter_function = child_dict[child].run_filter
-        if filter_function(mol_copy) is False:
-            filters_failed = filters_failed + 1
 
-    if filters_failed == 0:
-        return True
+    record = DescriptorRecord(mol)
+    for child in list(child_dict.keys()):
+        filter_function = child_dict[child].run_filter_on_record
+        if filter_function(record) is False:
+            # failed one or more filters
+            return False
 
-    # failed one or more filters
-    return False
+    return True
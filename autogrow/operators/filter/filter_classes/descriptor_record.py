@@ -0,0 +1,184 @@
+"""
+This script holds the descriptor record shared by the filters.
+
+Many of the filters test the same descriptors (ie. the Lipinski, Ghose and
+VandeWaterbeemd filters all use the exact molecular weight). Rather than each
+filter copying the mol and calculating its own descriptors, a single
+DescriptorRecord is made for each mol and handed to every filter. Each
+descriptor is only calculated the first time a filter asks for it.
+
+When filtering in batches (see execute_filters.run_filter_chunk) the records
+of a batch are wrapped in DescriptorColumns, which gives each descriptor as a
+numpy array so the threshold filters can test the batch with boolean masks.
+"""
+import __future__
+
+import copy
+
+import numpy
+import rdkit
+import rdkit.Chem as Chem
+import rdkit.Chem.Lipinski as Lipinski
+import rdkit.Chem.Crippen as Crippen
+import rdkit.Chem.Descriptors as Descriptors
+import rdkit.Chem.MolSurf as MolSurf
+
+# Disable the unnecessary RDKit warnings
+rdkit.RDLogger.DisableLog("rdApp.*")
+
+
+def get_ring_count(mol):
+    """
+    Get the number of rings in the smallest set of smallest rings of a mol.
+
+    Inputs:
+    :param rdkit.Chem.rdchem.Mol object mol: an rdkit mol object
+
+    Returns:
+    :returns: int ring_count: the number of rings
+    """
+
+    ring_count = Chem.rdmolops.GetSSSR(mol)
+    # Newer versions of RDKit return the rings rather than the number of them
+    if type(ring_count) is not int:
+        ring_count = len(ring_count)
+
+    return ring_count
+
+
+# The function to calculate each descriptor from a DescriptorRecord.
+# Descriptors ending in "_with_hs" are calculated on a copy of the mol with
+# explicit hydrogens (ie. the Ghose filter counts hydrogens as atoms).
+DESCRIPTOR_FUNCTIONS = {
+    "exact_mwt": lambda record: Descriptors.ExactMolWt(record.get_mol()),
+    "exact_mwt_with_hs": lambda record: Descriptors.ExactMolWt(
+        record.get_mol_with_hs()
+    ),
+    "num_atoms_with_hs": lambda record: record.get_mol_with_hs().GetNumAtoms(),
+    "mol_log_p": lambda record: Crippen.MolLogP(record.get_mol()),
+    "mol_log_p_with_hs": lambda record: Crippen.MolLogP(record.get_mol_with_hs()),
+    "mol_mr_with_hs": lambda record: Crippen.MolMR(record.get_mol_with_hs()),
+    "num_h_donors": lambda record: Lipinski.NumHDonors(record.get_mol()),
+    "num_h_acceptors": lambda record: Lipinski.NumHAcceptors(record.get_mol()),
+    "num_rotatable_bonds": lambda record: Lipinski.NumRotatableBonds(
+        record.get_mol()
+    ),
+    "tpsa": lambda record: MolSurf.TPSA(record.get_mol()),
+    "ring_count": lambda record: get_ring_count(record.get_mol()),
+}
+
+
+class DescriptorRecord(object):
+    """
+    The descriptors of a single mol, calculated lazily and kept so that no
+    descriptor is calculated twice.
+    """
+
+    def __init__(self, mol):
+        """
+        Inputs:
+        :param rdkit.Chem.rdchem.Mol object mol: the sanitized mol to be
+            tested by the filters
+        """
+
+        self.mol = mol
+        self.mol_with_hs = None
+        self.values = {}
+
+    def get_mol(self):
+        """
+        Returns:
+        :returns: rdkit.Chem.rdchem.Mol object mol: the mol of the record.
+            This is shared by every filter so it must not be modified.
+        """
+
+        return self.mol
+
+    def get_mol_copy(self):
+        """
+        Returns:
+        :returns: rdkit.Chem.rdchem.Mol object mol_copy: a copy of the mol
+            which can be modified without affecting the other filters
+        """
+
+        return copy.deepcopy(self.mol)
+
+    def get_mol_with_hs(self):
+        """
+        Returns:
+        :returns: rdkit.Chem.rdchem.Mol object mol_with_hs: a copy of the mol
+            with explicit hydrogens. This is made the first time it is needed.
+        """
+
+        if self.mol_with_hs is None:
+            self.mol_with_hs = Chem.AddHs(copy.deepcopy(self.mol))
+
+        return self.mol_with_hs
+
+    def get(self, descriptor_name):
+        """
+        Get a descriptor of the mol, calculating it if it hasn't been yet.
+
+        Inputs:
+        :param str descriptor_name: the name of the descriptor. Must be a key
+            of DESCRIPTOR_FUNCTIONS. ie. "exact_mwt"
+
+        Returns:
+        :returns: float value: the value of the descriptor
+        """
+
+        if descriptor_name not in self.values.keys():
+            if descriptor_name not in DESCRIPTOR_FUNCTIONS.keys():
+                raise Exception(
+                    "Descriptor {} is not in DESCRIPTOR_FUNCTIONS".format(
+                        descriptor_name
+                    )
+                )
+            self.values[descriptor_name] = DESCRIPTOR_FUNCTIONS[descriptor_name](self)
+
+        return self.values[descriptor_name]
+
+
+class DescriptorColumns(object):
+    """
+    The descriptors of a batch of mols as numpy arrays, so a filter can test
+    a whole batch at once. Each column is built from the DescriptorRecord of
+    every mol in the batch, so no descriptor is calculated twice.
+    """
+
+    def __init__(self, records):
+        """
+        Inputs:
+        :param list records: the DescriptorRecord of every mol in the batch
+        """
+
+        self.records = records
+        self.columns = {}
+
+    def __len__(self):
+        """
+        Returns:
+        :returns: int length: the number of mols in the batch
+        """
+
+        return len(self.records)
+
+    def get(self, descriptor_name):
+        """
+        Get a descriptor of every mol in the batch.
+
+        Inputs:
+        :param str descriptor_name: the name of the descriptor. Must be a key
+            of DESCRIPTOR_FUNCTIONS. ie. "exact_mwt"
+
+        Returns:
+        :returns: numpy.array column: the value of the descriptor for every mol
+        """
+
+        if descriptor_name not in self.columns.keys():
+            self.columns[descriptor_name] = numpy.array(
+                [record.get(descriptor_name) for record in self.records],
+                dtype=float,
+            )
+
+        return self.columns[descriptor_name]
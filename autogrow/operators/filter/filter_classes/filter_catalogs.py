@@ -0,0 +1,53 @@
+"""
+This script holds the RDKit FilterCatalogs used by the substructure filters
+(ie. PAINS, NIH and BRENK).
+
+A FilterCatalog is slow to build and large to pickle. The filter objects are
+carried inside vars["filter_object_dict"], which is pickled into every
+filter, mutation and crossover job, so the filter objects only hold the names
+of their catalogs. Each process builds a catalog the first time it is needed
+and keeps it in CATALOG_CACHE for the rest of the run.
+"""
+import __future__
+
+from rdkit.Chem import FilterCatalog
+from rdkit.Chem.FilterCatalog import FilterCatalogParams
+
+# The catalogs built by this process, keyed by the tuple of the names of the
+# RDKit catalogs merged into them. This is never pickled; each worker process
+# fills its own.
+CATALOG_CACHE = {}
+
+
+def get_filter_catalog(catalog_names):
+    """
+    Get a single FilterCatalog which merges one or more of the RDKit
+    predefined FilterCatalogs. The catalog is built the first time it is
+    asked for in this process and cached afterwards.
+
+    Inputs:
+    :param list catalog_names: the names of the RDKit predefined
+        FilterCatalogs to merge. ie. ["PAINS"] or ["BRENK"]. These are the
+        names of FilterCatalogParams.FilterCatalogs
+
+    Returns:
+    :returns: rdkit.Chem.rdfiltercatalog.FilterCatalog filters: a set of
+        RDKit Filters
+    """
+
+    catalog_key = tuple(sorted(set(catalog_names)))
+    if catalog_key in CATALOG_CACHE.keys():
+        return CATALOG_CACHE[catalog_key]
+
+    params = FilterCatalogParams()
+    for catalog_name in catalog_key:
+        if hasattr(FilterCatalogParams.FilterCatalogs, catalog_name) is False:
+            raise Exception(
+                "{} is not an RDKit FilterCatalog".format(catalog_name)
+            )
+        params.AddCatalog(getattr(FilterCatalogParams.FilterCatalogs, catalog_name))
+
+    filters = FilterCatalog.FilterCatalog(params)
+    CATALOG_CACHE[catalog_key] = filters
+
+    return filters
@@ -19,18 +19,13 @@ databases Journal of Combinatorial Chemistry, 1 (1999), pp. 55-68
 
 import __future__
 
-import copy
-
 import rdkit
-import rdkit.Chem as Chem
-import rdkit.Chem.Lipinski as Lipinski
-import rdkit.Chem.Crippen as Crippen
-import rdkit.Chem.Descriptors as Descriptors
 
 # Disable the unnecessary RDKit warnings
 rdkit.RDLogger.DisableLog("rdApp.*")
 
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorRecord
 
 
 class GhoseFilter(ParentFilter):
@@ -58,7 +53,24 @@ class GhoseFilter(ParentFilter):
     :param class ParentFilter: a parent class to initialize off
     """
 
+    uses_descriptor_columns = True
+
     def run_filter(self, mol):
+        """
+        Run the filter on a single mol. See run_filter_on_record().
+
+        Inputs:
+        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
+            tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter_on_record(DescriptorRecord(mol))
+
+    def run_filter_on_record(self, record):
         """
         This runs a Ghose filter for drug-likeliness. Ghose filter filters
         molecules by Molecular weight (MW), the number of atoms, and the logP
@@ -74,35 +86,60 @@ class GhoseFilter(ParentFilter):
             logP  between -0,4 and +5,6
 
         Inputs:
-        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
-            tested if it passes the filters
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
 
         Returns:
         :returns: bool bool: True if the mol passes the filter; False if it
             fails the filter
         """
-        # Make a copy of the mol so we can AddHs without affecting other filters
-        # number of atoms is altered by the presence/absence of hydrogens.
-        # Our Ghose filter counts hydrogenss towards atom count
-        copy_mol = copy.deepcopy(mol)
-        copy_mol = Chem.AddHs(copy_mol)
-        exact_mwt = Descriptors.ExactMolWt(copy_mol)
+        # The descriptors are from a copy of the mol with explicit hydrogens
+        # because the number of atoms is altered by the presence/absence of
+        # hydrogens. Our Ghose filter counts hydrogenss towards atom count
+        exact_mwt = record.get("exact_mwt_with_hs")
         if ((exact_mwt < 160) or (exact_mwt > 480)):
             return False
 
-        num_atoms = copy_mol.GetNumAtoms()
+        num_atoms = record.get("num_atoms_with_hs")
         if ((num_atoms < 20) or (num_atoms > 70)):
             return False
 
         # molar Refractivity
-        MolMR = Crippen.MolMR(copy_mol)
+        MolMR = record.get("mol_mr_with_hs")
         if ((MolMR < 40) or (MolMR > 130)):
             return False
 
         # molar LogP
-        mol_log_p = Crippen.MolLogP(copy_mol)
+        mol_log_p = record.get("mol_log_p_with_hs")
         if ((mol_log_p < -0.4) or (mol_log_p > 5.6)):
             return False
 
         # passed all filters
         return True
+
+    def run_filter_on_columns(self, columns):
+        """
+        Run the filter on a batch of mols with numpy. This gives the same
+        result as run_filter_on_record() for each mol.
+
+        Inputs:
+        :param DescriptorColumns columns: the descriptors of the batch of mols
+
+        Returns:
+        :returns: numpy.array passed: a bool for each mol. True if the mol
+            passes the filter; False if it fails the filter
+        """
+
+        exact_mwt = columns.get("exact_mwt_with_hs")
+        passed = (exact_mwt >= 160) & (exact_mwt <= 480)
+
+        num_atoms = columns.get("num_atoms_with_hs")
+        passed = passed & (num_atoms >= 20) & (num_atoms <= 70)
+
+        MolMR = columns.get("mol_mr_with_hs")
+        passed = passed & (MolMR >= 40) & (MolMR <= 130)
+
+        mol_log_p = columns.get("mol_log_p_with_hs")
+        passed = passed & (mol_log_p >= -0.4) & (mol_log_p <= 5.6)
+
+        return passed
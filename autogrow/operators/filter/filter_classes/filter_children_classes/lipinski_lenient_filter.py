@@ -18,13 +18,11 @@ import __future__
 
 import rdkit
 import rdkit.Chem as Chem
-import rdkit.Chem.Lipinski as Lipinski
-import rdkit.Chem.Crippen as Crippen
-import rdkit.Chem.Descriptors as Descriptors
 #Disable the unnecessary RDKit warnings
 rdkit.RDLogger.DisableLog('rdApp.*')
 
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorRecord
 
 
 class LipinskiLenientFilter(ParentFilter):
@@ -51,7 +49,24 @@ class LipinskiLenientFilter(ParentFilter):
     :param class ParentFilter: a parent class to initialize off
     """
 
+    uses_descriptor_columns = True
+
     def run_filter(self, mol):
+        """
+        Run the filter on a single mol. See run_filter_on_record().
+
+        Inputs:
+        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
+            tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter_on_record(DescriptorRecord(mol))
+
+    def run_filter_on_record(self, record):
         """
         This runs the Lenient Lipinski filter. Lipinski filter refines for
         orally available drugs. It filters molecules by Molecular weight (MW),
@@ -68,8 +83,8 @@ class LipinskiLenientFilter(ParentFilter):
             logP Max +5.0
 
         Inputs:
-        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
-            tested if it passes the filters
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
 
         Returns:
         :returns: bool bool: True if the mol passes the filter; False if it
@@ -78,18 +93,18 @@ class LipinskiLenientFilter(ParentFilter):
 
         violation_counter = 0
 
-        exact_mwt = Descriptors.ExactMolWt(mol)
+        exact_mwt = record.get("exact_mwt")
         if exact_mwt > 500:
             violation_counter = violation_counter + 1
 
-        num_hydrogen_bond_donors = Lipinski.NumHDonors(mol)
+        num_hydrogen_bond_donors = record.get("num_h_donors")
         if num_hydrogen_bond_donors > 5:
             violation_counter = violation_counter + 1
 
-        num_hydrogen_bond_acceptors = Lipinski.NumHAcceptors(mol)
+        num_hydrogen_bond_acceptors = record.get("num_h_acceptors")
         if num_hydrogen_bond_acceptors > 10:
             violation_counter = violation_counter + 1
-        mol_log_p = Crippen.MolLogP(mol)
+        mol_log_p = record.get("mol_log_p")
         if mol_log_p > 5:
             violation_counter = violation_counter + 1
 
@@ -98,3 +113,24 @@ class LipinskiLenientFilter(ParentFilter):
 
         # Failed more than two filters
         return False
+
+    def run_filter_on_columns(self, columns):
+        """
+        Run the filter on a batch of mols with numpy. This gives the same
+        result as run_filter_on_record() for each mol.
+
+        Inputs:
+        :param DescriptorColumns columns: the descriptors of the batch of mols
+
+        Returns:
+        :returns: numpy.array passed: a bool for each mol. True if the mol
+            passes the filter; False if it fails the filter
+        """
+
+        violation_counter = (columns.get("exact_mwt") > 500).astype(int)
+        violation_counter = violation_counter + (columns.get("num_h_donors") > 5)
+        violation_counter = violation_counter + (columns.get("num_h_acceptors") > 10)
+        violation_counter = violation_counter + (columns.get("mol_log_p") > 5)
+
+        # Allowed 1 violation
+        return violation_counter < 2
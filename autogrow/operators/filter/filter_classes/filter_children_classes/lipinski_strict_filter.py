@@ -18,13 +18,11 @@ import __future__
 
 import rdkit
 import rdkit.Chem as Chem
-import rdkit.Chem.Lipinski as Lipinski
-import rdkit.Chem.Crippen as Crippen
-import rdkit.Chem.Descriptors as Descriptors
 #Disable the unnecessary RDKit warnings
 rdkit.RDLogger.DisableLog('rdApp.*')
 
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorRecord
 
 
 class LipinskiStrictFilter(ParentFilter):
@@ -45,7 +43,24 @@ class LipinskiStrictFilter(ParentFilter):
     :param class ParentFilter: a parent class to initialize off
     """
 
+    uses_descriptor_columns = True
+
     def run_filter(self, mol):
+        """
+        Run the filter on a single mol. See run_filter_on_record().
+
+        Inputs:
+        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
+            tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter_on_record(DescriptorRecord(mol))
+
+    def run_filter_on_record(self, record):
         """
         This runs a Strict Lipinski filter. Lipinski filter refines for orally
         available drugs. It filters molecules by Molecular weight (MW), the
@@ -67,29 +82,49 @@ class LipinskiStrictFilter(ParentFilter):
         Delivery Reviews, 46 (2001), pp. 3-26
 
         Inputs:
-        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
-            tested if it passes the filters
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
 
         Returns:
         :returns: bool bool: True if the mol passes the filter; False if it
           fails the filter
         """
 
-        exact_mwt = Descriptors.ExactMolWt(mol)
+        exact_mwt = record.get("exact_mwt")
         if exact_mwt > 500:
             return False
 
-        num_hydrogen_bond_donors = Lipinski.NumHDonors(mol)
+        num_hydrogen_bond_donors = record.get("num_h_donors")
         if num_hydrogen_bond_donors > 5:
             return False
 
-        num_hydrogen_bond_acceptors = Lipinski.NumHAcceptors(mol)
+        num_hydrogen_bond_acceptors = record.get("num_h_acceptors")
         if num_hydrogen_bond_acceptors > 10:
             return False
 
-        mol_log_p = Crippen.MolLogP(mol)
+        mol_log_p = record.get("mol_log_p")
         if mol_log_p > 5:
             return False
 
         # Passed all filters
         return True
+
+    def run_filter_on_columns(self, columns):
+        """
+        Run the filter on a batch of mols with numpy. This gives the same
+        result as run_filter_on_record() for each mol.
+
+        Inputs:
+        :param DescriptorColumns columns: the descriptors of the batch of mols
+
+        Returns:
+        :returns: numpy.array passed: a bool for each mol. True if the mol
+            passes the filter; False if it fails the filter
+        """
+
+        passed = columns.get("exact_mwt") <= 500
+        passed = passed & (columns.get("num_h_donors") <= 5)
+        passed = passed & (columns.get("num_h_acceptors") <= 10)
+        passed = passed & (columns.get("mol_log_p") <= 5)
+
+        return passed
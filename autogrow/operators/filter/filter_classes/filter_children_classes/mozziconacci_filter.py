@@ -21,12 +21,17 @@ import __future__
 
 import rdkit
 import rdkit.Chem as Chem
-import rdkit.Chem.Lipinski as Lipinski
 
 # Disable the unnecessary RDKit warnings
 rdkit.RDLogger.DisableLog("rdApp.*")
 
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorRecord
+
+# The SMARTS patterns are only compiled once
+HALOGEN = Chem.MolFromSmarts("[*;#9,#17,#35,#53,#85]")
+OXYGEN = Chem.MolFromSmarts("[#8]")
+NITROGEN = Chem.MolFromSmarts("[#7]")
 
 
 class MozziconacciFilter(ParentFilter):
@@ -52,6 +57,21 @@ class MozziconacciFilter(ParentFilter):
     """
 
     def run_filter(self, mol):
+        """
+        Run the filter on a single mol. See run_filter_on_record().
+
+        Inputs:
+        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
+            tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter_on_record(DescriptorRecord(mol))
+
+    def run_filter_on_record(self, record):
         """
         This runs a Mozziconacci filter. Mozziconacci filter is a filter for
         Drug-likeliness which filters molecules by the number of:
@@ -64,34 +84,33 @@ class MozziconacciFilter(ParentFilter):
             # of Halogens: Max 7
 
         Inputs:
-        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
-            tested if it passes the filters
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
 
         Returns:
         :returns: bool bool: True if the mol passes the filter; False if it
             fails the filter
         """
 
-        halogen = Chem.MolFromSmarts("[*;#9,#17,#35,#53,#85]")
-        number_of_halogens = len(mol.GetSubstructMatches(halogen, maxMatches=8))
+        mol = record.get_mol()
+
+        number_of_halogens = len(mol.GetSubstructMatches(HALOGEN, maxMatches=8))
         if number_of_halogens > 7:
             return False
 
-        oxygen = Chem.MolFromSmarts("[#8]")
-        number_of_oxygens = len(mol.GetSubstructMatches(oxygen, maxMatches=2))
+        number_of_oxygens = len(mol.GetSubstructMatches(OXYGEN, maxMatches=2))
         if number_of_oxygens < 1:
             return False
 
-        nitrogen = Chem.MolFromSmarts("[#7]")
-        number_of_nitrogen = len(mol.GetSubstructMatches(nitrogen, maxMatches=2))
+        number_of_nitrogen = len(mol.GetSubstructMatches(NITROGEN, maxMatches=2))
         if number_of_nitrogen < 1:
             return False
 
-        num_rotatable_bonds = Lipinski.NumRotatableBonds(mol)
+        num_rotatable_bonds = record.get("num_rotatable_bonds")
         if num_rotatable_bonds > 15:
             return False
 
-        ring_count = Chem.rdmolops.GetSSSR(mol)
+        ring_count = record.get("ring_count")
         if ring_count > 6:
             return False
 
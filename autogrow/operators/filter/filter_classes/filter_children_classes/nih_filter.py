@@ -13,9 +13,7 @@ doi:10.1021/jm901070c.
 import __future__
 
 import rdkit
-from rdkit.Chem import FilterCatalog
-from rdkit.Chem.FilterCatalog import FilterCatalogParams
-
+import autogrow.operators.filter.filter_classes.filter_catalogs as FilterCatalogs
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
 
 
@@ -37,28 +35,22 @@ class NIHFilter(ParentFilter):
     :param class ParentFilter: a parent class to initialize off of.
     """
 
-    def __init__(self):
-        """
-        This loads in the filters which will be used.
-        """
-
-        self.filters = self.get_filters()
+    # The RDKit FilterCatalogs used by this filter. The catalog itself is
+    # built lazily by each process (see filter_catalogs.get_filter_catalog)
+    # so it isn't pickled with the filter object.
+    catalog_names = ["NIH"]
 
     def get_filters(self):
         """
-        This loads in the filters which will be used.
+        This loads in the filters which will be used. They are only built the
+        first time they are used in each process.
 
         Returns:
         :returns: rdkit.Chem.rdfiltercatalog.FilterCatalog filters: A set of
             RDKit Filters
         """
 
-        # Make a list of the NIH filter.
-        params = FilterCatalogParams()
-        params.AddCatalog(FilterCatalogParams.FilterCatalogs.NIH)
-        # This is our set of all the NIH filters
-        filters = FilterCatalog.FilterCatalog(params)
-        return filters
+        return FilterCatalogs.get_filter_catalog(self.catalog_names)
 
     def run_filter(self, mol):
         """
@@ -82,9 +74,26 @@ class NIHFilter(ParentFilter):
 
         # If the mol matches a mol in the filter list. we return a False (as
         # it failed the filter)
-        if self.filters.HasMatch(mol) is True:
+        if self.get_filters().HasMatch(mol) is True:
             return False
 
         # if No matches are found to filter list this will return a True
         # as it Passed the filter.
         return True
+
+    def run_filter_on_record(self, record):
+        """
+        Run the filter on the DescriptorRecord of a mol. Matching the filters
+        doesn't change the mol, so the mol of the record is used without
+        copying it.
+
+        Inputs:
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter(record.get_mol())
@@ -15,9 +15,7 @@ doi:10.1021/jm901137j.
 
 import __future__
 
-from rdkit.Chem import FilterCatalog
-from rdkit.Chem.FilterCatalog import FilterCatalogParams
-
+import autogrow.operators.filter.filter_classes.filter_catalogs as FilterCatalogs
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
 
 
@@ -40,42 +38,25 @@ class PAINSFilter(ParentFilter):
     :param class ParentFilter: a parent class to initialize off
     """
 
-    def __init__(self):
-        """
-        This loads in the filters which will be used.
-        """
-
-        self.filters_list = self.get_filters_list()
+    # The RDKit FilterCatalogs used by this filter. The RDKit PAINS catalog
+    # is the union of PAINS_A, PAINS_B and PAINS_C, so it is the only one
+    # needed. Matching the A, B and C catalogs as well would test every
+    # substructure twice. The catalog itself is built lazily by each process
+    # (see filter_catalogs.get_filter_catalog) so it isn't pickled with the
+    # filter object.
+    catalog_names = ["PAINS"]
 
-    def get_filters_list(self):
+    def get_filters(self):
         """
-        This loads in the filters which will be used.
+        This loads in the filters which will be used. They are only built the
+        first time they are used in each process.
 
         Returns:
         :returns: rdkit.Chem.rdfiltercatalog.FilterCatalog filters: A set of
             RDKit Filters
         """
 
-        # Make a list of all the different PAINS Filters. PAINS should include
-        # PAINS_A,PAINS_B, and PAINS_C, but because RDKit documentation
-        # doesn't specify this explicitly we have included all 4 of the PAINS
-        # FilterCatalogs for precaution.
-        params_PAINS_A = FilterCatalogParams()
-        params_PAINS_A.AddCatalog(FilterCatalogParams.FilterCatalogs.PAINS_A)
-        params_PAINS_B = FilterCatalogParams()
-        params_PAINS_B.AddCatalog(FilterCatalogParams.FilterCatalogs.PAINS_B)
-        params_PAINS_C = FilterCatalogParams()
-        params_PAINS_C.AddCatalog(FilterCatalogParams.FilterCatalogs.PAINS_C)
-        params_PAINS = FilterCatalogParams()
-        params_PAINS.AddCatalog(FilterCatalogParams.FilterCatalogs.PAINS)
-
-        params_list = [params_PAINS_A, params_PAINS_B, params_PAINS_C, params_PAINS]
-        filters_list = []
-        for param in params_list:
-            filter = FilterCatalog.FilterCatalog(param)
-            filters_list.append(filter)
-
-        return filters_list
+        return FilterCatalogs.get_filter_catalog(self.catalog_names)
 
     def run_filter(self, mol):
         """
@@ -96,14 +77,28 @@ class PAINSFilter(ParentFilter):
             False if it fails the filter
         """
 
-        # This is our set of all the PAINS filters
-        for filters in self.filters_list:
-
-            # If the mol matches a mol in the filter list we return a False
-            # (as it failed the filter)
-            if filters.HasMatch(mol) is True:
-                return False
+        # If the mol matches a mol in the filter list we return a False (as
+        # it failed the filter)
+        if self.get_filters().HasMatch(mol) is True:
+            return False
 
         # if No matches are found to filter list this will return a True as it
         # Passed the filter.
         return True
+
+    def run_filter_on_record(self, record):
+        """
+        Run the filter on the DescriptorRecord of a mol. Matching the filters
+        doesn't change the mol, so the mol of the record is used without
+        copying it.
+
+        Inputs:
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter(record.get_mol())
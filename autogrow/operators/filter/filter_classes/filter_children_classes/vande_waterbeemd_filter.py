@@ -17,13 +17,12 @@ import __future__
 
 import rdkit
 import rdkit.Chem as Chem
-import rdkit.Chem.MolSurf as MolSurf
-import rdkit.Chem.Descriptors as Descriptors
 
 # Disable the unnecessary RDKit warnings
 rdkit.RDLogger.DisableLog("rdApp.*")
 
 from autogrow.operators.filter.filter_classes.parent_filter_class import ParentFilter
+from autogrow.operators.filter.filter_classes.descriptor_record import DescriptorRecord
 
 
 class VandeWaterbeemdFilter(ParentFilter):
@@ -47,7 +46,24 @@ class VandeWaterbeemdFilter(ParentFilter):
     :returns: bool bool: True if the mol passes the filter; False if it fails the filter
     """
 
+    uses_descriptor_columns = True
+
     def run_filter(self, mol):
+        """
+        Run the filter on a single mol. See run_filter_on_record().
+
+        Inputs:
+        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
+            tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter_on_record(DescriptorRecord(mol))
+
+    def run_filter_on_record(self, record):
         """
         This runs a VandeWaterbeemd filter for drugs which are likely to be
         blood brain barrier permeable. VandeWaterbeemd filter filters
@@ -58,19 +74,37 @@ class VandeWaterbeemdFilter(ParentFilter):
             Polar Sureface Area: less than 90 A^2
 
         Inputs:
-        :param rdkit.Chem.rdchem.Mol object mol: An rdkit mol object to be
-            tested if it passes the filters
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
         Returns:
         :returns: bool bool: True if the mol passes the filter; False if it
             fails the filter
         """
 
-        exact_mwt = Descriptors.ExactMolWt(mol)
+        exact_mwt = record.get("exact_mwt")
         if exact_mwt >= 450:
             return False
-        psa = MolSurf.TPSA(mol)
+        psa = record.get("tpsa")
         if psa >= 90:
             return False
 
         # passes everything
         return True
+
+    def run_filter_on_columns(self, columns):
+        """
+        Run the filter on a batch of mols with numpy. This gives the same
+        result as run_filter_on_record() for each mol.
+
+        Inputs:
+        :param DescriptorColumns columns: the descriptors of the batch of mols
+
+        Returns:
+        :returns: numpy.array passed: a bool for each mol. True if the mol
+            passes the filter; False if it fails the filter
+        """
+
+        passed = columns.get("exact_mwt") < 450
+        passed = passed & (columns.get("tpsa") < 90)
+
+        return passed
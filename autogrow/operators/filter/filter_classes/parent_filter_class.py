@@ -3,6 +3,10 @@ This script holds the parent class for filtering.
 This is used as the basis for all filter classes.
 """
 import __future__
+
+import numpy
+
+
 class ParentFilter(object):
     """
     This is a script containing all of the filters for drug likeliness
@@ -23,6 +27,12 @@ class ParentFilter(object):
         2) NIHFilter
         3) BRENKFilter
     """
+
+    # True for filters which only compare descriptors to thresholds and
+    # override run_filter_on_columns(). When filtering in batches these are
+    # run before the other filters.
+    uses_descriptor_columns = False
+
     def get_name(self):
         """
         Returns the current class name.
@@ -42,3 +52,41 @@ class ParentFilter(object):
         """
 
         raise NotImplementedError("run_filter() not implemented")
+
+    def run_filter_on_record(self, record):
+        """
+        Run the filter on the DescriptorRecord of a mol. The record is shared
+        by every filter run on the mol so descriptors are only calculated
+        once. Filters which use the descriptors of the record should override
+        this. By default this runs run_filter() on a copy of the mol.
+
+        Inputs:
+        :param DescriptorRecord record: the descriptor record of the mol to
+            be tested if it passes the filters
+
+        Returns:
+        :returns: bool bool: True if the mol passes the filter; False if it
+            fails the filter
+        """
+
+        return self.run_filter(record.get_mol_copy())
+
+    def run_filter_on_columns(self, columns):
+        """
+        Run the filter on a batch of mols. Filters which only compare
+        descriptors to thresholds should override this to test the whole
+        batch with numpy. By default this runs run_filter_on_record() on
+        each mol.
+
+        Inputs:
+        :param DescriptorColumns columns: the descriptors of the batch of mols
+
+        Returns:
+        :returns: numpy.array passed: a bool for each mol. True if the mol
+            passes the filter; False if it fails the filter
+        """
+
+        return numpy.array(
+            [self.run_filter_on_record(record) is not False for record in columns.records],
+            dtype=bool,
+        )
@@ -0,0 +1,302 @@
+"""
+This script handles a cache of filter verdicts (ie. whether a SMILES passed
+the chosen filters).
+
+Every product made by mutation and crossover is filtered with
+execute_filters.run_filter_on_just_smiles(), which sanitizes the SMILES,
+deprotonates it and runs it through every chosen filter. As a population
+converges the same products are proposed over and over, so their verdicts are
+kept:
+    - in memory, in a bounded least recently used (LRU) cache in each process
+        (--filter_cache_size)
+    - optionally on disk, in a SQLite file in the Run folder
+        (filter_verdict_cache.sqlite) which every process of the run shares
+        (--use_filter_cache_file)
+
+Verdicts are keyed by the canonical SMILES of the ligand and the names of the
+chosen filters. The FilterVerdictCache object only holds these settings so
+it is cheap to pickle into jobs; the cached verdicts themselves are kept by
+each process in VERDICT_LRUS and STORE_CONNECTIONS. The FilterVerdictCache
+is made once in the main process (see get_filter_verdict_cache) and sent to
+the workers with the mutation and crossover contexts.
+
+The on-disk store uses SQLite's WAL journal, which relies on shared memory
+between the processes using the file. It must be on a local filesystem: do
+not use --use_filter_cache_file with a Run folder on a network filesystem
+(ie. NFS or Lustre), which is common when running under MPI across several
+nodes. Processes on different nodes can not share a WAL-mode file safely.
+"""
+import __future__
+
+import os
+import sqlite3
+import collections
+
+import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
+
+FILTER_CACHE_FILE_NAME = "filter_verdict_cache.sqlite"
+
+# The in-memory LRU caches of this process, keyed by the store path and the
+# filter key of the FilterVerdictCache using them. These are never pickled;
+# each worker process fills its own and keeps it between jobs.
+VERDICT_LRUS = {}
+# The connections of this process to the on-disk stores, keyed by the store
+# path and the process ID, so a forked process doesn't reuse the connection
+# of its parent.
+STORE_CONNECTIONS = {}
+
+
+def get_filter_key(child_dict):
+    """
+    Get the key of a set of filters. Verdicts are only shared between runs of
+    the same filters.
+
+    Inputs:
+    :param dict child_dict: This dictionary contains all the names of the
+        chosen filters as keys and the the filter objects as the items Or None
+        if User specifies no filters
+
+    Returns:
+    :returns: str filter_key: the sorted names of the filters joined by "+".
+        "No_Filters" if there are no filters
+    """
+
+    if child_dict is None or len(child_dict.keys()) == 0:
+        return "No_Filters"
+
+    return "+".join(sorted(child_dict.keys()))
+
+
+class FilterVerdictCache(object):
+    """
+    The settings of a filter verdict cache. The cached verdicts are kept by
+    each process, so this object can be pickled into jobs.
+    """
+
+    def __init__(self, filter_key, max_size, store_path=None):
+        """
+        Inputs:
+        :param str filter_key: the key of the chosen filters from
+            get_filter_key()
+        :param int max_size: the maximum number of verdicts each process keeps
+            in memory. 0 to not keep any in memory
+        :param str store_path: the path to the SQLite file to store the
+            verdicts in. None to only keep them in memory
+        """
+
+        self.filter_key = filter_key
+        self.max_size = max_size
+        self.store_path = store_path
+
+    def get_lru(self):
+        """
+        Get the in-memory LRU cache of this process.
+
+        Returns:
+        :returns: collections.OrderedDict lru: the verdicts kept in memory,
+            ordered from least to most recently used. None if verdicts aren't
+            kept in memory
+        """
+
+        if self.max_size <= 0:
+            return None
+
+        lru_key = (self.store_path, self.filter_key)
+        if lru_key not in VERDICT_LRUS.keys():
+            VERDICT_LRUS[lru_key] = collections.OrderedDict()
+
+        return VERDICT_LRUS[lru_key]
+
+    def get_connection(self):
+        """
+        Get the connection of this process to the on-disk store, opening it
+        (and making its table) the first time it is needed.
+
+        Returns:
+        :returns: sqlite3.Connection connection: a connection to the store.
+            None if there is no on-disk store
+        """
+
+        if self.store_path is None:
+            return None
+
+        connection_key = (self.store_path, os.getpid())
+        if connection_key not in STORE_CONNECTIONS.keys():
+            # Each verdict is written on its own, so commit every statement
+            # and don't wait for the disk. Losing the last few verdicts of a
+            # crashed run only means filtering those ligands again.
+            connection = sqlite3.connect(
+                self.store_path, timeout=60, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts ("
+                + "filter_key TEXT NOT NULL, "
+                + "smiles TEXT NOT NULL, "
+                + "passed INTEGER NOT NULL, "
+                + "PRIMARY KEY (filter_key, smiles))"
+            )
+            STORE_CONNECTIONS[connection_key] = connection
+
+        return STORE_CONNECTIONS[connection_key]
+
+    def get_from_lru(self, smiles_string):
+        """
+        Get a verdict from the in-memory LRU cache of this process.
+
+        Inputs:
+        :param str smiles_string: the SMILES string to look up
+
+        Returns:
+        :returns: bool passed: True if the SMILES passed the filters, False
+            if it failed and None if it isn't cached
+        """
+
+        lru = self.get_lru()
+        if lru is None or smiles_string not in lru.keys():
+            return None
+
+        lru.move_to_end(smiles_string)
+
+        return lru[smiles_string]
+
+    def add_to_lru(self, smiles_string, passed):
+        """
+        Add a verdict to the in-memory LRU cache of this process, dropping the
+        least recently used verdict if the cache is full.
+
+        Inputs:
+        :param str smiles_string: the SMILES string of the verdict
+        :param bool passed: True if the SMILES passed the filters
+        """
+
+        lru = self.get_lru()
+        if lru is None:
+            return
+
+        lru[smiles_string] = passed
+        lru.move_to_end(smiles_string)
+        while len(lru) > self.max_size:
+            lru.popitem(last=False)
+
+    def get_verdict(self, smiles_string):
+        """
+        Look up the verdict of a SMILES string. The SMILES is first looked up
+        as it is given (products are usually already canonical), then by its
+        canonical SMILES in memory and on disk.
+
+        Inputs:
+        :param str smiles_string: the SMILES string to look up
+
+        Returns:
+        :returns: str canonical_smiles: the canonical SMILES of the ligand, to
+            pass to add_verdict(). None if it is not needed or rdkit could not
+            read the SMILES
+        :returns: bool passed: True if the SMILES passed the filters, False
+            if it failed and None if it isn't cached
+        """
+
+        passed = self.get_from_lru(smiles_string)
+        if passed is not None:
+            return None, passed
+
+        canonical_smiles = MOH.canonicalize_smiles(smiles_string)
+        if canonical_smiles is None:
+            return None, None
+
+        if canonical_smiles != smiles_string:
+            passed = self.get_from_lru(canonical_smiles)
+            if passed is not None:
+                self.add_to_lru(smiles_string, passed)
+                return canonical_smiles, passed
+
+        connection = self.get_connection()
+        if connection is None:
+            return canonical_smiles, None
+
+        try:
+            row = connection.execute(
+                "SELECT passed FROM verdicts WHERE filter_key = ? AND smiles = ?",
+                (self.filter_key, canonical_smiles),
+            ).fetchone()
+        except sqlite3.Error:
+            return canonical_smiles, None
+        if row is None:
+            return canonical_smiles, None
+
+        passed = row[0] == 1
+        self.add_to_lru(canonical_smiles, passed)
+        if canonical_smiles != smiles_string:
+            self.add_to_lru(smiles_string, passed)
+
+        return canonical_smiles, passed
+
+    def add_verdict(self, smiles_string, canonical_smiles, passed):
+        """
+        Cache the verdict of a SMILES string.
+
+        Inputs:
+        :param str smiles_string: the SMILES string which was filtered
+        :param str canonical_smiles: its canonical SMILES from get_verdict().
+            If None the verdict is only cached in memory under smiles_string
+        :param bool passed: True if the SMILES passed the filters
+        """
+
+        self.add_to_lru(smiles_string, passed)
+        if canonical_smiles is None:
+            return
+
+        if canonical_smiles != smiles_string:
+            self.add_to_lru(canonical_smiles, passed)
+
+        connection = self.get_connection()
+        if connection is None:
+            return
+
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?)",
+                (self.filter_key, canonical_smiles, 1 if passed is True else 0),
+            )
+        except sqlite3.Error:
+            # The store is only an optimization. ie. it may be locked by
+            # another process for longer than the timeout
+            pass
+
+
+def get_filter_verdict_cache(vars):
+    """
+    Get the filter verdict cache of the run from the user variables. This
+    should be called in the main process, once per mutation or crossover
+    step, and the FilterVerdictCache passed to the workers.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: FilterVerdictCache verdict_cache: the settings of the cache.
+        None if neither the in-memory nor the on-disk cache is used
+    """
+
+    max_size = int(vars["filter_cache_size"])
+    store_path = None
+    if vars["use_filter_cache_file"] is True:
+        store_path = (
+            os.path.abspath(vars["output_directory"].replace('"', ""))
+            + os.sep
+            + FILTER_CACHE_FILE_NAME
+        )
+
+    if max_size <= 0 and store_path is None:
+        return None
+
+    verdict_cache = FilterVerdictCache(
+        get_filter_key(vars["filter_object_dict"]), max_size, store_path
+    )
+
+    # Open the on-disk store here, in the calling (main) process, so its file
+    # and table exist before any worker opens its own connection to it
+    verdict_cache.get_connection()
+
+    return verdict_cache
@@ -0,0 +1,95 @@
+"""
+A set-backed registry of the SMILES strings and IDs of ligands made within a
+generation. This is shared by mutation and crossover so checking whether a
+ligand or ID already exists does not require rebuilding and scanning lists.
+"""
+import __future__
+
+import random
+
+
+class LigandRegistry(object):
+    """
+    Keeps track of the canonical SMILES strings and unique IDs of all ligands
+    which have already been made.
+    """
+
+    def __init__(self, ligand_list=None):
+        """
+        Initialize the registry and optionally fill it with already made
+        ligands.
+
+        Inputs:
+        :param list ligand_list: a list of lists. Each sublist contains the
+            canonical SMILES string and the ID of a ligand. ie. [['O=C([O-])',
+            '(Gen_3_Mutant_37_747+ZINC51)Gen_4_Mutant_15_52']]
+        """
+        self.smiles_set = set([])
+        self.id_set = set([])
+
+        if ligand_list is not None:
+            self.update(ligand_list)
+
+    def add(self, smiles, lig_id):
+        """
+        Add a single ligand to the registry.
+
+        Inputs:
+        :param str smiles: the canonical SMILES string of the ligand
+        :param str lig_id: the unique ID of the ligand
+        """
+        self.smiles_set.add(smiles)
+        self.id_set.add(lig_id)
+
+    def update(self, ligand_list):
+        """
+        Add a list of ligands to the registry.
+
+        Inputs:
+        :param list ligand_list: a list of lists. Each sublist contains the
+            canonical SMILES string and the ID of a ligand.
+        """
+        for ligand_info in ligand_list:
+            self.add(ligand_info[0], ligand_info[1])
+
+    def has_smiles(self, smiles):
+        """
+        Check if a SMILES string has already been made.
+
+        Inputs:
+        :param str smiles: a canonical SMILES string
+
+        Returns:
+        :returns: bool bool: True if the SMILES string is in the registry
+        """
+        return smiles in self.smiles_set
+
+    def has_id(self, lig_id):
+        """
+        Check if a ligand ID has already been used.
+
+        Inputs:
+        :param str lig_id: a ligand ID
+
+        Returns:
+        :returns: bool bool: True if the ID is in the registry
+        """
+        return lig_id in self.id_set
+
+    def make_unique_id(self, id_prefix):
+        """
+        Make a ligand ID which is not already in the registry by appending
+        a random number to a prefix.
+
+        Inputs:
+        :param str id_prefix: the start of the ID, which the random number is
+            appended to. ie. "(ZINC123+ZINC456)Gen_1_Cross_"
+
+        Returns:
+        :returns: str new_lig_id: a ligand ID not already in the registry
+        """
+        while True:
+            random_id_num = random.randint(100, 1000000)
+            new_lig_id = "{}{}".format(id_prefix, random_id_num)
+            if self.has_id(new_lig_id) is False:
+                return new_lig_id
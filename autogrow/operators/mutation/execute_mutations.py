@@ -4,11 +4,13 @@ This function should contain all the info for executing the mutation functions
 
 import __future__
 
-import random
 import copy
 
 
 import autogrow.operators.mutation.smiles_click_chem.smiles_click_chem as SmileClickClass
+import autogrow.operators.filter.filter_verdict_cache as FilterVerdictCache
+from autogrow.operators.ligand_registry import LigandRegistry
+from autogrow.operators.convert_files.gypsum_dl.gypsum_dl.Parallelizer import get_context
 
 
 #######################################
@@ -52,10 +54,27 @@ def make_mutants(vars, generation_num, number_of_processors,
 
     number_of_processors = int(vars["parallelizer"].return_node())
 
-    # initialize the smileclickclass
+    # Set-backed registry of all smiles and smile_id's of all previously made
+    # smiles in this generation
+    registry = LigandRegistry(new_ligands_list)
+
+    # initialize the smileclickclass. It rejects products which are already
+    # in the registry
     a_smiles_click_chem_object = SmileClickClass.SmilesClickChem(
-        rxn_library_variables, new_mutation_smiles_list, vars["filter_object_dict"]
+        rxn_library_variables, registry, vars["filter_object_dict"],
+        FilterVerdictCache.get_filter_verdict_cache(vars)
+    )
+
+    # Send the SmilesClickChem object and the registry to the workers once
+    # rather than with every job. Afterwards only the newly made ligands are
+    # sent to update the registry of each worker.
+    vars["parallelizer"].register_context(
+        "smiles_click_chem_object", a_smiles_click_chem_object
     )
+    vars["parallelizer"].register_context("mutation_ligand_registry", registry)
+
+    # ligands made since the registry of the workers was last updated
+    ligands_to_update = []
 
     while loop_counter < 2000 and len(new_ligands_list) < num_mutants_to_make:
 
@@ -63,7 +82,11 @@ def make_mutants(vars, generation_num, number_of_processors,
 
         while len(new_ligands_list) < num_mutants_to_make and len(react_list) > 0:
 
-            a_smiles_click_chem_object.update_list_of_already_made_smiles(new_ligands_list)
+            if len(ligands_to_update) != 0:
+                vars["parallelizer"].update_context(
+                    "mutation_ligand_registry", ligands_to_update
+                )
+                ligands_to_update = []
             num_to_grab = num_mutants_to_make - len(new_ligands_list)
             num_to_make = num_to_grab
 
@@ -80,9 +103,7 @@ def make_mutants(vars, generation_num, number_of_processors,
             smile_inputs = [x[0] for x in smile_pairs]
             smile_names = [x[1] for x in smile_pairs]
 
-            job_input = tuple(
-                [tuple([smile, a_smiles_click_chem_object]) for smile in smile_inputs]
-            )
+            job_input = tuple([tuple([smile]) for smile in smile_inputs])
 
             results = vars["parallelizer"].run(
                 job_input, run_smiles_click_for_multithread
@@ -103,54 +124,36 @@ def make_mutants(vars, generation_num, number_of_processors,
                     parent_lig_id = smile_names[index]
                     zinc_id_comp_mol = i[2]
 
-                    # Make a list of all smiles and smile_id's of all
-                    # previously made smiles in this generation
-                    list_of_already_made_smiles = []
-                    list_of_already_made_id = []
-
-                    # fill lists of all smiles and smile_id's of all
-                    # previously made smiles in this generation
-                    for x in new_ligands_list:
-                        list_of_already_made_smiles.append(x[0])
-                        list_of_already_made_id.append(x[1])
-
-                    if child_lig_smile not in list_of_already_made_smiles:
+                    if registry.has_smiles(child_lig_smile) is False:
                         # if the smiles string is unique to the list of
                         # previous smile strings in this round of reactions
                         # then we append it to the list of newly created
                         # ligands we append it with a unique ID, which also
                         # tracks the progress of the reactant
-                        is_name_unique = False
-                        while is_name_unique is False:
-                            # make unique ID with the 1st number being the
-                            # parent_lig_id for the derived mol, Followed by
-                            # Mutant, folowed by the generationnumber,
-                            # followed by a unique.
-
-                            # get the unique ID (last few diget ID of the
-                            # parent mol
-                            parent_lig_id = parent_lig_id.split(")")[-1]
-
-                            random_id_num = random.randint(100, 1000000)
-                            if zinc_id_comp_mol is None:
-                                new_lig_id = "({})Gen_{}_Mutant_{}_{}".format(
-                                    parent_lig_id,
-                                    generation_num,
-                                    reaction_id_number,
-                                    random_id_num,
-                                )
-                            else:
-                                new_lig_id = "({}+{})Gen_{}_Mutant_{}_{}".format(
-                                    parent_lig_id,
-                                    zinc_id_comp_mol,
-                                    generation_num,
-                                    reaction_id_number,
-                                    random_id_num,
-                                )
-
-                            # check name is unique
-                            if new_lig_id not in list_of_already_made_id:
-                                is_name_unique = True
+
+                        # make unique ID with the 1st number being the
+                        # parent_lig_id for the derived mol, Followed by
+                        # Mutant, folowed by the generationnumber,
+                        # followed by a unique.
+
+                        # get the unique ID (last few diget ID of the
+                        # parent mol
+                        parent_lig_id = parent_lig_id.split(")")[-1]
+
+                        if zinc_id_comp_mol is None:
+                            id_prefix = "({})Gen_{}_Mutant_{}_".format(
+                                parent_lig_id,
+                                generation_num,
+                                reaction_id_number,
+                            )
+                        else:
+                            id_prefix = "({}+{})Gen_{}_Mutant_{}_".format(
+                                parent_lig_id,
+                                zinc_id_comp_mol,
+                                generation_num,
+                                reaction_id_number,
+                            )
+                        new_lig_id = registry.make_unique_id(id_prefix)
 
                         # make a temporary list containing the smiles string
                         # of the new product and the unique ID
@@ -159,9 +162,14 @@ def make_mutants(vars, generation_num, number_of_processors,
                         # append the new ligand smile and ID to the list of
                         # all newly made ligands
                         new_ligands_list.append(ligand_info)
+                        registry.add(child_lig_smile, new_lig_id)
+                        ligands_to_update.append(ligand_info)
 
         loop_counter = loop_counter + 1
 
+    vars["parallelizer"].clear_context("smiles_click_chem_object")
+    vars["parallelizer"].clear_context("mutation_ligand_registry")
+
     if len(new_ligands_list) < num_mutants_to_make:
         return None
 
@@ -169,13 +177,15 @@ def make_mutants(vars, generation_num, number_of_processors,
     return new_ligands_list
 
 
-def run_smiles_click_for_multithread(smile, a_smiles_click_chem_object):
+def run_smiles_click_for_multithread(smile):
     """
     This function takes a single smilestring and performs SmileClick on it.
 
     This is necessary for Multithreading as it is unable to execute
     multithread on a class function, but can thread a class run within a
-    function.
+    function. The SmilesClickChem object and the registry of already made
+    ligands are retrieved from the read-only context registered with the
+    Parallelizer.
 
     Inputs:
     :param str smile: a SMILES string
@@ -185,6 +195,10 @@ def run_smiles_click_for_multithread(smile, a_smiles_click_chem_object):
         if the reactions failed
     """
 
+    a_smiles_click_chem_object = get_context("smiles_click_chem_object")
+    a_smiles_click_chem_object.set_ligand_registry(
+        get_context("mutation_ligand_registry")
+    )
     result_of_run = a_smiles_click_chem_object.run_smiles_click(smile)
 
     return result_of_run
@@ -5,6 +5,9 @@ import random
 import os
 import json
 import copy
+import mmap
+
+import numpy
 
 import rdkit
 from rdkit import Chem
@@ -16,12 +19,153 @@ rdkit.RDLogger.DisableLog("rdApp.*")
 import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
 import autogrow.operators.filter.execute_filters as Filter
 
+# Per-process caches of compiled SMARTS patterns and reactions. These are
+# keyed by the SMARTS string so that every SmilesClickChem object unpickled
+# within a worker process reuses the same compiled rdkit objects rather than
+# re-parsing the reaction library for every job.
+COMPILED_SMARTS_CACHE = {}
+COMPILED_RXN_CACHE = {}
+
+# Per-process cache of memory-mapped complementary molecule libraries. Keyed
+# by the path to the .smi file, each item is a list of [mmap_obj, offsets]
+# where offsets is the array of byte offsets of the start of every line
+# followed by the size of the file.
+COMPLEMENTARY_MOL_FILE_CACHE = {}
+
+
+def get_compiled_smarts(smarts_string):
+    """
+    Retrieve the rdkit query mol for a SMARTS string, compiling it only the
+    first time it is requested within this process.
+
+    Inputs:
+    :param str smarts_string: a SMARTS string of a functional group
+
+    Returns:
+    :returns: rdkit.Chem.rdchem.Mol substructure: the compiled query mol
+    """
+    substructure = COMPILED_SMARTS_CACHE.get(smarts_string)
+    if substructure is None:
+        substructure = Chem.MolFromSmarts(smarts_string)
+        COMPILED_SMARTS_CACHE[smarts_string] = substructure
+    return substructure
+
+
+def get_compiled_reaction(rxn_smarts_string):
+    """
+    Retrieve the initialized rdkit reaction for a reaction SMARTS string,
+    compiling it only the first time it is requested within this process.
+
+    Inputs:
+    :param str rxn_smarts_string: a SMARTS-reaction string
+
+    Returns:
+    :returns: rdkit.Chem.rdChemReactions.ChemicalReaction rxn: the compiled
+        and initialized reaction
+    """
+    rxn = COMPILED_RXN_CACHE.get(rxn_smarts_string)
+    if rxn is None:
+        rxn = AllChem.ReactionFromSmarts(rxn_smarts_string)
+        rxn.Initialize()
+        COMPILED_RXN_CACHE[rxn_smarts_string] = rxn
+    return rxn
+
+
+def index_complementary_mol_file(filepath):
+    """
+    Make sure the line-offset index of a complementary molecule .smi file
+    exists next to the .smi file (as filepath + ".idx") and return the
+    offsets.
+
+    The index is a numpy int64 array with the byte offset of the start of
+    every non-blank line in the .smi file, followed by the size and the
+    modification time (st_mtime_ns) of the .smi file. The index is rebuilt if
+    it is missing or if either the size or the modification time of the .smi
+    file has changed. If the directory is not writable the index is kept in
+    memory only.
+
+    Inputs:
+    :param str filepath: the path to a complementary molecule .smi file
+
+    Returns:
+    :returns: numpy.ndarray offsets: the byte offsets of the start of every
+        line followed by the size of the file
+    """
+    index_file = filepath + ".idx"
+    file_stat = os.stat(filepath)
+    file_size = file_stat.st_size
+    file_mtime = file_stat.st_mtime_ns
+
+    if os.path.isfile(index_file) is True:
+        try:
+            index = numpy.load(index_file, mmap_mode="r")
+            if (
+                len(index) >= 2
+                and int(index[-2]) == file_size
+                and int(index[-1]) == file_mtime
+            ):
+                return index[:-1]
+        except:
+            pass
+
+    line_starts = []
+    position = 0
+    with open(filepath, "rb") as f:
+        for line in f:
+            if line.strip() != b"":
+                line_starts.append(position)
+            position = position + len(line)
+    line_starts.append(position)
+    index = numpy.array(line_starts + [file_mtime], dtype=numpy.int64)
+
+    # Write to a temporary file and move it into place so that no other
+    # process reads a partially written index
+    temp_index_file = "{}.{}.tmp".format(index_file, os.getpid())
+    try:
+        with open(temp_index_file, "wb") as f:
+            numpy.save(f, index)
+        os.replace(temp_index_file, index_file)
+    except:
+        if os.path.exists(temp_index_file) is True:
+            os.remove(temp_index_file)
+
+    return index[:-1]
+
+
+def get_complementary_mol_file(filepath):
+    """
+    Retrieve the memory-mapped .smi file and its line-offset index for a
+    complementary molecule library. The file is only opened and mapped the
+    first time it is requested within this process.
+
+    Inputs:
+    :param str filepath: the path to a complementary molecule .smi file
+
+    Returns:
+    :returns: list mapped_file: list of the mmap object of the .smi file and
+        the numpy array of line offsets [mmap_obj, offsets]
+    """
+    mapped_file = COMPLEMENTARY_MOL_FILE_CACHE.get(filepath)
+    if mapped_file is None:
+        offsets = index_complementary_mol_file(filepath)
+        if len(offsets) < 2:
+            raise Exception(
+                "Complementary molecule file has no molecules: {}".format(
+                    filepath
+                )
+            )
+        with open(filepath, "rb") as f:
+            mmap_obj = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mapped_file = [mmap_obj, offsets]
+        COMPLEMENTARY_MOL_FILE_CACHE[filepath] = mapped_file
+    return mapped_file
+
 
 class SmilesClickChem(object):
     """    This class will take a molecule and Mutate it by reacting it.    """
 
-    def __init__(self, rxn_library_variables, list_of_already_made_smiles,
-                 filter_object_dict):
+    def __init__(self, rxn_library_variables, ligand_registry,
+                 filter_object_dict, filter_verdict_cache=None):
         """
         init for SmilesClickChem. This will set up all the reaction and
         functional dictionaries required to Mutate a molecular
@@ -33,12 +177,15 @@ class SmilesClickChem(object):
             rxn_library_variables = [vars['rxn_library'],
             vars['rxn_library_file'],
             vars['function_group_library'],vars['complementary_mol_directory']]
-        :param list list_of_already_made_smiles: a list of lists. Each
-            sublist contains info about a smiles made in this generation via
-            mutation ie.[['O=C([O-])',
-            '(Gen_3_Mutant_37_747+ZINC51)Gen_4_Mutant_15_52']]
+        :param LigandRegistry ligand_registry: the registry of the ligands
+            already made in this generation via mutation. Products already in
+            the registry are rejected. None to not check for already made
+            products
         :param dict filter_object_dict: a dictionary of all filter objects
             which are to be applied to the newly created ligands.
+        :param FilterVerdictCache filter_verdict_cache: the cache of the
+            filter verdicts of already filtered products. None to not cache
+            the verdicts
         """
 
         # Unpackage the rxn_library_variables
@@ -60,26 +207,132 @@ class SmilesClickChem(object):
         self.complementary_mol_dict = self.retrieve_complementary_dictionary(
             rxn_library, complementary_mol_dir
         )
+        # Build the line-offset index of each complementary molecule library
+        # once so workers can memory-map them
+        for filepath in self.complementary_mol_dict.values():
+            index_complementary_mol_file(filepath)
+
+        # Compile all the functional group SMARTS and reaction SMARTS once
+        self.compile_rxn_library()
+
+        # Index which reactions each functional group can take part in
+        self.functional_group_to_rxn_dict = self.make_functional_group_to_rxn_dict()
 
-        # List of already predicted smiles
-        self.list_of_already_made_smiles = [x[0] for x in list_of_already_made_smiles]
+        # Registry of already predicted smiles. This is the same registry
+        # the new ligands are added to by execute_mutations.make_mutants
+        self.ligand_registry = ligand_registry
         # Dictionary containing all Filter class
         # objects to be impossed on the ligand
         self.filter_object_dict = filter_object_dict
+        # The cache of the filter verdicts of already filtered products
+        self.filter_verdict_cache = filter_verdict_cache
 
-    def update_list_of_already_made_smiles(self, list_of_already_made_smiles):
+    def compile_rxn_library(self):
         """
-        This updates the list of Smiles which have been made in this
-        generation via mutation.
+        Compile every functional group SMARTS and every reaction SMARTS of
+        the reaction library into rdkit objects. These are stored in
+        self.functional_group_mol_dict and self.compiled_reaction_dict and
+        are reused for every mutation attempt.
+        """
+        self.functional_group_mol_dict = {}
+        for group in self.functional_group_dict.keys():
+            self.functional_group_mol_dict[group] = get_compiled_smarts(
+                self.functional_group_dict[group]
+            )
+
+        self.compiled_reaction_dict = {}
+        for reaction_name in self.reaction_dict.keys():
+            self.compiled_reaction_dict[reaction_name] = get_compiled_reaction(
+                str(self.reaction_dict[reaction_name]["reaction_string"])
+            )
+
+    def make_functional_group_to_rxn_dict(self):
+        """
+        Make an inverted index from each functional group to the names of
+        all the reactions which use that functional group. This is used to
+        only sample from reactions which a parent molecule can take part in.
+
+        Returns:
+        :returns: dict functional_group_to_rxn_dict: a dictionary with the
+            functional group names as keys and a list of reaction names as
+            items. The reaction names are in the order of
+            self.list_of_reaction_names
+        """
+        functional_group_to_rxn_dict = {}
+        for reaction_name in self.list_of_reaction_names:
+            fun_groups_in_rxn = self.reaction_dict[reaction_name]["functional_groups"]
+            for group in set(fun_groups_in_rxn):
+                if group not in functional_group_to_rxn_dict.keys():
+                    functional_group_to_rxn_dict[group] = []
+                functional_group_to_rxn_dict[group].append(reaction_name)
+        return functional_group_to_rxn_dict
+
+    def rand_possible_rxn_list(self, list_subs_within_mol):
+        """
+        Get a randomly ordered list of the names of all reactions which use
+        at least one of the functional groups found in a molecule. This
+        produces the same ordering distribution for the usable reactions as
+        shuffling all reactions and skipping those which can not be used.
 
         Inputs:
-        :param list list_of_already_made_smiles: a list of lists. Each sublist
-            contains info about a smiles made in this generation via mutation.
-            ie. [['O=C([O-])',
-            '(Gen_3_Mutant_37_747+ZINC51)Gen_4_Mutant_15_52']]
+        :param list list_subs_within_mol: a list of the name of every
+            functional group found within the molecule
+
+        Returns:
+        :returns: list possible_rxn_list: a randomly ordered list of the names
+            of reactions which the molecule can take part in
         """
-        list_of_already_made_smiles = [x[0] for x in list_of_already_made_smiles]
-        self.list_of_already_made_smiles.extend(list_of_already_made_smiles)
+        possible_rxns = set([])
+        for group in list_subs_within_mol:
+            possible_rxns.update(self.functional_group_to_rxn_dict.get(group, []))
+
+        # Keep the reaction library order before shuffling so that a run is
+        # reproducible with a fixed random seed
+        possible_rxn_list = [
+            x for x in self.list_of_reaction_names if x in possible_rxns
+        ]
+        random.shuffle(possible_rxn_list)
+        return possible_rxn_list
+
+    def __getstate__(self):
+        """
+        The compiled rdkit objects are not sent when this object is pickled
+        for multiprocessing. Each worker recompiles them once through the
+        per-process caches when the object is unpickled.
+
+        The ligand registry is not sent either, as it grows while mutants are
+        made. Workers are given their copy of it with set_ligand_registry().
+
+        Returns:
+        :returns: dict state: the picklable attributes of this object
+        """
+        state = self.__dict__.copy()
+        state.pop("functional_group_mol_dict", None)
+        state.pop("compiled_reaction_dict", None)
+        state["ligand_registry"] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled SmilesClickChem object and retrieve its compiled
+        rdkit objects from the per-process caches.
+
+        Inputs:
+        :param dict state: the picklable attributes of this object
+        """
+        self.__dict__.update(state)
+        self.compile_rxn_library()
+
+    def set_ligand_registry(self, ligand_registry):
+        """
+        Set the registry of the ligands already made in this generation,
+        which products are checked against.
+
+        Inputs:
+        :param LigandRegistry ligand_registry: the registry of the ligands
+            already made in this generation via mutation
+        """
+        self.ligand_registry = ligand_registry
 
     def rxn_lib_format_json_dict_of_dict(self, old_dict):
         """
@@ -558,24 +811,30 @@ class SmilesClickChem(object):
         """
         infile = self.complementary_mol_dict[functional_group]
 
-        with open(infile, "r") as f:
-            random_comp_mol_line = random.choice(f.readlines())
-            random_comp_mol_line = (
-                random_comp_mol_line.replace("\n", "")
-                .replace("\t", " ")
-                .replace("    ", " ")
-            )
-            for i in range(10):
-                random_comp_mol_line.replace("  ", " ")
-            parts = random_comp_mol_line.split(
-                " "
-            )  # split line into parts separated by 4-spaces
-            # parts = [x for x in random_comp_mol_line.split(" ") if x!= ""]
-            # # split line into parts separated by 4-spaces
-
-            smile_list = parts[0]
-            zinc_name_list = parts[1]
-            random_comp_mol = [smile_list, zinc_name_list]
+        # Pick a random line using the memory-mapped file and its index of
+        # line offsets rather than reading the whole file
+        mmap_obj, offsets = get_complementary_mol_file(infile)
+        line_num = random.randrange(len(offsets) - 1)
+        start = int(offsets[line_num])
+        end = mmap_obj.find(b"\n", start, int(offsets[line_num + 1]))
+        if end == -1:
+            end = int(offsets[line_num + 1])
+        random_comp_mol_line = mmap_obj[start:end].decode("utf-8")
+
+        random_comp_mol_line = (
+            random_comp_mol_line.replace("\r", "")
+            .replace("\t", " ")
+            .replace("    ", " ")
+        )
+        parts = random_comp_mol_line.split(
+            " "
+        )  # split line into parts separated by 4-spaces
+        # parts = [x for x in random_comp_mol_line.split(" ") if x!= ""]
+        # # split line into parts separated by 4-spaces
+
+        smile_list = parts[0]
+        zinc_name_list = parts[1]
+        random_comp_mol = [smile_list, zinc_name_list]
 
         return random_comp_mol
 
@@ -597,10 +856,10 @@ class SmilesClickChem(object):
             to filter for reactions.
         """
         list_subs_within_mol = []
-        functional_group_dict = self.functional_group_dict
+        functional_group_mol_dict = self.functional_group_mol_dict
 
-        for key in list(functional_group_dict.keys()):
-            substructure = Chem.MolFromSmarts(functional_group_dict[key])
+        for key in list(functional_group_mol_dict.keys()):
+            substructure = functional_group_mol_dict[key]
             if mol_reprotanated.HasSubstructMatch(substructure):
                 list_subs_within_mol.append(key)
             else:
@@ -612,9 +871,10 @@ class SmilesClickChem(object):
 
     def run_smiles_click(self, ligand_smiles_string):
         """
-        This will take the shuffled list of reaction names
-        (self.shuffled_reaction_list) and test the Ligand to see if it is
-        capable of being used in the reaction. If the ligand is unable to be
+        This will take the shuffled list of reaction names which use a
+        functional group found in the Ligand (shuffled_reaction_list) and
+        test the Ligand to see if it is capable of being used in the
+        reaction. If the ligand is unable to be
         used in the reaction, then we move on to the next reaction in the
         list. If none work, we return a  None.
 
@@ -667,9 +927,9 @@ class SmilesClickChem(object):
             )
             return None
 
-        shuffled_reaction_list = self.rand_key_list(
-            self.reaction_dict
-        )  # Randomize the order of the list of reactions
+        # Randomize the order of the list of reactions which use at least one
+        # of the functional groups in the ligand
+        shuffled_reaction_list = self.rand_possible_rxn_list(list_subs_within_mol)
 
         tries = 0
         is_rxn_complete = False
@@ -700,9 +960,7 @@ class SmilesClickChem(object):
 
             # Determine whether to react using the protanated or
             # deprotanated form of the ligand
-            substructure = Chem.MolFromSmarts(
-                self.functional_group_dict[fun_groups_in_rxn[i]]
-            )
+            substructure = self.functional_group_mol_dict[fun_groups_in_rxn[i]]
 
             if mol_deprotanated.HasSubstructMatch(substructure) is True:
                 mol_to_use = copy.deepcopy(mol_deprotanated)
@@ -710,8 +968,7 @@ class SmilesClickChem(object):
                 mol_to_use = copy.deepcopy(mol_reprotanated)
             substructure = None
 
-            rxn = AllChem.ReactionFromSmarts(str(a_reaction_dict["reaction_string"]))
-            rxn.Initialize()
+            rxn = self.compiled_reaction_dict[reaction_name]
 
             # if the reaction requires only a single reactant we will attempt
             # to run the reaction
@@ -787,9 +1044,9 @@ class SmilesClickChem(object):
 
                         # Determine whether to react using the protanated or
                         # deprotanated form of the ligand
-                        substructure = Chem.MolFromSmarts(
-                            self.functional_group_dict[fun_groups_in_rxn[i]]
-                        )
+                        substructure = self.functional_group_mol_dict[
+                            fun_groups_in_rxn[i]
+                        ]
 
                         # lets give up to 100 tries to find a comp molecule
                         # which is viable
@@ -937,7 +1194,7 @@ class SmilesClickChem(object):
         This function will test whether the product passes all of the
             requirements:
             1) Mol sanitizes
-            2) It isn't in the self.list_of_already_made_smiles
+            2) It isn't in the self.ligand_registry
             3) It passes Filters
         Returns the smile if it passes; returns None if it fails.
 
@@ -981,12 +1238,16 @@ class SmilesClickChem(object):
         reaction_product_smilestring = Chem.MolToSmiles(
             reaction_product, isomericSmiles=True
         )
-        if reaction_product_smilestring in self.list_of_already_made_smiles:
+        if (
+            self.ligand_registry is not None
+            and self.ligand_registry.has_smiles(reaction_product_smilestring)
+        ):
             return None
 
         # Run through filters
         pass_or_not = Filter.run_filter_on_just_smiles(
-            reaction_product_smilestring, self.filter_object_dict
+            reaction_product_smilestring, self.filter_object_dict,
+            self.filter_verdict_cache
         )
         if pass_or_not is False:
             return None
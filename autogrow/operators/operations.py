@@ -17,9 +17,11 @@ rdkit.RDLogger.DisableLog("rdApp.*")
 
 import autogrow.operators.filter.execute_filters as Filter
 import autogrow.docking.ranking.ranking_mol as Ranking
+import autogrow.docking.ranking.population_store as PopulationStore
 import autogrow.operators.mutation.execute_mutations as Mutation
 import autogrow.operators.crossover.execute_crossover as execute_crossover
 import autogrow.operators.convert_files.conversion_to_3d as conversion_to_3d
+import autogrow.docking.docking_cache as docking_cache
 import autogrow.operators.convert_files.gypsum_dl.gypsum_dl.MolObjectHandling as MOH
 
 
@@ -84,22 +86,58 @@ def populate_generation(vars, generation_num):
         num_crossovers + num_mutations + num_elite_to_advance_from_previous_gen
     )
 
-    # Get starting compounds for Mutations
-    seed_list_mutations = make_seed_list(
-        vars,
-        source_compounds_list,
-        generation_num,
-        num_seed_diversity,
-        num_seed_dock_fitness,
-    )
+    # List of SMILES from mutation
+    new_mutation_smiles_list = []
 
-    # Save seed list for Mutations
-    save_ligand_list(
-        vars["output_directory"],
-        generation_num,
-        seed_list_mutations,
-        "Mutation_Seed_List",
-    )
+    # List of smiles from crossover
+    new_crossover_smiles_list = []
+
+    # List of ligands passed through from the previous generation
+    chosen_mol_to_pass_through_list = None
+
+    if vars["resume_partial_generation"] is True:
+        # Reuse the ligands an earlier, interrupted attempt at this
+        # generation already chose. The mutants and crossovers are only
+        # reused if all of them were made.
+        new_mutation_smiles_list = load_ligand_list(
+            vars["output_directory"], generation_num, "Chosen_Mutants"
+        )
+        if new_mutation_smiles_list is None or len(new_mutation_smiles_list) < num_mutations:
+            new_mutation_smiles_list = []
+        else:
+            print("REUSING THE MUTANTS OF AN EARLIER ATTEMPT")
+            new_mutation_smiles_list = new_mutation_smiles_list[:num_mutations]
+
+        new_crossover_smiles_list = load_ligand_list(
+            vars["output_directory"], generation_num, "Chosen_Crossovers"
+        )
+        if new_crossover_smiles_list is None or len(new_crossover_smiles_list) < num_crossovers:
+            new_crossover_smiles_list = []
+        else:
+            print("REUSING THE CROSSOVERS OF AN EARLIER ATTEMPT")
+            new_crossover_smiles_list = new_crossover_smiles_list[:num_crossovers]
+
+        chosen_mol_to_pass_through_list = load_ligand_list(
+            vars["output_directory"], generation_num, "Chosen_Elite_To_advance"
+        )
+
+    if len(new_mutation_smiles_list) < num_mutations:
+        # Get starting compounds for Mutations
+        seed_list_mutations = make_seed_list(
+            vars,
+            source_compounds_list,
+            generation_num,
+            num_seed_diversity,
+            num_seed_dock_fitness,
+        )
+
+        # Save seed list for Mutations
+        save_ligand_list(
+            vars["output_directory"],
+            generation_num,
+            seed_list_mutations,
+            "Mutation_Seed_List",
+        )
     sys.stdout.flush()
 
     print("MAKE MUTATIONS")
@@ -113,9 +151,6 @@ def populate_generation(vars, generation_num):
         vars["complementary_mol_directory"],
     ]
 
-    # List of SMILES from mutation
-    new_mutation_smiles_list = []
-
     # Make all the required ligands by mutations
     while len(new_mutation_smiles_list) < num_mutations:
         sys.stdout.flush()
@@ -182,30 +217,28 @@ def populate_generation(vars, generation_num):
 
     print("FINISHED MAKING MUTATIONS")
 
-    # Get starting compounds to seed Crossovers
-    seed_list_crossovers = make_seed_list(
-        vars,
-        source_compounds_list,
-        generation_num,
-        num_seed_diversity,
-        num_seed_dock_fitness,
-    )
+    if len(new_crossover_smiles_list) < num_crossovers:
+        # Get starting compounds to seed Crossovers
+        seed_list_crossovers = make_seed_list(
+            vars,
+            source_compounds_list,
+            generation_num,
+            num_seed_diversity,
+            num_seed_dock_fitness,
+        )
 
-    # Save seed list for Crossovers
-    save_ligand_list(
-        vars["output_directory"],
-        generation_num,
-        seed_list_crossovers,
-        "Crossover_Seed_List",
-    )
+        # Save seed list for Crossovers
+        save_ligand_list(
+            vars["output_directory"],
+            generation_num,
+            seed_list_crossovers,
+            "Crossover_Seed_List",
+        )
 
     print("MAKE CROSSOVERS")
     sys.stdout.flush()
 
     # Making Crossovers
-    # List of smiles from crossover
-    new_crossover_smiles_list = []
-
     # Make all the required ligands by Crossover
     while len(new_crossover_smiles_list) < num_crossovers:
         sys.stdout.flush()
@@ -276,12 +309,13 @@ def populate_generation(vars, generation_num):
     # via Elitism This handles creating a seed list and defining the advance
     # to next generation final selection
 
-    chosen_mol_to_pass_through_list = make_pass_through_list(
-        vars,
-        source_compounds_list,
-        num_elite_to_advance_from_previous_gen,
-        generation_num,
-    )
+    if chosen_mol_to_pass_through_list is None:
+        chosen_mol_to_pass_through_list = make_pass_through_list(
+            vars,
+            source_compounds_list,
+            num_elite_to_advance_from_previous_gen,
+            generation_num,
+        )
 
     if type(chosen_mol_to_pass_through_list) == str:
         printout = (
@@ -346,6 +380,13 @@ def populate_generation(vars, generation_num):
         vars["output_directory"], generation_num, full_generation_smiles_list, None
     )
 
+    # Ligands already in the docking cache are restored now, so they aren't
+    # converted to 3D
+    new_generation_smiles_list = docking_cache.remove_cached_ligands_before_conversion(
+        vars, new_gen_folder_path, full_generation_smiles_file,
+        new_generation_smiles_list
+    )
+
     # Save the File to convert to 3d
     smiles_to_convert_file, new_gen_folder_path = save_generation_smi(
         vars["output_directory"],
@@ -360,7 +401,10 @@ def populate_generation(vars, generation_num):
     # valid mol, but all the others will be valid the 1st Smiles in the
     # original .smi file is saved as .smi.1.sdf and 2nd file is saved as
     # .smi.2.sdf
-    conversion_to_3d.convert_to_3d(vars, smiles_to_convert_file, new_gen_folder_path)
+    if len(new_generation_smiles_list) != 0:
+        conversion_to_3d.convert_to_3d(vars, smiles_to_convert_file, new_gen_folder_path)
+    else:
+        print("EVERY NEW LIGAND WAS RESTORED FROM THE DOCKING CACHE")
     sys.stdout.flush()
 
     return full_generation_smiles_file, full_generation_smiles_list
@@ -486,19 +530,38 @@ def populate_generation_zero(vars, generation_num=0):
         ranked_file = new_gen_folder_path + os.sep + "generation_0_ranked.smi"
         with open(ranked_file, "w") as f:
             f.write(full_generation_smiles_list_printout)
+        PopulationStore.save_ranked_population(
+            ranked_file, full_generation_smiles_list, 0
+        )
         return already_docked, full_generation_smiles_file, full_generation_smiles_list
 
     # If you are to redock and convert the generation zero you will also need
     # to do the following:
 
+    # Ligands already in the docking cache are restored now, so they aren't
+    # converted to 3D
+    new_generation_smiles_list = docking_cache.remove_cached_ligands_before_conversion(
+        vars, new_gen_folder_path, full_generation_smiles_file,
+        new_generation_smiles_list
+    )
+    smiles_to_convert_file, new_gen_folder_path = save_generation_smi(
+        vars["output_directory"],
+        generation_num,
+        new_generation_smiles_list,
+        "_to_convert",
+    )
+
     # CONVERT SMILES TO .sdf USING GYPSUM and convert .sdf to .pdb with
     # rdkit This will output sdf files into a folder. The .smi.0.sdf file
     # is not a valid mol, but all the others will be valid the 1st Smiles
     # in the original .smi file is saved as .smi.1.sdf and 2nd file is
     # saved as .smi.2.sdf
-    conversion_to_3d.convert_to_3d(
-        vars, smiles_to_convert_file, new_gen_folder_path
-    )
+    if len(new_generation_smiles_list) != 0:
+        conversion_to_3d.convert_to_3d(
+            vars, smiles_to_convert_file, new_gen_folder_path
+        )
+    else:
+        print("EVERY LIGAND WAS RESTORED FROM THE DOCKING CACHE")
 
     return already_docked, full_generation_smiles_file, full_generation_smiles_list
 
@@ -678,7 +741,7 @@ def get_complete_list_prev_gen_or_source_compounds(vars, generation_num):
             print(printout)
             raise Exception(printout)
 
-        usable_list_of_smiles = Ranking.get_usable_format(source_file)
+        usable_list_of_smiles = Ranking.get_ranked_usable_format(source_file)
 
         if len(usable_list_of_smiles) == 0:
             printout = (
@@ -821,10 +884,20 @@ def make_seed_list(vars, source_compounds_list, generation_num, num_seed_diversi
     else:
         selector_choice = vars["selector_choice"]
         tourn_size = vars["tourn_size"]
+        # The ligands came from the previous generation's ranked .smi file so
+        # the selectors can read their scores from its population store
+        ranked_smi_file = vars[
+            "output_directory"
+        ] + "generation_{}{}generation_{}_ranked.smi".format(
+            generation_num - 1, os.sep, generation_num - 1
+        )
+        population = Ranking.get_population_table(
+            usable_list_of_smiles, ranked_smi_file
+        )
         # Get subset of the source_file based on diversity scores and docking
         # scores
         usable_list_of_smiles = Ranking.create_seed_list(
-            usable_list_of_smiles,
+            population,
             num_seed_diversity,
             num_seed_dock_fitness,
             selector_choice,
@@ -1077,6 +1150,40 @@ def save_generation_smi(output_directory, generation_num,
     return output_file_name, new_gen_folder_path
 
 
+def load_ligand_list(output_directory, generation_num, nomenclature_tag):
+    """
+    Load a list of ligands saved by save_ligand_list().
+
+    Inputs:
+    :param dict output_directory: the directory of the run with the
+        generation
+    :param int generation_num: The generation number
+    :param str nomenclature_tag: The str describing the ligand list. ie.
+        Chosen_Mutants
+
+    Returns:
+    :returns: list list_of_chosen_ligands: The formatted list of ligands. None
+        if the list was never saved.
+    """
+
+    input_file_name = "{}generation_{}{}SeedFolder{}{}_Gen_{}.smi".format(
+        output_directory, generation_num, os.sep, os.sep, nomenclature_tag,
+        generation_num
+    )
+    if os.path.exists(input_file_name) is False:
+        return None
+
+    list_of_chosen_ligands = []
+    with open(input_file_name, "r") as f:
+        for line in f.readlines():
+            line = line.replace("\n", "")
+            if line == "":
+                continue
+            list_of_chosen_ligands.append(line.split("\t"))
+
+    return list_of_chosen_ligands
+
+
 def save_ligand_list(output_directory, generation_num,
                      list_of_chosen_ligands, nomenclature_tag):
     """
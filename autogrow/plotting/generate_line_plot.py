@@ -7,6 +7,8 @@ import glob
 import matplotlib
 import matplotlib.pyplot as plt
 
+import autogrow.docking.ranking.population_store as PopulationStore
+
 
 def get_usable_format(infile):
     """
@@ -62,64 +64,111 @@ def get_usable_format(infile):
 
     return usable_list_of_smiles
 
-def get_average_score_per_gen(infolder, folder_list):
+def get_ranked_scores(rank_file):
     """
-    This script will get the average docking score from the ranked .smi file
-    from each generation.
+    This gets the fitness metric (ie. docking score) of every ligand in a
+    ranked .smi file, in the order of the file. The scores are read from the
+    population store saved with the ranked .smi file if it is up to date.
+
+    Inputs:
+    :param str rank_file: the path to a generation_N_ranked.smi file
+
+    Returns:
+    :returns: list scores: the float score of each ligand
+    """
+
+    population = PopulationStore.load_ranked_population(rank_file)
+    if population is not None:
+        return population.get_scores().tolist()
+
+    scores = []
+    # read as a tab delineated .smi file
+    with open(rank_file, "r") as f:
+        for line in f:
+            line = line.replace("\n", "")
+            parts = line.split("\t")
+            scores.append(float(parts[-2]))
+
+    return scores
+
+def get_scores_per_gen(vars, infolder, folder_list):
+    """
+    This gets the fitness metric (ie. docking score) of every ligand of each
+    generation. If the run database is used (--use_run_database) and has
+    every generation folder recorded, the scores are read from it with a
+    single query. Otherwise they are read from the ranked .smi file of each
+    generation folder.
 
     Inputs:
+    :param dict vars: dict of user variables which will govern how the
+        programs runs
     :param str infolder: the path of the folder which has all of the
         generation folders
     :param list folder_list: a list of generation folders for each generation
         within infolder
 
     Returns:
-    :returns: list usable_list_of_smiles: list of SMILES and their associated
-        information formatted into a list which is usable by the rest of Autogrow
+    :returns: dict scores_per_gen: the list of scores of each generation in
+        the order of its ranked .smi file, keyed by "generation_N"
     """
 
-    average_affinity_dict = {}
+    if vars.get("use_run_database") is True:
+        import autogrow.run_database as RunDatabase
+
+        scores_per_gen = RunDatabase.get_scores_per_generation(infolder)
+        if len(scores_per_gen.keys()) != 0 and all(
+                [x in scores_per_gen.keys() for x in folder_list]
+        ):
+            return scores_per_gen
+
+    scores_per_gen = {}
     for gen_folder in folder_list:
         gen_folder_name = infolder + gen_folder + os.sep
         ranked_file = glob.glob(gen_folder_name + "*_ranked.smi")
 
         for rank_file in ranked_file:
-            # write as a tab delineated .smi file
-            with open(rank_file, "r") as f:
-                gen_affinity_sum = float(0.0)
-                num_lines_counter = float(0.0)
-                for line in f:
-                    line = line.replace("\n", "")
-                    parts = line.split(
-                        "\t"
-                    )  # split line into parts separated by 4-spaces
+            gen_num = os.path.basename(rank_file).split("_")[1]
+            gen_name = "generation_{}".format(gen_num)
+            scores_per_gen[gen_name] = get_ranked_scores(rank_file)
 
-                    choice_list = []
-                    for i in range(0, len(parts)):
-                        choice_list.append(parts[i])
+    return scores_per_gen
 
-                    gen_affinity_sum = gen_affinity_sum + float(choice_list[-2])
-                    num_lines_counter = num_lines_counter + float(1.0)
+def get_average_score_per_gen(scores_per_gen):
+    """
+    This script will get the average docking score from the ranked .smi file
+    from each generation.
 
-            gen_affinity_average = gen_affinity_sum / num_lines_counter
+    Inputs:
+    :param dict scores_per_gen: the list of scores of each generation keyed
+        by "generation_N" (see get_scores_per_gen)
 
-            gen_num = os.path.basename(rank_file).split("_")[1]
-            gen_name = "generation_{}".format(gen_num)
-            average_affinity_dict[gen_name] = gen_affinity_average
+    Returns:
+    :returns: dict average_affinity_dict: dictionary of average affinity
+        scores for each generation
+    """
+
+    average_affinity_dict = {}
+    for gen_name in scores_per_gen.keys():
+        gen_affinity_sum = float(0.0)
+        num_lines_counter = float(0.0)
+        for score in scores_per_gen[gen_name]:
+            gen_affinity_sum = gen_affinity_sum + score
+            num_lines_counter = num_lines_counter + float(1.0)
+
+        gen_affinity_average = gen_affinity_sum / num_lines_counter
+        average_affinity_dict[gen_name] = gen_affinity_average
 
     print_gens(average_affinity_dict)
     return average_affinity_dict
 
-def get_average_top_score_per_gen(infolder, folder_list, top_score_per_gen):
+def get_average_top_score_per_gen(scores_per_gen, top_score_per_gen):
     """
     This script will get the average docking score of the top N number of
     ligands ranked .smi file from each generation.
 
     Inputs:
-    :param str infolder: the path of the folder which has all of the
-        generation folders
-    :param list folder_list: a list of generation folders for each generation
-        within infolder
+    :param dict scores_per_gen: the list of scores of each generation keyed
+        by "generation_N" (see get_scores_per_gen)
     :param int top_score_per_gen: the number of ligands to determine the
         average score. ie) if top_score_per_gen=50 it will return the average of
         the top 50 scores.
@@ -131,46 +180,20 @@ def get_average_top_score_per_gen(infolder, folder_list, top_score_per_gen):
 
     average_affinity_dict = {}
 
-    for gen_folder in folder_list:
-        gen_folder_name = infolder + gen_folder + os.sep
-        ranked_file = glob.glob(gen_folder_name + "*_ranked.smi")
+    for gen_name in scores_per_gen.keys():
+        scores = scores_per_gen[gen_name]
+        num_lines = len(scores)
 
-        for rank_file in ranked_file:
-            # Check number of lines
-            num_lines = 0
-            with open(rank_file, "r") as rf:
-                for line in rf:
-                    num_lines = num_lines + 1
-
-            if num_lines >= top_score_per_gen:
-                # read as a tab delineated .smi file
-                with open(rank_file, "r") as f:
-                    gen_affinity_sum = float(0.0)
-
-                    for i, line in enumerate(f.readlines()):
-                        if i >= top_score_per_gen:
-                            break
-                        line = line.replace("\n", "")
-                        parts = line.split(
-                            "\t"
-                        )  # split line into parts separated by 4-spaces
-
-                        choice_list = []
-                        for j in range(0, len(parts)):
-                            choice_list.append(parts[j])
-
-                        gen_affinity_sum = gen_affinity_sum + float(choice_list[-2])
-
-                    gen_affinity_average = gen_affinity_sum / top_score_per_gen
-
-                    gen_num = os.path.basename(rank_file).split("_")[1]
-                    gen_name = "generation_{}".format(gen_num)
-                    average_affinity_dict[gen_name] = gen_affinity_average
-
-            else:
-                gen_num = os.path.basename(rank_file).split("_")[1]
-                gen_name = "generation_{}".format(gen_num)
-                average_affinity_dict[gen_name] = "N/A"
+        if num_lines >= top_score_per_gen:
+            gen_affinity_sum = float(0.0)
+            for score in scores[:top_score_per_gen]:
+                gen_affinity_sum = gen_affinity_sum + score
+
+            gen_affinity_average = gen_affinity_sum / top_score_per_gen
+            average_affinity_dict[gen_name] = gen_affinity_average
+
+        else:
+            average_affinity_dict[gen_name] = "N/A"
 
     print_gens(average_affinity_dict)
     return average_affinity_dict
@@ -363,7 +386,7 @@ def run_plotter(vars, dict_of_averages, outfile):
         printout = printout + "too small to effectively plot. \n"
         print(printout)
 
-def print_data_table(infolder, folder_list):
+def print_data_table(vars, infolder, folder_list):
     """
     This function takes a folder of an Autogrow Run and a list of all folders
     within the infolder, and finds the average of each generation, the average
@@ -373,6 +396,8 @@ def print_data_table(infolder, folder_list):
     information as a dictionary of dictionaries.
 
     Inputs:
+    :param dict vars: dict of user variables which will govern how the
+        programs runs
     :param str infolder: a string for the file path to a directory containing
         an Autogrow run. ie) "PATH/Run_0/"
     :param list folder_list: a list of every generation folders within the
@@ -384,24 +409,26 @@ def print_data_table(infolder, folder_list):
         the overall average for each generation.
     """
 
+    scores_per_gen = get_scores_per_gen(vars, infolder, folder_list)
+
     print("Overall Scoring Average for all Compounds")
-    average_affinity_dict = get_average_score_per_gen(infolder, folder_list)
+    average_affinity_dict = get_average_score_per_gen(scores_per_gen)
     print("")
     print("Average for Top Scoring Compounds")
     print("Number of top scoring compounds: ", 50)
-    top_fifty_dict = get_average_top_score_per_gen(infolder, folder_list, 50)
+    top_fifty_dict = get_average_top_score_per_gen(scores_per_gen, 50)
     print("")
     print("Average for Top Scoring Compounds")
     print("Number of top scoring compounds: ", 20)
-    top_twenty_dict = get_average_top_score_per_gen(infolder, folder_list, 20)
+    top_twenty_dict = get_average_top_score_per_gen(scores_per_gen, 20)
     print("")
     print("Average for Top Scoring Compounds")
     print("Number of top scoring compounds: ", 10)
-    top_ten_dict = get_average_top_score_per_gen(infolder, folder_list, 10)
+    top_ten_dict = get_average_top_score_per_gen(scores_per_gen, 10)
     print("")
     print("Best Score per generation")
     print("Number of top scoring compounds: ", 1)
-    top_one_dict = get_average_top_score_per_gen(infolder, folder_list, 1)
+    top_one_dict = get_average_top_score_per_gen(scores_per_gen, 1)
     print("")
     print("")
     dict_of_averages = {}
@@ -439,5 +466,5 @@ def generate_figures(vars):
 
     folder_list.sort(key=lambda x: int(x.split("_")[1]))
 
-    dict_of_averages = print_data_table(infolder, folder_list)
+    dict_of_averages = print_data_table(vars, infolder, folder_list)
     run_plotter(vars, dict_of_averages, outfile)
@@ -0,0 +1,618 @@
+"""
+This script handles the optional SQLite run database (--use_run_database).
+
+The state of a run is otherwise spread over many small files in each
+generation folder (seed lists, Chosen_* lists, PDBs, PDBQTs, .vina files and
+the ranked .smi files). When the run database is used, AutoGrow4 also
+records every generation in a single SQLite file in the Run folder
+(run_database.sqlite) as it runs. sqlite3 is part of the python standard
+library so no database service is needed. The per-ligand files are still
+written; the database is a record of the run alongside them.
+
+The database has these tables:
+    - generations: one row per generation, with the last stage it finished
+        (started, populated, docked or completed), the scoring function, its
+        ranked .smi file and the number of ranked ligands
+    - ligands: every ligand made for a generation, with its SMILES, ID,
+        parent IDs, origin (source, mutation, crossover or elite), the
+        reaction number for mutants and its status. The status is updated
+        after each stage: populated, docked, ranked, or the stage it failed
+        at (failed_3d_conversion, failed_pdbqt_conversion, failed_docking or
+        failed_scoring, which includes failing to be rescored)
+    - ranked: every line of the ranked .smi file, with its rank, fitness
+        score, the score before ligand efficiency rescoring, diversity score
+        and the full tab separated line
+    - timings: the number of seconds each stage of a generation took
+
+A generation which was interrupted keeps the stage it reached and the status
+of its ligands, and autogrow_main_execute.determine_current_gen() uses the
+database to decide which generation to continue from.
+
+The database is only written by the main process.
+"""
+import __future__
+
+import os
+import glob
+import sqlite3
+
+import autogrow.docking.ranking.population_store as PopulationStore
+import autogrow.docking.ranking.ranking_mol as Ranking
+
+RUN_DATABASE_NAME = "run_database.sqlite"
+
+CREATE_TABLES = [
+    """CREATE TABLE IF NOT EXISTS generations (
+        generation INTEGER PRIMARY KEY,
+        completed INTEGER NOT NULL DEFAULT 0,
+        ranked_file TEXT,
+        num_ranked INTEGER,
+        stage TEXT,
+        scoring TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS ligands (
+        generation INTEGER NOT NULL,
+        smiles TEXT NOT NULL,
+        lig_id TEXT NOT NULL,
+        parents TEXT,
+        origin TEXT,
+        reaction TEXT,
+        status TEXT
+    )""",
+    """CREATE TABLE IF NOT EXISTS ranked (
+        generation INTEGER NOT NULL,
+        rank INTEGER NOT NULL,
+        smiles TEXT NOT NULL,
+        lig_id TEXT NOT NULL,
+        score REAL,
+        diversity REAL,
+        ranked_info TEXT NOT NULL,
+        unadjusted_score REAL
+    )""",
+    """CREATE TABLE IF NOT EXISTS timings (
+        generation INTEGER NOT NULL,
+        stage TEXT NOT NULL,
+        seconds REAL,
+        PRIMARY KEY (generation, stage)
+    )""",
+    "CREATE INDEX IF NOT EXISTS ligands_generation ON ligands (generation, lig_id)",
+    "CREATE INDEX IF NOT EXISTS ligands_smiles ON ligands (smiles)",
+    "CREATE INDEX IF NOT EXISTS ranked_generation ON ranked (generation, rank)",
+    "CREATE INDEX IF NOT EXISTS ranked_ligand ON ranked (generation, smiles, lig_id)",
+    "CREATE INDEX IF NOT EXISTS ranked_smiles ON ranked (smiles)",
+]
+# Columns added after the tables were first made. They are added to the
+# tables of a database made by an earlier version.
+ADDED_COLUMNS = [
+    ("generations", "stage", "TEXT"),
+    ("generations", "scoring", "TEXT"),
+    ("ranked", "unadjusted_score", "REAL"),
+]
+
+
+def get_run_database_path(output_directory):
+    """
+    Get the path to the run database of a Run folder.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+
+    Returns:
+    :returns: str database_path: the path to run_database.sqlite
+    """
+
+    return os.path.abspath(output_directory.replace('"', "")) + os.sep + RUN_DATABASE_NAME
+
+
+def connect(output_directory):
+    """
+    Open the run database of a Run folder, making its tables if needed.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+
+    Returns:
+    :returns: sqlite3.Connection connection: a connection to the database
+    """
+
+    connection = sqlite3.connect(get_run_database_path(output_directory), timeout=60)
+    for statement in CREATE_TABLES:
+        connection.execute(statement)
+    for table, column, column_type in ADDED_COLUMNS:
+        existing_columns = [
+            x[1] for x in connection.execute("PRAGMA table_info({})".format(table))
+        ]
+        if column not in existing_columns:
+            connection.execute(
+                "ALTER TABLE {} ADD COLUMN {} {}".format(table, column, column_type)
+            )
+    connection.commit()
+
+    return connection
+
+
+def get_ligand_origin(lig_id, generation_num):
+    """
+    Work out how a ligand was made from its ID. Mutants are named
+    "(parents)Gen_N_Mutant_REACTION_NUMBER" and crossovers are named
+    "(parents)Gen_N_Cross_NUMBER". Ligands with any other ID are source
+    compounds in generation 0 and elites passed through from an earlier
+    generation otherwise.
+
+    Inputs:
+    :param str lig_id: the full ID of a ligand
+    :param int generation_num: the generation the ligand is in
+
+    Returns:
+    :returns: str origin: "mutation", "crossover", "elite" or "source"
+    :returns: str reaction: the reaction number of a mutant. None otherwise
+    """
+
+    own_id = lig_id.split(")")[-1]
+    prefix = "Gen_{}_".format(generation_num)
+    if own_id.startswith(prefix + "Mutant_"):
+        return "mutation", own_id[len(prefix + "Mutant_") :].split("_")[0]
+    if own_id.startswith(prefix + "Cross_"):
+        return "crossover", None
+    if generation_num == 0:
+        return "source", None
+
+    return "elite", None
+
+
+def get_short_name(lig_id):
+    """
+    Get the short name of a ligand (its own ID without its parents). This is
+    the name its PDB files are given and the name the conversion and docking
+    report failures by.
+
+    Inputs:
+    :param str lig_id: the full ID of a ligand
+
+    Returns:
+    :returns: str short_name: the short name of the ligand
+    """
+
+    return lig_id.split(")")[-1]
+
+
+def get_scoring_name(vars):
+    """
+    Get the name of the scoring function used to rank ligands.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+
+    Returns:
+    :returns: str scoring: the scoring_choice, with "+LigEfficiency" added if
+        the scores are rescored by ligand efficiency
+    """
+
+    scoring = str(vars["scoring_choice"])
+    if vars["rescore_lig_efficiency"] is True:
+        scoring = scoring + "+LigEfficiency"
+
+    return scoring
+
+
+def set_generation_stage(connection, generation_num, stage):
+    """
+    Record the last stage a generation finished.
+
+    Inputs:
+    :param sqlite3.Connection connection: a connection to the database
+    :param int generation_num: the generation number
+    :param str stage: the stage. ie. "populated"
+    """
+
+    connection.execute(
+        "UPDATE generations SET stage = ? WHERE generation = ?",
+        (stage, generation_num),
+    )
+
+
+def record_timings(connection, generation_num, timings):
+    """
+    Record how long stages of a generation took. The timing of a stage which
+    was already recorded is replaced.
+
+    Inputs:
+    :param sqlite3.Connection connection: a connection to the database
+    :param int generation_num: the generation number
+    :param dict timings: the number of seconds each stage took. ie.
+        {"populate": 12.1, "docking": 300.2}
+    """
+
+    connection.executemany(
+        "INSERT OR REPLACE INTO timings VALUES (?, ?, ?)",
+        [(generation_num, stage, timings[stage]) for stage in timings.keys()],
+    )
+
+
+def start_generation(vars, generation_num):
+    """
+    Record that a generation has started. Any earlier record of the
+    generation (ie. from a failed attempt) is replaced.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param int generation_num: the generation number
+    """
+
+    connection = connect(vars["output_directory"])
+    try:
+        with connection:
+            for table in ["generations", "ligands", "ranked", "timings"]:
+                connection.execute(
+                    "DELETE FROM {} WHERE generation = ?".format(table),
+                    (generation_num,),
+                )
+            connection.execute(
+                "INSERT INTO generations (generation, completed, stage, scoring) "
+                + "VALUES (?, 0, ?, ?)",
+                (generation_num, "started", get_scoring_name(vars)),
+            )
+    finally:
+        connection.close()
+
+
+def record_populated_ligands(vars, generation_num, ligand_list, seconds):
+    """
+    Record every ligand made for a generation, with the status "populated".
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param int generation_num: the generation number
+    :param list ligand_list: every ligand made for the generation. Each is a
+        list starting with its SMILES and ID
+    :param float seconds: the number of seconds populating the generation
+        (including the 3D conversion) took
+    """
+
+    ligand_rows = []
+    for ligand_info in ligand_list:
+        smiles = str(ligand_info[0])
+        lig_id = str(ligand_info[1])
+        origin, reaction = get_ligand_origin(lig_id, generation_num)
+        ligand_rows.append(
+            (
+                generation_num,
+                smiles,
+                lig_id,
+                PopulationStore.get_parent_ids(lig_id),
+                origin,
+                reaction,
+                "populated",
+            )
+        )
+
+    connection = connect(vars["output_directory"])
+    try:
+        with connection:
+            connection.execute(
+                "DELETE FROM ligands WHERE generation = ?", (generation_num,)
+            )
+            connection.executemany(
+                "INSERT INTO ligands VALUES (?, ?, ?, ?, ?, ?, ?)", ligand_rows
+            )
+            record_timings(connection, generation_num, {"populate": seconds})
+            set_generation_stage(connection, generation_num, "populated")
+    finally:
+        connection.close()
+
+
+def record_docked_ligands(vars, generation_num, pdb_folder, failed_to_convert,
+                          failed_to_dock, seconds):
+    """
+    Update the status of a generation's ligands once they have been converted
+    to the docking format and docked. Ligands with no PDB file never made it
+    through the 3D conversion.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param int generation_num: the generation number
+    :param str pdb_folder: the generation's PDBs folder
+    :param list failed_to_convert: the short names of the ligands which
+        failed to convert to the docking format
+    :param list failed_to_dock: the short names of the ligands which failed to
+        dock
+    :param float seconds: the number of seconds converting and docking took
+    """
+
+    pdb_short_names = set(
+        [
+            os.path.basename(x).split("__")[0]
+            for x in glob.glob(pdb_folder + "*.pdb")
+        ]
+    )
+    failed_to_convert = set(failed_to_convert)
+    failed_to_dock = set(failed_to_dock)
+
+    connection = connect(vars["output_directory"])
+    try:
+        with connection:
+            updates = []
+            for row_id, lig_id in connection.execute(
+                    "SELECT rowid, lig_id FROM ligands WHERE generation = ? "
+                    + "AND status = ?",
+                    (generation_num, "populated"),
+            ).fetchall():
+                short_name = get_short_name(lig_id)
+                if short_name in failed_to_convert:
+                    status = "failed_pdbqt_conversion"
+                elif short_name in failed_to_dock:
+                    status = "failed_docking"
+                elif short_name in pdb_short_names:
+                    status = "docked"
+                else:
+                    status = "failed_3d_conversion"
+                updates.append((status, row_id))
+
+            connection.executemany(
+                "UPDATE ligands SET status = ? WHERE rowid = ?", updates
+            )
+            record_timings(connection, generation_num, {"convert_and_dock": seconds})
+            set_generation_stage(connection, generation_num, "docked")
+    finally:
+        connection.close()
+
+
+def record_generation(vars, generation_num, ligand_list, ranked_file, timings):
+    """
+    Record a finished generation in the run database. The ligands which were
+    ranked get the status "ranked". Docked ligands which weren't ranked failed
+    to be scored (or rescored). Ligands which were never recorded by
+    record_populated_ligands() (ie. if the generation was resumed) are added.
+
+    Inputs:
+    :param dict vars: User variables which will govern how the programs runs
+    :param int generation_num: the generation number
+    :param list ligand_list: every ligand made for the generation. Each is a
+        list starting with its SMILES and ID
+    :param str ranked_file: the path to the generation's ranked .smi file
+    :param dict timings: the number of seconds each stage took. ie.
+        {"populate": 12.1, "docking": 300.2}
+    """
+
+    ranked_list = []
+    if ranked_file is not None and os.path.exists(ranked_file) is True:
+        ranked_list = Ranking.get_ranked_usable_format(ranked_file)
+
+    ranked_keys = set([(x[0], x[1]) for x in ranked_list if len(x) > 1])
+
+    # With ligand efficiency rescoring the score before rescoring is the
+    # field before the fitness score
+    has_unadjusted_score = vars["rescore_lig_efficiency"] is True
+
+    ranked_rows = []
+    for rank, ligand_info in enumerate(ranked_list):
+        if len(ligand_info) < 2:
+            continue
+        unadjusted_score = None
+        if has_unadjusted_score is True and len(ligand_info) > 4:
+            unadjusted_score = PopulationStore.get_float(ligand_info[-3])
+        ranked_rows.append(
+            (
+                generation_num,
+                rank,
+                ligand_info[0],
+                ligand_info[1],
+                PopulationStore.get_float(ligand_info[-2]),
+                PopulationStore.get_float(ligand_info[-1]),
+                "\t".join(ligand_info),
+                unadjusted_score,
+            )
+        )
+
+    connection = connect(vars["output_directory"])
+    try:
+        with connection:
+            recorded_status = {}
+            for smiles, lig_id, status in connection.execute(
+                    "SELECT smiles, lig_id, status FROM ligands WHERE generation = ?",
+                    (generation_num,),
+            ):
+                recorded_status[(smiles, lig_id)] = status
+
+            ligand_rows = []
+            for ligand_info in ligand_list:
+                smiles = str(ligand_info[0])
+                lig_id = str(ligand_info[1])
+                origin, reaction = get_ligand_origin(lig_id, generation_num)
+                status = recorded_status.get((smiles, lig_id))
+                if (smiles, lig_id) in ranked_keys:
+                    status = "ranked"
+                elif status == "docked":
+                    status = "failed_scoring"
+                elif status is None or status == "populated":
+                    status = "failed"
+                ligand_rows.append(
+                    (
+                        generation_num,
+                        smiles,
+                        lig_id,
+                        PopulationStore.get_parent_ids(lig_id),
+                        origin,
+                        reaction,
+                        status,
+                    )
+                )
+
+            for table in ["ligands", "ranked"]:
+                connection.execute(
+                    "DELETE FROM {} WHERE generation = ?".format(table),
+                    (generation_num,),
+                )
+            connection.executemany(
+                "INSERT INTO ligands VALUES (?, ?, ?, ?, ?, ?, ?)", ligand_rows
+            )
+            connection.executemany(
+                "INSERT INTO ranked VALUES (?, ?, ?, ?, ?, ?, ?, ?)", ranked_rows
+            )
+            record_timings(connection, generation_num, timings)
+            connection.execute(
+                "INSERT OR REPLACE INTO generations VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    generation_num,
+                    1,
+                    ranked_file,
+                    len(ranked_rows),
+                    "completed",
+                    get_scoring_name(vars),
+                ),
+            )
+    finally:
+        connection.close()
+
+
+def get_generation_stage(output_directory, generation_num):
+    """
+    Get the last stage the run database recorded for a generation.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+    :param int generation_num: the generation number
+
+    Returns:
+    :returns: str stage: "started", "populated", "docked" or "completed".
+        None if there is no run database or it has no record of the
+        generation.
+    """
+
+    if os.path.exists(get_run_database_path(output_directory)) is False:
+        return None
+
+    connection = connect(output_directory)
+    try:
+        row = connection.execute(
+            "SELECT stage, completed FROM generations WHERE generation = ?",
+            (generation_num,),
+        ).fetchone()
+    finally:
+        connection.close()
+
+    if row is None:
+        return None
+    if row[1] == 1:
+        return "completed"
+
+    return row[0]
+
+
+def get_last_completed_generation(output_directory):
+    """
+    Get the last generation the run database has recorded as completed.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+
+    Returns:
+    :returns: int last_generation: the last completed generation. None if
+        there is no run database or no completed generation.
+    """
+
+    if os.path.exists(get_run_database_path(output_directory)) is False:
+        return None
+
+    connection = connect(output_directory)
+    try:
+        row = connection.execute(
+            "SELECT MAX(generation) FROM generations WHERE completed = 1"
+        ).fetchone()
+    finally:
+        connection.close()
+
+    return row[0]
+
+
+def is_generation_recorded(output_directory, generation_num):
+    """
+    Check if the run database has a completed record of a generation.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+    :param int generation_num: the generation number
+
+    Returns:
+    :returns: bool is_recorded: True if the generation is recorded as
+        completed. False if not or if there is no run database.
+    """
+
+    if os.path.exists(get_run_database_path(output_directory)) is False:
+        return False
+
+    connection = connect(output_directory)
+    try:
+        row = connection.execute(
+            "SELECT completed FROM generations WHERE generation = ?",
+            (generation_num,),
+        ).fetchone()
+    finally:
+        connection.close()
+
+    return row is not None and row[0] == 1
+
+
+def get_ranked_ligands(output_directory, generation_num, ligand_keys):
+    """
+    Get the lines of a generation's ranked .smi file for a set of ligands.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+    :param int generation_num: the generation number
+    :param list ligand_keys: a list of [SMILES, ID] of the ligands to get
+
+    Returns:
+    :returns: list ranked_ligands: the ranked .smi lines (as lists of fields)
+        of the ligands, in the order of the ranked file. Ligands which are
+        listed more than once are all returned.
+    """
+
+    connection = connect(output_directory)
+    ranked_ligands = []
+    try:
+        for smiles, lig_id in ligand_keys:
+            for row in connection.execute(
+                    "SELECT rank, ranked_info FROM ranked WHERE generation = ? "
+                    + "AND smiles = ? AND lig_id = ? ORDER BY rank",
+                    (generation_num, smiles, lig_id),
+            ):
+                ranked_ligands.append(row)
+    finally:
+        connection.close()
+
+    ranked_ligands.sort(key=lambda x: x[0])
+
+    return [x[1].split("\t") for x in ranked_ligands]
+
+
+def get_scores_per_generation(output_directory):
+    """
+    Get the fitness score of every ranked ligand of every completed
+    generation, in the order of the ranked .smi files.
+
+    Inputs:
+    :param str output_directory: the path of the Run folder
+
+    Returns:
+    :returns: dict scores_per_gen: the list of scores of each generation
+        keyed by "generation_N"
+    """
+
+    connection = connect(output_directory)
+    scores_per_gen = {}
+    try:
+        for generation_num, score in connection.execute(
+                "SELECT ranked.generation, ranked.score FROM ranked "
+                + "JOIN generations ON ranked.generation = generations.generation "
+                + "WHERE generations.completed = 1 "
+                + "ORDER BY ranked.generation, ranked.rank"
+        ):
+            gen_name = "generation_{}".format(generation_num)
+            if gen_name not in scores_per_gen.keys():
+                scores_per_gen[gen_name] = []
+            scores_per_gen[gen_name].append(score)
+    finally:
+        connection.close()
+
+    return scores_per_gen
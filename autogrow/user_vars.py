@@ -131,7 +131,9 @@ def multiprocess_handling(vars):
         )
 
         vars["parallelizer"] = Parallelizer(
-            vars["multithread_mode"], vars["number_of_processors"]
+            vars["multithread_mode"],
+            vars["number_of_processors"],
+            dynamic_scheduling=vars["mpi_dynamic_scheduling"],
         )
 
         if vars["parallelizer"] is None:
@@ -150,6 +152,10 @@ def multiprocess_handling(vars):
             vars["multithread_mode"], vars["number_of_processors"], True
         )
 
+        # Start the worker processes once so every call to
+        # vars["parallelizer"].run() reuses them for the rest of the run
+        vars["parallelizer"].start_pool()
+
     return vars
 
 def test_docking_executables(vars, vina_exe, qvina2_exe):
@@ -702,6 +708,8 @@ def define_defaults():
     # processors
     vars["number_of_processors"] = 1
     vars["multithread_mode"] = "multithreading"
+    vars["mpi_dynamic_scheduling"] = False
+    vars["streaming_pipeline"] = False
 
     # Genetic Algorithm Components
     vars["selector_choice"] = "Roulette_Selector"
@@ -712,6 +720,7 @@ def define_defaults():
     vars["top_mols_to_seed_next_generation"] = 10
     vars["diversity_mols_to_seed_first_generation"] = 10
     vars["diversity_seed_depreciation_per_gen"] = 2
+    vars["diversity_sample_size"] = 0
 
     # Populations settings
     vars["filter_source_compounds"] = True
@@ -737,6 +746,9 @@ def define_defaults():
     vars["BRENKFilter"] = False
     vars["No_Filters"] = False
     vars["alternative_filter"] = None
+    vars["filter_batch_size"] = 0
+    vars["filter_cache_size"] = 100000
+    vars["use_filter_cache_file"] = False
 
     # docking
     vars["dock_choice"] = "QuickVina2Docking"
@@ -745,10 +757,13 @@ def define_defaults():
     vars["docking_num_modes"] = None
     vars["docking_timeout_limit"] = 120
     vars["custom_docking_script"] = ""
+    vars["use_docking_cache"] = False
+    vars["docking_cache_directory"] = ""
 
     # scoring
     vars["scoring_choice"] = "VINA"
     vars["rescore_lig_efficiency"] = False
+    vars["nn2_vina_terms"] = "VinaScoreOnly"
     vars["custom_scoring_script"] = ""
 
     # gypsum # max variance is the number of conformers made per ligand
@@ -763,6 +778,8 @@ def define_defaults():
     vars["debug_mode"] = False
     vars["reduce_files_sizes"] = False
     vars["generate_plot"] = True
+    vars["use_run_database"] = False
+    vars["resume_partial_generation"] = False
     # Check Bash Timeout function (There's a difference between MacOS and linux)
     # Linux uses timeout while MacOS uses gtimeout
     timeout_option = determine_bash_timeout_vs_gtimeout()